@@ -0,0 +1,174 @@
+"""
+Admission control for the analysis pipelines.
+
+Two layers:
+- PipelineAdmission bounds how many cv/interview pipelines run at once and how many may
+  wait for a slot; anything beyond that is rejected so the API can answer 429.
+- StageLimiter caps concurrent CPU work (document parsing) and I/O work (OpenAI, GraphQL,
+  downloads) inside the pipelines, which run on threadpool threads.
+"""
+
+import os
+import time
+import asyncio
+import threading
+from contextlib import contextmanager, asynccontextmanager
+from functools import wraps
+from typing import Dict, Any, Callable
+
+ADMISSION_MAX_PIPELINES = int(os.environ.get("ADMISSION_MAX_PIPELINES", "8"))
+ADMISSION_MAX_QUEUE = int(os.environ.get("ADMISSION_MAX_QUEUE", "32"))
+ADMISSION_CPU_CONCURRENCY = int(os.environ.get("ADMISSION_CPU_CONCURRENCY", str(os.cpu_count() or 2)))
+ADMISSION_IO_CONCURRENCY = int(os.environ.get("ADMISSION_IO_CONCURRENCY", "16"))
+ADMISSION_RETRY_AFTER_SECONDS = int(os.environ.get("ADMISSION_RETRY_AFTER_SECONDS", "10"))
+
+
+class AdmissionRejected(Exception):
+    """Raised when the pipeline queue is full"""
+
+    def __init__(self, retry_after: int, queue_depth: int):
+        self.retry_after = retry_after
+        self.queue_depth = queue_depth
+        super().__init__(f"Analysis queue full ({queue_depth} waiting), retry after {retry_after}s")
+
+
+class WaitStats:
+    """Running wait-time statistics for a queue"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "wait_count": self.count,
+            "wait_avg_seconds": round(self.total / self.count, 4) if self.count else 0.0,
+            "wait_max_seconds": round(self.max, 4),
+        }
+
+
+class PipelineAdmission:
+    """Bounded admission queue in front of the analysis pipelines (event-loop side)"""
+
+    def __init__(self, max_active: int, max_queue: int, retry_after: int):
+        self.max_active = max_active
+        self.max_queue = max_queue
+        self.default_retry_after = retry_after
+        self._semaphore = asyncio.Semaphore(max_active)
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.completed = 0
+        self._run_seconds_total = 0.0
+        self._wait = WaitStats()
+
+    def _retry_after(self) -> int:
+        """Estimate when a slot frees up from the average pipeline duration"""
+        if not self.completed:
+            return self.default_retry_after
+        avg_run = self._run_seconds_total / self.completed
+        batches_ahead = (self.waiting + self.max_active) / self.max_active
+        return max(1, int(avg_run * batches_ahead))
+
+    @asynccontextmanager
+    async def admit(self):
+        if self.active >= self.max_active and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise AdmissionRejected(self._retry_after(), self.waiting)
+
+        queued_at = time.monotonic()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self._wait.record(time.monotonic() - queued_at)
+
+        self.active += 1
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.completed += 1
+            self._run_seconds_total += time.monotonic() - started_at
+            self._semaphore.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "max_active": self.max_active,
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            **self._wait.snapshot(),
+        }
+
+
+class StageLimiter:
+    """Thread-side concurrency cap for one class of pipeline work"""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.waiting = 0
+        self._wait = WaitStats()
+
+    @contextmanager
+    def slot(self):
+        queued_at = time.monotonic()
+        with self._lock:
+            self.waiting += 1
+        self._semaphore.acquire()
+        with self._lock:
+            self.waiting -= 1
+            self.active += 1
+            self._wait.record(time.monotonic() - queued_at)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+            self._semaphore.release()
+
+    def wrap(self, func: Callable) -> Callable:
+        """Run a whole graph node inside one slot"""
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.slot():
+                return func(*args, **kwargs)
+        return wrapper
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "active": self.active,
+                "queue_depth": self.waiting,
+                "limit": self.limit,
+                **self._wait.snapshot(),
+            }
+
+
+pipeline_admission = PipelineAdmission(
+    ADMISSION_MAX_PIPELINES, ADMISSION_MAX_QUEUE, ADMISSION_RETRY_AFTER_SECONDS
+)
+cpu_limiter = StageLimiter("cpu", ADMISSION_CPU_CONCURRENCY)
+io_limiter = StageLimiter("io", ADMISSION_IO_CONCURRENCY)
+
+
+def get_admission_stats() -> Dict[str, Any]:
+    return {
+        "pipelines": pipeline_admission.snapshot(),
+        "cpu": cpu_limiter.snapshot(),
+        "io": io_limiter.snapshot(),
+    }
@@ -1,5 +1,6 @@
 from langgraph.graph import StateGraph
 from .state import CVState
+from admission import io_limiter
 
 # import node implementations
 from .nodes.download_cv import download_cv
@@ -13,12 +14,14 @@ from .nodes.post_results import post_results_node
 # Build StateGraph pipeline
 graph = StateGraph(CVState)
 
-graph.add_node("download_cv", download_cv)
+# I/O-bound nodes hold an io slot for their duration; extract_info takes a cpu slot
+# for parsing, and LLM calls take an io slot per attempt inside the scheduler
+graph.add_node("download_cv", io_limiter.wrap(download_cv))
 graph.add_node("extract_info", extract_info)
-graph.add_node("fetch_job", fetch_job_node)
-graph.add_node("fetch_application", fetch_application_node)
+graph.add_node("fetch_job", io_limiter.wrap(fetch_job_node))
+graph.add_node("fetch_application", io_limiter.wrap(fetch_application_node))
 graph.add_node("analyze", analyze_node)
-graph.add_node("post_results", post_results_node)
+graph.add_node("post_results", io_limiter.wrap(post_results_node))
 
 # Connect nodes in sequence
 graph.add_edge("download_cv", "extract_info")
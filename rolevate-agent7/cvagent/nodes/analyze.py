@@ -1,7 +1,6 @@
 from typing import Dict
-import os
 import json
-from openai import OpenAI
+from llm_scheduler import llm_scheduler
 
 
 def analyze_node(state: Dict) -> Dict:
@@ -44,10 +43,9 @@ Provide your analysis in JSON format with the following structure:
 }}"""
     
     try:
-        # Initialize OpenAI client inside function to ensure env vars are loaded
-        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-        
-        response = client.chat.completions.create(
+        # Scheduled call: queued against the shared rate-limit budget and retried with backoff
+        response = llm_scheduler.chat_completion(
+            priority=state.get("priority", "interactive"),
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "You are an expert HR analyst providing structured CV assessments."},
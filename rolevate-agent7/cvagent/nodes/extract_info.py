@@ -1,22 +1,21 @@
 from ..tools.parser_tool import extract_text_auto
 from typing import Dict, List, Any, Optional
 import re
-import os
 import json
-from openai import OpenAI
+from admission import cpu_limiter
+from llm_scheduler import llm_scheduler
 
 
 def extract_info(state: Dict) -> Dict:
     local_path = state.get("local_path")
     if not local_path:
         return state
-    text = extract_text_auto(local_path)
+    with cpu_limiter.slot():
+        text = extract_text_auto(local_path)
     state["raw_text"] = text
     
     # Use OpenAI to extract structured information from CV
     try:
-        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-        
         extraction_prompt = f"""Extract the following information from this CV/Resume text. Return ONLY a valid JSON object with these exact fields:
 
 {{
@@ -66,7 +65,8 @@ IMPORTANT RULES:
 CV Text:
 {text[:8000]}"""
 
-        response = client.chat.completions.create(
+        response = llm_scheduler.chat_completion(
+            priority=state.get("priority", "interactive"),
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "You are an expert at extracting structured information from CVs. Always return valid JSON with structured arrays for experience and education when possible."},
@@ -7,6 +7,7 @@ class CVState(TypedDict, total=False):
     candidateid: str
     system_api_key: Optional[str]
     callback_url: Optional[str]
+    priority: str  # "interactive" or "batch" - ordering in the LLM scheduler
     local_path: str
     raw_text: str
     extracted: Dict[str, str]
@@ -8,11 +8,14 @@ GRAPHQL_API_URL = os.environ.get("GRAPHQL_API_URL", "http://localhost:4005/api/g
 SYSTEM_API_KEY = os.environ.get("SYSTEM_API_KEY", "")
 
 
-def get_client(api_key: Optional[str] = None):
+def get_client(api_key: Optional[str] = None, idempotency_key: Optional[str] = None):
     """Create a new client with auth headers for each request"""
     # Use provided api_key, fallback to environment variable
     key = api_key or SYSTEM_API_KEY
     headers = {"x-api-key": key}
+    if idempotency_key:
+        # Lets the backend drop replays of a write the result queue already delivered
+        headers["Idempotency-Key"] = idempotency_key
     transport = RequestsHTTPTransport(
         url=GRAPHQL_API_URL, 
         verify=True, 
@@ -64,7 +67,7 @@ def fetch_application(application_id: str, api_key: Optional[str] = None) -> Opt
         return None
 
 
-def post_cv_analysis(candidateid: str, application_id: str, analysis: Dict, resume_url: str, job_id: str, extracted: Dict = None, api_key: Optional[str] = None) -> Optional[Dict]:
+def post_cv_analysis(candidateid: str, application_id: str, analysis: Dict, resume_url: str, job_id: str, extracted: Dict = None, api_key: Optional[str] = None, idempotency_key: Optional[str] = None) -> Optional[Dict]:
     """Post CV analysis results back to NestJS using updateApplicationAnalysis mutation"""
     
     mutation = gql(
@@ -194,7 +197,7 @@ def post_cv_analysis(candidateid: str, application_id: str, analysis: Dict, resu
                 print(f"   Skills: {len(candidate_info.get('skills', []))} skills")
 
         
-        client = get_client(api_key)
+        client = get_client(api_key, idempotency_key)
         print(f"📤 Posting CV analysis results to NestJS GraphQL...")
         res = client.execute(mutation, variable_values={"input": input_data})
         print(f"✅ Application analysis updated successfully")
@@ -206,7 +209,7 @@ def post_cv_analysis(candidateid: str, application_id: str, analysis: Dict, resu
         return None
 
 
-def update_application_status(application_id: str, status: str, api_key: Optional[str] = None) -> Optional[Dict]:
+def update_application_status(application_id: str, status: str, api_key: Optional[str] = None, idempotency_key: Optional[str] = None) -> Optional[Dict]:
     """Update the application status after analysis is complete
     
     Valid status values: PENDING, ANALYZED, REVIEWED, SHORTLISTED, INTERVIEWED, OFFERED, HIRED, REJECTED, WITHDRAWN
@@ -224,7 +227,7 @@ def update_application_status(application_id: str, status: str, api_key: Optiona
     )
     
     try:
-        client = get_client(api_key)
+        client = get_client(api_key, idempotency_key)
         print(f"🔄 Updating application {application_id} status to: {status}")
         res = client.execute(
             mutation, 
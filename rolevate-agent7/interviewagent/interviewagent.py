@@ -1,5 +1,6 @@
 from langgraph.graph import StateGraph
 from .state import InterviewState
+from admission import io_limiter
 
 # Import node implementations
 from .nodes.fetch_interview import fetch_interview_node
@@ -12,12 +13,12 @@ from .nodes.post_results import post_results_node
 # Build StateGraph pipeline for interview analysis
 graph = StateGraph(InterviewState)
 
-# Add nodes
-graph.add_node("fetch_interview", fetch_interview_node)
-graph.add_node("extract_transcript", extract_transcript_node)
-graph.add_node("fetch_context", fetch_context_node)
+# Add nodes - GraphQL stages hold an io slot; LLM calls take one per attempt in the scheduler
+graph.add_node("fetch_interview", io_limiter.wrap(fetch_interview_node))
+graph.add_node("extract_transcript", io_limiter.wrap(extract_transcript_node))
+graph.add_node("fetch_context", io_limiter.wrap(fetch_context_node))
 graph.add_node("analyze_performance", analyze_performance_node)
-graph.add_node("post_results", post_results_node)
+graph.add_node("post_results", io_limiter.wrap(post_results_node))
 
 # Connect nodes in sequence
 graph.add_edge("fetch_interview", "extract_transcript")
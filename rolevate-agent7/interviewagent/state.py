@@ -7,6 +7,8 @@ class InterviewState(TypedDict, total=False):
     job_id: Optional[str]
     system_api_key: Optional[str]
     callback_url: Optional[str]
+    force_refresh: bool  # Skip the analysis cache and re-score
+    priority: str  # "interactive" or "batch" - ordering in the LLM scheduler
     
     # Interview data
     interview_info: Dict[str, Any]
@@ -17,6 +19,7 @@ class InterviewState(TypedDict, total=False):
     analysis: Dict[str, Any]
     performance_scores: Dict[str, float]
     feedback: Dict[str, Any]
+    analysis_cached: bool
     
     # Additional context
     job_info: Dict[str, Any]
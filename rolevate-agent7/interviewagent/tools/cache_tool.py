@@ -0,0 +1,185 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from typing import Dict, Optional, Any
+
+# SQLite file shared by every worker process on the host (WAL allows concurrent readers)
+ANALYSIS_CACHE_PATH = os.environ.get("ANALYSIS_CACHE_PATH", "/tmp/rolevate_analysis_cache.db")
+ANALYSIS_CACHE_TTL_SECONDS = int(os.environ.get("ANALYSIS_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.environ.get("ANALYSIS_CACHE_MAX_ENTRIES", "5000"))
+
+STAT_NAMES = ("hits", "misses", "stores", "forced_refreshes", "evictions_expired", "evictions_capacity")
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a connection to the cache database, creating tables on first use"""
+    conn = sqlite3.connect(ANALYSIS_CACHE_PATH, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS analysis_cache (
+            cache_key TEXT PRIMARY KEY,
+            analysis TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            last_hit_at REAL NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS analysis_cache_stats (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    return conn
+
+
+def _bump(conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+    if amount <= 0:
+        return
+    conn.execute(
+        """
+        INSERT INTO analysis_cache_stats (name, value) VALUES (?, ?)
+        ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+        """,
+        (name, amount)
+    )
+
+
+def build_cache_key(prompt: str, raw_transcript: str, prompt_version: str, model: str) -> str:
+    """Hash everything that influences the scoring result into a stable cache key
+
+    The rendered prompt already carries the job requirements and candidate context;
+    the full transcript is hashed separately because the prompt only embeds a prefix.
+    """
+    digest = hashlib.sha256()
+    for part in (prompt_version, model, prompt, raw_transcript):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def get_cached_analysis(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached analysis for the key, or None on a miss or expired entry"""
+    try:
+        conn = _connect()
+    except sqlite3.Error as e:
+        print(f"⚠️  Analysis cache unavailable: {e}")
+        return None
+
+    try:
+        with conn:
+            row = conn.execute(
+                "SELECT analysis, created_at FROM analysis_cache WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+            now = time.time()
+
+            if row and now - row[1] > ANALYSIS_CACHE_TTL_SECONDS:
+                conn.execute("DELETE FROM analysis_cache WHERE cache_key = ?", (cache_key,))
+                _bump(conn, "evictions_expired")
+                row = None
+
+            if not row:
+                _bump(conn, "misses")
+                return None
+
+            conn.execute(
+                "UPDATE analysis_cache SET last_hit_at = ? WHERE cache_key = ?",
+                (now, cache_key)
+            )
+            _bump(conn, "hits")
+            return json.loads(row[0])
+    except (sqlite3.Error, ValueError) as e:
+        print(f"⚠️  Analysis cache read error: {e}")
+        return None
+    finally:
+        conn.close()
+
+
+def store_cached_analysis(cache_key: str, analysis: Dict[str, Any]) -> None:
+    """Store an analysis result and evict the least recently used entries over capacity"""
+    try:
+        conn = _connect()
+    except sqlite3.Error as e:
+        print(f"⚠️  Analysis cache unavailable: {e}")
+        return
+
+    try:
+        with conn:
+            now = time.time()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO analysis_cache (cache_key, analysis, created_at, last_hit_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (cache_key, json.dumps(analysis), now, now)
+            )
+            _bump(conn, "stores")
+
+            expired = conn.execute(
+                "DELETE FROM analysis_cache WHERE created_at < ?",
+                (now - ANALYSIS_CACHE_TTL_SECONDS,)
+            ).rowcount
+            _bump(conn, "evictions_expired", expired)
+
+            overflow = conn.execute(
+                """
+                DELETE FROM analysis_cache WHERE cache_key IN (
+                    SELECT cache_key FROM analysis_cache
+                    ORDER BY last_hit_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (ANALYSIS_CACHE_MAX_ENTRIES,)
+            ).rowcount
+            _bump(conn, "evictions_capacity", overflow)
+    except sqlite3.Error as e:
+        print(f"⚠️  Analysis cache write error: {e}")
+    finally:
+        conn.close()
+
+
+def record_forced_refresh() -> None:
+    """Count a request that bypassed the cache on purpose"""
+    try:
+        conn = _connect()
+    except sqlite3.Error:
+        return
+    try:
+        with conn:
+            _bump(conn, "forced_refreshes")
+    except sqlite3.Error:
+        pass
+    finally:
+        conn.close()
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Return cache size and hit/miss/eviction counters aggregated across processes"""
+    stats: Dict[str, Any] = {name: 0 for name in STAT_NAMES}
+    try:
+        conn = _connect()
+    except sqlite3.Error as e:
+        stats["error"] = str(e)
+        return stats
+
+    try:
+        for name, value in conn.execute("SELECT name, value FROM analysis_cache_stats"):
+            stats[name] = value
+        stats["entries"] = conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+    except sqlite3.Error as e:
+        stats["error"] = str(e)
+    finally:
+        conn.close()
+
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+    stats["max_entries"] = ANALYSIS_CACHE_MAX_ENTRIES
+    stats["ttl_seconds"] = ANALYSIS_CACHE_TTL_SECONDS
+    return stats
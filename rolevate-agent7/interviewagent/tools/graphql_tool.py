@@ -8,10 +8,13 @@ GRAPHQL_API_URL = os.environ.get("GRAPHQL_API_URL", "http://localhost:4005/api/g
 SYSTEM_API_KEY = os.environ.get("SYSTEM_API_KEY", "")
 
 
-def get_client(api_key: Optional[str] = None):
+def get_client(api_key: Optional[str] = None, idempotency_key: Optional[str] = None):
     """Create a new client with auth headers for each request"""
     key = api_key or SYSTEM_API_KEY
     headers = {"x-api-key": key}
+    if idempotency_key:
+        # Lets the backend drop replays of a write the result queue already delivered
+        headers["Idempotency-Key"] = idempotency_key
     transport = RequestsHTTPTransport(
         url=GRAPHQL_API_URL, 
         verify=True, 
@@ -94,7 +97,7 @@ def fetch_interview_transcripts(interview_id: str, api_key: Optional[str] = None
         return []
 
 
-def update_interview_analysis(interview_id: str, analysis: Dict[str, Any], api_key: Optional[str] = None) -> Optional[Dict]:
+def update_interview_analysis(interview_id: str, analysis: Dict[str, Any], api_key: Optional[str] = None, idempotency_key: Optional[str] = None) -> Optional[Dict]:
     """Post interview analysis results back to the backend"""
     
     mutation = gql(
@@ -148,7 +151,7 @@ def update_interview_analysis(interview_id: str, analysis: Dict[str, Any], api_k
             "aiAnalysis": analysis  # Store the full analysis as JSON
         }
         
-        client = get_client(api_key)
+        client = get_client(api_key, idempotency_key)
         print(f"📊 Posting interview analysis results to backend...")
         res = client.execute(mutation, variable_values={
             "id": interview_id,
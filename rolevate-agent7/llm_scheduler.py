@@ -0,0 +1,252 @@
+"""
+Shared OpenAI call scheduler.
+
+Every chat completion from the cv and interview pipelines goes through one scheduler per
+process. It keeps request and token buckets in sync with the x-ratelimit-* response
+headers, queues callers by priority (interactive before batch re-scoring) and retries
+rate-limit / transient failures with jittered exponential backoff. Each attempt holds an
+io stage slot only while the request is in flight, so callers backing off do not starve
+the other pipeline stages. Callers only see an exception - and fall back to their
+placeholder analysis - once the retry budget is spent.
+"""
+
+import os
+import re
+import time
+import heapq
+import random
+import itertools
+import threading
+from typing import Dict, Any, Optional
+
+import openai
+from openai import OpenAI
+
+from admission import io_limiter
+
+LLM_RPM_LIMIT = int(os.environ.get("LLM_RPM_LIMIT", "500"))
+LLM_TPM_LIMIT = int(os.environ.get("LLM_TPM_LIMIT", "200000"))
+LLM_MAX_RETRIES = int(os.environ.get("LLM_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE_SECONDS = float(os.environ.get("LLM_BACKOFF_BASE_SECONDS", "1"))
+LLM_BACKOFF_MAX_SECONDS = float(os.environ.get("LLM_BACKOFF_MAX_SECONDS", "30"))
+
+PRIORITIES = {"interactive": 0, "batch": 1}
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """Parse OpenAI reset durations such as '1s', '6m0s' or '20ms' into seconds"""
+    if not value:
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def estimate_tokens(messages, max_tokens: Optional[int] = None) -> int:
+    """Rough prompt + completion token estimate (~4 characters per token)"""
+    prompt_chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return prompt_chars // 4 + (max_tokens or 1000)
+
+
+class TokenBucket:
+    """Per-minute budget that refills continuously and can be resynced from headers"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.available = float(per_minute)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self.available = min(self.capacity, self.available + elapsed * self.capacity / 60.0)
+        self._updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) * 60.0 / self.capacity
+
+    def consume(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.available -= amount
+
+    def sync(self, limit: Optional[str], remaining: Optional[str], reset: Optional[str], now: float) -> bool:
+        """Apply rate-limit headers; returns whether the remaining budget was resynced"""
+        self._refill(now)
+        if limit and limit.isdigit():
+            self.capacity = float(limit)
+        if remaining and remaining.isdigit():
+            self.available = min(self.available, float(remaining))
+            reset_seconds = parse_reset_duration(reset)
+            if int(remaining) == 0 and reset_seconds:
+                self._blocked_until = max(self._blocked_until, now + reset_seconds)
+            return True
+        return False
+
+    def block_for(self, seconds: float, now: float) -> None:
+        self._blocked_until = max(self._blocked_until, now + seconds)
+
+
+class LLMScheduler:
+    """Priority queue in front of the OpenAI API with adaptive rate-limit budgeting"""
+
+    def __init__(self, rpm: int, tpm: int, max_retries: int, backoff_base: float, backoff_max: float):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._client: Optional[OpenAI] = None
+        self._condition = threading.Condition()
+        self._queue = []
+        self._sequence = itertools.count()
+        self.stats = {
+            "calls": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "exhausted": 0,
+            "queue_wait_seconds_total": 0.0,
+        }
+
+    def get_client(self) -> OpenAI:
+        """One client per process; retries are handled here, not inside the SDK"""
+        if self._client is None:
+            self._client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"), max_retries=0)
+        return self._client
+
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._condition:
+            self.stats[name] += amount
+
+    def _acquire(self, priority: str, estimated: int) -> None:
+        """Block until this caller is first in line and both budgets allow the call"""
+        entry = (PRIORITIES.get(priority, 0), next(self._sequence))
+        queued_at = time.monotonic()
+        with self._condition:
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    if self._queue[0] == entry:
+                        wait = max(
+                            self.requests.wait_time(1, now),
+                            self.tokens.wait_time(estimated, now),
+                        )
+                        if wait <= 0:
+                            self.requests.consume(1, now)
+                            self.tokens.consume(estimated, now)
+                            break
+                        self._condition.wait(timeout=wait)
+                    else:
+                        self._condition.wait()
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                self._condition.notify_all()
+        self._count("queue_wait_seconds_total", time.monotonic() - queued_at)
+
+    def _sync_headers(self, headers) -> bool:
+        """Resync both buckets; returns whether the token budget came from the headers"""
+        if not headers:
+            return False
+        now = time.monotonic()
+        with self._condition:
+            self.requests.sync(
+                headers.get("x-ratelimit-limit-requests"),
+                headers.get("x-ratelimit-remaining-requests"),
+                headers.get("x-ratelimit-reset-requests"),
+                now,
+            )
+            tokens_synced = self.tokens.sync(
+                headers.get("x-ratelimit-limit-tokens"),
+                headers.get("x-ratelimit-remaining-tokens"),
+                headers.get("x-ratelimit-reset-tokens"),
+                now,
+            )
+            self._condition.notify_all()
+        return tokens_synced
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        delay = random.uniform(delay / 2, delay)
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = parse_reset_duration(response.headers.get("retry-after"))
+            if retry_after:
+                delay = max(delay, retry_after)
+        return delay
+
+    def chat_completion(self, priority: str = "interactive", **kwargs):
+        """Schedule a chat.completions.create call and return the parsed response"""
+        estimated = estimate_tokens(kwargs.get("messages", []), kwargs.get("max_tokens"))
+        client = self.get_client()
+
+        for attempt in range(self.max_retries + 1):
+            self._acquire(priority, estimated)
+            self._count("calls")
+            try:
+                with io_limiter.slot():
+                    raw = client.chat.completions.with_raw_response.create(**kwargs)
+            except RETRYABLE_ERRORS as e:
+                response = getattr(e, "response", None)
+                self._sync_headers(response.headers if response is not None else None)
+                if isinstance(e, openai.RateLimitError):
+                    self._count("rate_limited")
+                if attempt >= self.max_retries:
+                    self._count("exhausted")
+                    raise
+                delay = self._backoff(attempt, e)
+                self._count("retries")
+                print(f"⏳ OpenAI {type(e).__name__}, retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+                with self._condition:
+                    if isinstance(e, openai.RateLimitError):
+                        # Hold everyone back, not just this caller
+                        self.requests.block_for(delay, time.monotonic())
+                time.sleep(delay)
+                continue
+
+            tokens_synced = self._sync_headers(raw.headers)
+            response = raw.parse()
+            usage = getattr(response, "usage", None)
+            # Headers already report what is left after this call; only correct the estimate without them
+            if not tokens_synced and usage is not None and usage.total_tokens:
+                with self._condition:
+                    self.tokens.consume(usage.total_tokens - estimated, time.monotonic())
+            return response
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._condition:
+            self.requests._refill(now)
+            self.tokens._refill(now)
+            return {
+                **self.stats,
+                "queue_depth": len(self._queue),
+                "requests_available": int(self.requests.available),
+                "requests_per_minute": int(self.requests.capacity),
+                "tokens_available": int(self.tokens.available),
+                "tokens_per_minute": int(self.tokens.capacity),
+            }
+
+
+llm_scheduler = LLMScheduler(
+    LLM_RPM_LIMIT, LLM_TPM_LIMIT, LLM_MAX_RETRIES, LLM_BACKOFF_BASE_SECONDS, LLM_BACKOFF_MAX_SECONDS
+)
@@ -1,15 +1,113 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Dict, Any, Callable, Tuple, Literal
 import os
+import time
+import asyncio
+from contextlib import asynccontextmanager
 from cvagent.cvagent import cv_agent
 from interviewagent.interviewagent import interview_agent
+from interviewagent.tools.cache_tool import get_cache_stats
+from admission import pipeline_admission, AdmissionRejected, get_admission_stats
+from llm_scheduler import llm_scheduler
+from result_queue import result_queue
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-app = FastAPI()
+# Repeat triggers inside this window get the previous result instead of a new run (0 disables)
+DEDUP_WINDOW_SECONDS = float(os.environ.get("ANALYSIS_DEDUP_WINDOW_SECONDS", "60"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Deliver results queued by this or a previous run (e.g. before a crash or outage)
+    result_queue.start()
+    yield
+    result_queue.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+class InFlightRegistry:
+    """Single-flight registry: concurrent triggers for the same key share one pipeline run"""
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._running: Dict[str, asyncio.Future] = {}
+        self._recent: Dict[str, Tuple[float, Any]] = {}
+        self.stats = {"started": 0, "joined_in_flight": 0, "served_recent": 0, "failed": 0}
+
+    def _prune(self, now: float) -> None:
+        expired = [k for k, (finished_at, _) in self._recent.items() if now - finished_at > self.window_seconds]
+        for key in expired:
+            del self._recent[key]
+
+    def _finish(self, key: str, future: asyncio.Future) -> None:
+        # A forced run may have replaced this one; only the current run owns the key
+        current = self._running.get(key) is future
+        if current:
+            del self._running[key]
+        if future.cancelled() or future.exception() is not None:
+            self.stats["failed"] += 1
+            return
+        if current and self.window_seconds > 0:
+            self._recent[key] = (time.monotonic(), future.result())
+
+    async def _execute(self, func: Callable[..., Any], *args) -> Any:
+        # Only new pipeline runs pass admission; joins and recent hits cost nothing
+        async with pipeline_admission.admit():
+            return await run_in_threadpool(func, *args)
+
+    async def run(self, key: str, func: Callable[..., Any], *args, force: bool = False) -> Any:
+        """
+        Run func(*args) in the threadpool unless the same key is running or finished recently.
+        force always starts a new run; later callers join that one.
+        """
+        self._prune(time.monotonic())
+
+        if not force and key in self._recent:
+            self.stats["served_recent"] += 1
+            print(f"♻️  Returning recent result for {key}")
+            return self._recent[key][1]
+
+        future = None if force else self._running.get(key)
+        if future is not None:
+            self.stats["joined_in_flight"] += 1
+            print(f"🔗 Attaching to in-flight analysis for {key}")
+        else:
+            self.stats["started"] += 1
+            future = asyncio.ensure_future(self._execute(func, *args))
+            self._running[key] = future
+            self._recent.pop(key, None)
+            future.add_done_callback(lambda f: self._finish(key, f))
+
+        # Shield so a disconnecting caller does not cancel the run other callers share
+        return await asyncio.shield(future)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "in_flight": len(self._running),
+            "recent": len(self._recent),
+            "window_seconds": self.window_seconds,
+        }
+
+
+analysis_registry = InFlightRegistry(DEDUP_WINDOW_SECONDS)
+
+
+def too_busy(error: AdmissionRejected) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(error), "queue_depth": error.queue_depth},
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
 
 class CVAnalysisRequest(BaseModel):
     cv_link: str
@@ -18,10 +116,13 @@ class CVAnalysisRequest(BaseModel):
     candidateid: str
     systemApiKey: Optional[str] = None
     callbackUrl: Optional[str] = None
+    priority: Literal["interactive", "batch"] = "interactive"
 
 class InterviewAnalysisRequest(BaseModel):
     interview_id: str
     systemApiKey: Optional[str] = None
+    forceRefresh: bool = False
+    priority: Literal["interactive", "batch"] = "interactive"
 
 @app.get("/")
 async def read_root():
@@ -30,23 +131,46 @@ async def read_root():
 @app.post("/cv-analysis")
 async def cv_analysis(request: CVAnalysisRequest):
     """Analyze CV against job requirements"""
-    result = cv_agent.invoke({
+    state = {
         "cv_link": request.cv_link,
         "jobid": request.jobid,
         "application_id": request.application_id,
         "candidateid": request.candidateid,
-        "system_api_key": request.systemApiKey,
+        "system_api_key": request.systemApiKey or os.environ.get("SYSTEM_API_KEY"),
         "callback_url": request.callbackUrl,
+        "priority": request.priority,
         "analysis": ""
-    })
-    return result
+    }
+    key = f"cv:{request.application_id}:{request.cv_link}"
+    try:
+        return await analysis_registry.run(key, cv_agent.invoke, state)
+    except AdmissionRejected as e:
+        return too_busy(e)
 
 @app.post("/interview-analysis")
 async def interview_analysis(request: InterviewAnalysisRequest):
     """Analyze interview performance and generate feedback"""
-    result = interview_agent.invoke({
+    state = {
         "interview_id": request.interview_id,
-        "system_api_key": request.systemApiKey or os.environ.get("SYSTEM_API_KEY")
-    })
-    return result
+        "system_api_key": request.systemApiKey or os.environ.get("SYSTEM_API_KEY"),
+        "force_refresh": request.forceRefresh,
+        "priority": request.priority
+    }
+    key = f"interview:{request.interview_id}"
+    try:
+        return await analysis_registry.run(
+            key, interview_agent.invoke, state, force=request.forceRefresh
+        )
+    except AdmissionRejected as e:
+        return too_busy(e)
 
+@app.get("/metrics")
+async def metrics():
+    """Expose analysis cache, de-duplication, admission, LLM scheduler and result queue counters"""
+    return {
+        "interview_analysis_cache": get_cache_stats(),
+        "analysis_dedup": analysis_registry.snapshot(),
+        "admission": get_admission_stats(),
+        "llm_scheduler": llm_scheduler.snapshot(),
+        "result_queue": result_queue.snapshot(),
+    }
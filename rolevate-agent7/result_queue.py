@@ -0,0 +1,323 @@
+"""
+Durable write-behind queue for posting analysis results to the backend.
+
+Pipelines write finished results into a local SQLite (WAL) queue and return immediately.
+A background flusher thread claims due items one at a time and posts them with the
+idempotency key attached, retrying with backoff until the backend accepts them. Items
+that exhaust their attempts are kept as 'dead'; enqueueing the same result again revives
+them. No credentials are stored: rows are posted with the service's SYSTEM_API_KEY.
+"""
+
+import os
+import json
+import time
+import uuid
+import random
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, Optional, Callable
+
+from cvagent.tools.graphql_tool import post_cv_analysis, update_application_status
+from interviewagent.tools.graphql_tool import update_interview_analysis
+
+SYSTEM_API_KEY = os.environ.get("SYSTEM_API_KEY", "")
+RESULT_QUEUE_PATH = os.environ.get("RESULT_QUEUE_PATH", "/tmp/rolevate_result_queue.db")
+# Most items posted per flush pass before the flusher checks for shutdown and cleans up
+RESULT_QUEUE_BATCH_SIZE = int(os.environ.get("RESULT_QUEUE_BATCH_SIZE", "20"))
+RESULT_QUEUE_POLL_SECONDS = float(os.environ.get("RESULT_QUEUE_POLL_SECONDS", "5"))
+RESULT_QUEUE_MAX_ATTEMPTS = int(os.environ.get("RESULT_QUEUE_MAX_ATTEMPTS", "20"))
+RESULT_QUEUE_BACKOFF_MAX_SECONDS = float(os.environ.get("RESULT_QUEUE_BACKOFF_MAX_SECONDS", "600"))
+RESULT_QUEUE_RETENTION_SECONDS = int(os.environ.get("RESULT_QUEUE_RETENTION_SECONDS", str(24 * 3600)))
+# Claims older than this belong to a flusher that died mid-post and are picked up again
+RESULT_QUEUE_CLAIM_TIMEOUT_SECONDS = int(os.environ.get("RESULT_QUEUE_CLAIM_TIMEOUT_SECONDS", "300"))
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(RESULT_QUEUE_PATH, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=FULL")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pending_results (
+            idempotency_key TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL,
+            claim_token TEXT,
+            claimed_at REAL,
+            last_error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS pending_results_due ON pending_results (status, next_attempt_at)"
+    )
+    return conn
+
+
+def _scrub_stored_api_keys() -> None:
+    """Queues created by earlier versions stored the caller's api key with each row"""
+    conn = _connect()
+    try:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(pending_results)")}
+        if "api_key" in columns:
+            with conn:
+                conn.execute("UPDATE pending_results SET api_key = NULL WHERE api_key IS NOT NULL")
+    finally:
+        conn.close()
+
+
+def build_idempotency_key(kind: str, entity_id: str, payload: Dict[str, Any]) -> str:
+    """Same result for the same entity always maps to the same key"""
+    body = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(f"{kind}\x00{entity_id}\x00{body}".encode("utf-8")).hexdigest()
+
+
+# Handlers pass no api_key, so the GraphQL clients use SYSTEM_API_KEY from config
+
+def _post_cv(payload: Dict[str, Any], idempotency_key: str) -> bool:
+    res = post_cv_analysis(
+        payload.get("candidateid"),
+        payload["application_id"],
+        payload["analysis"],
+        payload["cv_link"],
+        payload["jobid"],
+        payload.get("extracted") or {},
+        idempotency_key=idempotency_key,
+    )
+    if not res:
+        return False
+    # Valid statuses: PENDING, ANALYZED, REVIEWED, SHORTLISTED, INTERVIEWED, OFFERED, HIRED, REJECTED, WITHDRAWN
+    # A different mutation, so it needs its own key or the backend treats it as a replay
+    status_res = update_application_status(
+        payload["application_id"], "ANALYZED", idempotency_key=f"{idempotency_key}:status"
+    )
+    return bool(status_res)
+
+
+def _post_interview(payload: Dict[str, Any], idempotency_key: str) -> bool:
+    res = update_interview_analysis(
+        payload["interview_id"], payload["analysis"], idempotency_key=idempotency_key
+    )
+    return bool(res)
+
+
+HANDLERS: Dict[str, Callable[[Dict[str, Any], str], bool]] = {
+    "cv_analysis": _post_cv,
+    "interview_analysis": _post_interview,
+}
+
+
+class ResultQueue:
+    """SQLite-backed outbox with a background flusher thread"""
+
+    def __init__(self):
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {
+            "enqueued": 0, "duplicates": 0, "revived": 0, "posted": 0, "failed_attempts": 0, "dead": 0
+        }
+
+    def enqueue(self, kind: str, entity_id: str, payload: Dict[str, Any]) -> str:
+        """
+        Persist a result for posting; returns its idempotency key.
+        A dead copy of the same result goes back to pending; a pending or delivered one is left alone.
+        """
+        if kind not in HANDLERS:
+            raise ValueError(f"Unknown result kind: {kind}")
+        key = build_idempotency_key(kind, entity_id, payload)
+        now = time.time()
+        conn = _connect()
+        try:
+            with conn:
+                previous = conn.execute(
+                    "SELECT status FROM pending_results WHERE idempotency_key = ?", (key,)
+                ).fetchone()
+                conn.execute(
+                    """
+                    INSERT INTO pending_results
+                        (idempotency_key, kind, entity_id, payload, next_attempt_at, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (idempotency_key) DO UPDATE SET
+                        status = 'pending', attempts = 0, next_attempt_at = excluded.next_attempt_at,
+                        last_error = NULL, updated_at = excluded.updated_at
+                    WHERE status = 'dead'
+                    """,
+                    (key, kind, entity_id, json.dumps(payload, default=str), now, now, now)
+                )
+        finally:
+            conn.close()
+
+        if previous is None:
+            self.stats["enqueued"] += 1
+            print(f"📥 Queued {kind} result for {entity_id} (key {key[:12]})")
+        elif previous[0] == "dead":
+            self.stats["revived"] += 1
+            print(f"🔁 Re-queued dead {kind} result for {entity_id} (key {key[:12]})")
+        else:
+            self.stats["duplicates"] += 1
+            print(f"♻️  {kind} result for {entity_id} already queued (key {key[:12]})")
+        self._wakeup.set()
+        return key
+
+    def _claim_next(self, conn: sqlite3.Connection):
+        """Claim the most overdue item, or return None when nothing is due"""
+        now = time.time()
+        token = uuid.uuid4().hex
+        with conn:
+            conn.execute(
+                """
+                UPDATE pending_results SET status = 'pending', claim_token = NULL
+                WHERE status = 'in_flight' AND claimed_at < ?
+                """,
+                (now - RESULT_QUEUE_CLAIM_TIMEOUT_SECONDS,)
+            )
+            conn.execute(
+                """
+                UPDATE pending_results SET status = 'in_flight', claim_token = ?, claimed_at = ?
+                WHERE idempotency_key = (
+                    SELECT idempotency_key FROM pending_results
+                    WHERE status = 'pending' AND next_attempt_at <= ?
+                    ORDER BY next_attempt_at
+                    LIMIT 1
+                )
+                """,
+                (token, now, now)
+            )
+        return conn.execute(
+            """
+            SELECT idempotency_key, kind, entity_id, payload, attempts
+            FROM pending_results WHERE claim_token = ?
+            """,
+            (token,)
+        ).fetchone()
+
+    def _record(self, conn: sqlite3.Connection, key: str, attempts: int, error: Optional[str]) -> None:
+        now = time.time()
+        with conn:
+            if error is None:
+                conn.execute(
+                    """
+                    UPDATE pending_results
+                    SET status = 'done', attempts = ?, claim_token = NULL, last_error = NULL, updated_at = ?
+                    WHERE idempotency_key = ?
+                    """,
+                    (attempts, now, key)
+                )
+                return
+
+            if attempts >= RESULT_QUEUE_MAX_ATTEMPTS:
+                status, next_attempt_at = "dead", now
+                self.stats["dead"] += 1
+            else:
+                delay = min(RESULT_QUEUE_BACKOFF_MAX_SECONDS, 2 ** attempts)
+                status, next_attempt_at = "pending", now + random.uniform(delay / 2, delay)
+            conn.execute(
+                """
+                UPDATE pending_results
+                SET status = ?, attempts = ?, next_attempt_at = ?, claim_token = NULL,
+                    last_error = ?, updated_at = ?
+                WHERE idempotency_key = ?
+                """,
+                (status, attempts, next_attempt_at, error[:1000], now, key)
+            )
+
+    def flush_once(self) -> int:
+        """Post up to RESULT_QUEUE_BATCH_SIZE due results; returns how many were attempted"""
+        conn = _connect()
+        attempted = 0
+        try:
+            while attempted < RESULT_QUEUE_BATCH_SIZE and not self._stopping.is_set():
+                claimed = self._claim_next(conn)
+                if claimed is None:
+                    break
+                key, kind, entity_id, payload, attempts = claimed
+                attempted += 1
+                attempts += 1
+                try:
+                    ok = HANDLERS[kind](json.loads(payload), key)
+                    error = None if ok else "backend did not accept the result"
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+
+                self._record(conn, key, attempts, error)
+                if error is None:
+                    self.stats["posted"] += 1
+                    print(f"✅ Delivered {kind} result for {entity_id} (attempt {attempts})")
+                else:
+                    self.stats["failed_attempts"] += 1
+                    print(f"⚠️  Posting {kind} result for {entity_id} failed (attempt {attempts}): {error}")
+
+            with conn:
+                conn.execute(
+                    "DELETE FROM pending_results WHERE status = 'done' AND updated_at < ?",
+                    (time.time() - RESULT_QUEUE_RETENTION_SECONDS,)
+                )
+        finally:
+            conn.close()
+        return attempted
+
+    def _run(self) -> None:
+        print("📤 Result queue flusher started")
+        while not self._stopping.is_set():
+            try:
+                attempted = self.flush_once()
+            except sqlite3.Error as e:
+                print(f"❌ Result queue error: {e}")
+                attempted = 0
+            # Keep draining while passes are full; otherwise sleep until woken or the next poll
+            if attempted < RESULT_QUEUE_BATCH_SIZE:
+                self._wakeup.wait(RESULT_QUEUE_POLL_SECONDS)
+                self._wakeup.clear()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        try:
+            _scrub_stored_api_keys()
+        except sqlite3.Error as e:
+            print(f"❌ Result queue error: {e}")
+        if not SYSTEM_API_KEY:
+            # Every post would be rejected and burn through its attempts into 'dead'
+            print("❌ SYSTEM_API_KEY is not set; result queue flusher not started, results stay queued")
+            return
+        self._thread = threading.Thread(target=self._run, name="result-queue-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def snapshot(self) -> Dict[str, Any]:
+        counts = {"pending": 0, "in_flight": 0, "done": 0, "dead": 0}
+        oldest_pending_age = 0.0
+        try:
+            conn = _connect()
+            try:
+                for status, count in conn.execute(
+                    "SELECT status, COUNT(*) FROM pending_results GROUP BY status"
+                ):
+                    counts[status] = count
+                oldest = conn.execute(
+                    "SELECT MIN(created_at) FROM pending_results WHERE status IN ('pending', 'in_flight')"
+                ).fetchone()[0]
+                if oldest:
+                    oldest_pending_age = round(time.time() - oldest, 1)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            counts["error"] = str(e)
+        return {**self.stats, **counts, "oldest_pending_age_seconds": oldest_pending_age}
+
+
+result_queue = ResultQueue()
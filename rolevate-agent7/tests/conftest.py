@@ -0,0 +1,8 @@
+"""Test configuration and fixtures."""
+import os
+import tempfile
+
+# Keep the result queue out of /tmp/rolevate_result_queue.db and give the clients dummy keys
+os.environ.setdefault("RESULT_QUEUE_PATH", os.path.join(tempfile.mkdtemp(), "result_queue.db"))
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("SYSTEM_API_KEY", "test-system-key")
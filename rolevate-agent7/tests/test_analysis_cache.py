@@ -0,0 +1,130 @@
+"""Tests for the interview analysis result cache."""
+from types import SimpleNamespace
+import json
+
+import pytest
+
+from interviewagent.nodes import analyze_performance as node_module
+from interviewagent.tools import cache_tool
+from interviewagent.tools.cache_tool import (
+    build_cache_key,
+    get_cache_stats,
+    get_cached_analysis,
+    store_cached_analysis,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_db(tmp_path, monkeypatch):
+    """Point the cache at a fresh database for every test."""
+    monkeypatch.setattr(cache_tool, "ANALYSIS_CACHE_PATH", str(tmp_path / "cache.db"))
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+class TestAnalysisCache:
+    """Test suite for the cache functions."""
+
+    def test_miss_then_hit(self):
+        """Test a stored analysis is returned and both lookups are counted."""
+        assert get_cached_analysis("k") is None
+        store_cached_analysis("k", {"overall_score": 80})
+
+        assert get_cached_analysis("k") == {"overall_score": 80}
+        stats = get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["stores"], stats["entries"]) == (1, 1, 1, 1)
+
+    def test_key_covers_every_input(self):
+        """Test changing any scoring input changes the key."""
+        base = ("prompt", "transcript", "v1", "model")
+        key = build_cache_key(*base)
+        assert build_cache_key(*base) == key
+        for i in range(4):
+            changed = list(base)
+            changed[i] += "x"
+            assert build_cache_key(*changed) != key
+
+    def test_expired_entry_is_evicted(self, monkeypatch):
+        """Test an entry older than the TTL is a miss and gets deleted."""
+        clock = FakeClock()
+        monkeypatch.setattr(cache_tool.time, "time", clock.time)
+        monkeypatch.setattr(cache_tool, "ANALYSIS_CACHE_TTL_SECONDS", 60)
+        store_cached_analysis("k", {"overall_score": 80})
+
+        clock.now += 59
+        assert get_cached_analysis("k") is not None
+        clock.now += 2
+        assert get_cached_analysis("k") is None
+        stats = get_cache_stats()
+        assert (stats["evictions_expired"], stats["entries"]) == (1, 0)
+
+    def test_capacity_evicts_least_recently_used(self, monkeypatch):
+        """Test the entry hit least recently goes first when over capacity."""
+        clock = FakeClock()
+        monkeypatch.setattr(cache_tool.time, "time", clock.time)
+        monkeypatch.setattr(cache_tool, "ANALYSIS_CACHE_MAX_ENTRIES", 2)
+        store_cached_analysis("a", {"n": "a"})
+        clock.now += 1
+        store_cached_analysis("b", {"n": "b"})
+        clock.now += 1
+        get_cached_analysis("a")
+        clock.now += 1
+        store_cached_analysis("c", {"n": "c"})
+
+        assert get_cached_analysis("b") is None
+        assert get_cached_analysis("a") == {"n": "a"}
+        assert get_cached_analysis("c") == {"n": "c"}
+        assert get_cache_stats()["evictions_capacity"] == 1
+
+
+class FakeScheduler:
+    """Stands in for llm_scheduler, returning a fixed score"""
+
+    def __init__(self, score):
+        self.score = score
+        self.calls = []
+
+    def chat_completion(self, **kwargs):
+        self.calls.append(kwargs)
+        message = SimpleNamespace(content=json.dumps({"overall_score": self.score}))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class TestAnalyzePerformanceCaching:
+    """Test suite for cache use in analyze_performance_node."""
+
+    def run(self, monkeypatch, score, **state):
+        scheduler = FakeScheduler(score)
+        monkeypatch.setattr(node_module, "llm_scheduler", scheduler)
+        result = node_module.analyze_performance_node({"raw_transcript": "Q: Hi\nA: Hello", **state})
+        return result, scheduler
+
+    def test_rescoring_same_transcript_hits_cache(self, monkeypatch):
+        """Test the second analysis of a transcript reuses the first result."""
+        first, scheduler = self.run(monkeypatch, 70)
+        assert first["analysis_cached"] is False
+        assert scheduler.calls[0]["temperature"] == 0
+        assert scheduler.calls[0]["seed"] == node_module.ANALYSIS_SEED
+
+        second, scheduler = self.run(monkeypatch, 90)
+        assert second["analysis"] == {"overall_score": 70}
+        assert second["analysis_cached"] is True
+        assert scheduler.calls == []
+
+    def test_force_refresh_bypasses_and_replaces(self, monkeypatch):
+        """Test forceRefresh re-scores and the new result replaces the cached one."""
+        self.run(monkeypatch, 70)
+
+        forced, scheduler = self.run(monkeypatch, 90, force_refresh=True)
+        assert forced["analysis"] == {"overall_score": 90}
+        assert len(scheduler.calls) == 1
+        assert get_cache_stats()["forced_refreshes"] == 1
+
+        later, _ = self.run(monkeypatch, 50)
+        assert later["analysis"] == {"overall_score": 90}
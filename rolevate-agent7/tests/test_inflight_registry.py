@@ -0,0 +1,124 @@
+"""Tests for analysis de-duplication and admission rejection."""
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from admission import AdmissionRejected, PipelineAdmission
+from main import InFlightRegistry
+
+
+def blocking_job(release: threading.Event, calls: list):
+    def job(value):
+        calls.append(value)
+        release.wait(5)
+        return {"value": value, "run": len(calls)}
+    return job
+
+
+class TestInFlightRegistry:
+    """Test suite for InFlightRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_run(self):
+        """Test a second trigger for the same key joins the running pipeline."""
+        registry = InFlightRegistry(window_seconds=60)
+        release, calls = threading.Event(), []
+        job = blocking_job(release, calls)
+
+        first = asyncio.ensure_future(registry.run("k", job, "a"))
+        await asyncio.sleep(0.05)
+        second = asyncio.ensure_future(registry.run("k", job, "b"))
+        await asyncio.sleep(0.05)
+        release.set()
+
+        assert await first == await second == {"value": "a", "run": 1}
+        assert calls == ["a"]
+        assert registry.stats["joined_in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recent_result_is_reused(self):
+        """Test a trigger inside the window returns the finished result without a run."""
+        registry = InFlightRegistry(window_seconds=60)
+        release, calls = threading.Event(), []
+        release.set()
+        job = blocking_job(release, calls)
+
+        await registry.run("k", job, "a")
+        assert await registry.run("k", job, "b") == {"value": "a", "run": 1}
+        assert calls == ["a"]
+        assert registry.stats["served_recent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_force_skips_in_flight_run(self):
+        """Test a forced trigger starts its own run instead of joining the current one."""
+        registry = InFlightRegistry(window_seconds=60)
+        release, calls = threading.Event(), []
+        job = blocking_job(release, calls)
+
+        normal = asyncio.ensure_future(registry.run("k", job, "normal"))
+        await asyncio.sleep(0.05)
+        forced = asyncio.ensure_future(registry.run("k", job, "forced", force=True))
+        await asyncio.sleep(0.05)
+        release.set()
+
+        assert (await normal)["value"] == "normal"
+        assert (await forced)["value"] == "forced"
+        assert calls == ["normal", "forced"]
+        # The forced result, not the older one, is what later triggers get
+        assert (await registry.run("k", job, "later"))["value"] == "forced"
+        assert registry.snapshot()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_force_skips_recent_result(self):
+        """Test a forced trigger reruns even when a recent result exists."""
+        registry = InFlightRegistry(window_seconds=60)
+        release, calls = threading.Event(), []
+        release.set()
+        job = blocking_job(release, calls)
+
+        await registry.run("k", job, "a")
+        assert (await registry.run("k", job, "b", force=True))["value"] == "b"
+        assert calls == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_failed_run_is_not_cached(self):
+        """Test a failing pipeline is counted and the next trigger runs again."""
+        registry = InFlightRegistry(window_seconds=60)
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await registry.run("k", failing)
+        assert registry.stats["failed"] == 1
+        assert registry.snapshot()["recent"] == 0
+
+
+class TestAdmission:
+    """Test suite for admission rejection."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self):
+        """Test admission raises once every slot and queue place is taken."""
+        admission = PipelineAdmission(max_active=1, max_queue=0, retry_after=7)
+        async with admission.admit():
+            with pytest.raises(AdmissionRejected) as excinfo:
+                async with admission.admit():
+                    pass
+        assert excinfo.value.retry_after == 7
+        assert admission.rejected == 1
+
+    def test_endpoint_answers_429_with_retry_after(self, monkeypatch):
+        """Test a rejected trigger becomes a 429 with a Retry-After header."""
+        async def reject(*args, **kwargs):
+            raise AdmissionRejected(retry_after=12, queue_depth=3)
+
+        monkeypatch.setattr(main.analysis_registry, "run", reject)
+        response = TestClient(main.app).post("/interview-analysis", json={"interview_id": "i1"})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "12"
+        assert response.json()["queue_depth"] == 3
@@ -0,0 +1,113 @@
+"""Tests for the shared OpenAI call scheduler."""
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+import llm_scheduler as scheduler_module
+from admission import io_limiter
+from llm_scheduler import LLMScheduler, TokenBucket, parse_reset_duration
+
+
+def rate_limit_error() -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, request=request, headers={"retry-after": "0"})
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+class FakeRaw:
+    def __init__(self, headers, total_tokens):
+        self.headers = headers
+        self._response = SimpleNamespace(usage=SimpleNamespace(total_tokens=total_tokens))
+
+    def parse(self):
+        return self._response
+
+
+class FakeClient:
+    """Stands in for OpenAI(): fails the first `failures` calls, then succeeds"""
+
+    def __init__(self, failures=0, headers=None, total_tokens=0):
+        self.failures = failures
+        self.headers = headers or {}
+        self.total_tokens = total_tokens
+        self.slots_in_use = []
+        create = SimpleNamespace(create=self.create)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(with_raw_response=create))
+
+    def create(self, **kwargs):
+        self.slots_in_use.append(io_limiter.active)
+        if self.failures:
+            self.failures -= 1
+            raise rate_limit_error()
+        return FakeRaw(self.headers, self.total_tokens)
+
+
+def make_scheduler(client) -> LLMScheduler:
+    scheduler = LLMScheduler(rpm=1000, tpm=1_000_000, max_retries=3, backoff_base=0.01, backoff_max=0.01)
+    scheduler._client = client
+    return scheduler
+
+
+class TestLLMScheduler:
+    """Test suite for LLMScheduler."""
+
+    def test_backoff_does_not_hold_io_slot(self, monkeypatch):
+        """Test the io slot is only held while a request is in flight, not while backing off."""
+        active_during_sleep = []
+        monkeypatch.setattr(scheduler_module.time, "sleep", lambda s: active_during_sleep.append(io_limiter.active))
+        client = FakeClient(failures=2)
+        scheduler = make_scheduler(client)
+
+        scheduler.chat_completion(messages=[{"role": "user", "content": "hi"}])
+
+        assert client.slots_in_use == [1, 1, 1]
+        assert active_during_sleep == [0, 0]
+        assert scheduler.stats["retries"] == 2
+        assert scheduler.stats["rate_limited"] == 2
+
+    def test_gives_up_after_retry_budget(self, monkeypatch):
+        """Test the error reaches the caller once retries are exhausted."""
+        monkeypatch.setattr(scheduler_module.time, "sleep", lambda s: None)
+        scheduler = make_scheduler(FakeClient(failures=10))
+
+        with pytest.raises(openai.RateLimitError):
+            scheduler.chat_completion(messages=[])
+        assert scheduler.stats["exhausted"] == 1
+        assert io_limiter.active == 0
+
+    def test_usage_not_charged_twice_when_headers_synced(self):
+        """Test remaining tokens from headers are not reduced again by the usage correction."""
+        headers = {"x-ratelimit-remaining-tokens": "5000", "x-ratelimit-remaining-requests": "99"}
+        scheduler = make_scheduler(FakeClient(headers=headers, total_tokens=3000))
+
+        scheduler.chat_completion(messages=[{"role": "user", "content": "hi"}], max_tokens=10)
+
+        assert scheduler.snapshot()["tokens_available"] == pytest.approx(5000, abs=5)
+
+    def test_usage_corrects_estimate_without_headers(self):
+        """Test the estimate is replaced by actual usage when no headers came back."""
+        scheduler = make_scheduler(FakeClient(total_tokens=500))
+
+        scheduler.chat_completion(messages=[], max_tokens=100)
+
+        assert 1_000_000 - scheduler.snapshot()["tokens_available"] == pytest.approx(500, abs=5)
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    def test_sync_reports_whether_remaining_was_applied(self):
+        """Test sync only claims a resync when a remaining header was present."""
+        bucket = TokenBucket(600)
+        assert bucket.sync("600", "100", "1s", now=bucket._updated_at) is True
+        assert bucket.available == 100
+        assert bucket.sync("600", None, None, now=bucket._updated_at) is False
+
+    def test_parse_reset_duration(self):
+        """Test OpenAI reset durations are parsed into seconds."""
+        assert parse_reset_duration("6m0s") == 360
+        assert parse_reset_duration("20ms") == pytest.approx(0.02)
+        assert parse_reset_duration("1.5") == 1.5
+        assert parse_reset_duration(None) is None
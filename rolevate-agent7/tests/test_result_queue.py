@@ -0,0 +1,191 @@
+"""Tests for the durable result queue."""
+import sqlite3
+
+import pytest
+
+import result_queue as queue_module
+from result_queue import ResultQueue
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    """A queue on a fresh database whose handler records posts and fails on demand."""
+    monkeypatch.setattr(queue_module, "RESULT_QUEUE_PATH", str(tmp_path / "queue.db"))
+    monkeypatch.setattr(queue_module, "RESULT_QUEUE_MAX_ATTEMPTS", 3)
+    posts = []
+    outcomes = []
+
+    def handler(payload, idempotency_key):
+        posts.append((payload, idempotency_key))
+        outcome = outcomes.pop(0) if outcomes else True
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setitem(queue_module.HANDLERS, "interview_analysis", handler)
+    q = ResultQueue()
+    q.posts, q.outcomes = posts, outcomes
+    return q
+
+
+def make_due(status="pending"):
+    """Pull every row's next attempt into the past so backoff does not slow the test"""
+    conn = sqlite3.connect(queue_module.RESULT_QUEUE_PATH)
+    with conn:
+        conn.execute("UPDATE pending_results SET next_attempt_at = 0 WHERE status = ?", (status,))
+    conn.close()
+
+
+def row(key):
+    conn = sqlite3.connect(queue_module.RESULT_QUEUE_PATH)
+    try:
+        return conn.execute(
+            "SELECT status, attempts, last_error FROM pending_results WHERE idempotency_key = ?", (key,)
+        ).fetchone()
+    finally:
+        conn.close()
+
+
+PAYLOAD = {"interview_id": "i1", "analysis": {"overall_score": 80}}
+
+
+class TestResultQueue:
+    """Test suite for ResultQueue."""
+
+    def test_enqueue_is_idempotent(self, queue):
+        """Test the same result maps to one row and one key."""
+        key = queue.enqueue("interview_analysis", "i1", PAYLOAD)
+        assert queue.enqueue("interview_analysis", "i1", PAYLOAD) == key
+        assert queue.stats["enqueued"] == 1
+        assert queue.stats["duplicates"] == 1
+        assert queue.snapshot()["pending"] == 1
+
+    def test_enqueue_rejects_unknown_kind(self, queue):
+        """Test an unknown result kind is refused."""
+        with pytest.raises(ValueError):
+            queue.enqueue("nope", "i1", PAYLOAD)
+
+    def test_flush_delivers_with_idempotency_key(self, queue):
+        """Test a due item is posted once with its key and marked done."""
+        key = queue.enqueue("interview_analysis", "i1", PAYLOAD)
+
+        assert queue.flush_once() == 1
+        assert queue.posts == [(PAYLOAD, key)]
+        assert row(key)[0] == "done"
+        assert queue.flush_once() == 0
+
+    def test_failure_is_retried_after_backoff(self, queue):
+        """Test a failed post stays pending with a later attempt time, then succeeds."""
+        key = queue.enqueue("interview_analysis", "i1", PAYLOAD)
+        queue.outcomes.append(RuntimeError("backend down"))
+
+        assert queue.flush_once() == 1
+        assert row(key) == ("pending", 1, "backend down")
+        assert queue.flush_once() == 0  # not due yet
+
+        make_due()
+        assert queue.flush_once() == 1
+        assert row(key)[:2] == ("done", 2)
+        assert queue.stats["failed_attempts"] == 1
+
+    def test_exhausted_item_goes_dead_and_enqueue_revives_it(self, queue):
+        """Test an item is kept as dead after the last attempt and re-enqueueing resets it."""
+        key = queue.enqueue("interview_analysis", "i1", PAYLOAD)
+        queue.outcomes.extend([False, False, False])
+        for _ in range(3):
+            make_due()
+            queue.flush_once()
+        assert row(key)[:2] == ("dead", 3)
+        assert queue.stats["dead"] == 1
+
+        queue.enqueue("interview_analysis", "i1", PAYLOAD)
+        assert row(key) == ("pending", 0, None)
+        assert queue.stats["revived"] == 1
+        assert queue.flush_once() == 1
+        assert row(key)[0] == "done"
+
+    def test_delivered_item_is_not_posted_again(self, queue):
+        """Test re-enqueueing a delivered result does not post it twice."""
+        queue.enqueue("interview_analysis", "i1", PAYLOAD)
+        queue.flush_once()
+        queue.enqueue("interview_analysis", "i1", PAYLOAD)
+        assert queue.flush_once() == 0
+        assert len(queue.posts) == 1
+
+    def test_stale_claim_is_picked_up_again(self, queue):
+        """Test an item left in flight by a dead flusher is claimed again after the timeout."""
+        key = queue.enqueue("interview_analysis", "i1", PAYLOAD)
+        conn = sqlite3.connect(queue_module.RESULT_QUEUE_PATH)
+        with conn:
+            conn.execute("UPDATE pending_results SET status = 'in_flight', claimed_at = 0")
+        conn.close()
+        assert queue.flush_once() == 1
+        assert row(key)[0] == "done"
+
+    def test_pass_is_capped_at_batch_size(self, queue, monkeypatch):
+        """Test one flush pass posts at most RESULT_QUEUE_BATCH_SIZE items."""
+        monkeypatch.setattr(queue_module, "RESULT_QUEUE_BATCH_SIZE", 2)
+        for i in range(3):
+            queue.enqueue("interview_analysis", f"i{i}", {"interview_id": f"i{i}", "analysis": {}})
+        assert queue.flush_once() == 2
+        assert queue.flush_once() == 1
+
+    def test_cv_status_update_gets_its_own_key(self, monkeypatch):
+        """Test the analysis and the status mutation are sent with different idempotency keys."""
+        keys = {}
+        monkeypatch.setattr(
+            queue_module, "post_cv_analysis", lambda *a, **kw: keys.setdefault("analysis", kw["idempotency_key"])
+        )
+        monkeypatch.setattr(
+            queue_module, "update_application_status",
+            lambda *a, **kw: keys.setdefault("status", kw["idempotency_key"])
+        )
+        payload = {"application_id": "a1", "analysis": {}, "cv_link": "cv.pdf", "jobid": "j1"}
+
+        assert queue_module._post_cv(payload, "abc") is True
+        assert keys == {"analysis": "abc", "status": "abc:status"}
+
+    def test_api_keys_are_not_stored(self, queue):
+        """Test the queue schema has nowhere to keep credentials."""
+        queue.enqueue("interview_analysis", "i1", PAYLOAD)
+        conn = sqlite3.connect(queue_module.RESULT_QUEUE_PATH)
+        columns = {r[1] for r in conn.execute("PRAGMA table_info(pending_results)")}
+        conn.close()
+        assert "api_key" not in columns
+
+    def test_legacy_api_keys_are_scrubbed(self, tmp_path, monkeypatch):
+        """Test keys stored by the earlier schema are cleared."""
+        monkeypatch.setattr(queue_module, "RESULT_QUEUE_PATH", str(tmp_path / "legacy.db"))
+        conn = sqlite3.connect(queue_module.RESULT_QUEUE_PATH)
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE pending_results (
+                    idempotency_key TEXT PRIMARY KEY, kind TEXT NOT NULL, entity_id TEXT NOT NULL,
+                    payload TEXT NOT NULL, api_key TEXT, status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0, next_attempt_at REAL NOT NULL,
+                    claim_token TEXT, claimed_at REAL, last_error TEXT,
+                    created_at REAL NOT NULL, updated_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "INSERT INTO pending_results (idempotency_key, kind, entity_id, payload, api_key, "
+                "next_attempt_at, created_at, updated_at) VALUES ('k', 'cv_analysis', 'a1', '{}', 'secret', 0, 0, 0)"
+            )
+        conn.close()
+
+        queue_module._scrub_stored_api_keys()
+
+        conn = sqlite3.connect(queue_module.RESULT_QUEUE_PATH)
+        assert conn.execute("SELECT api_key FROM pending_results").fetchone() == (None,)
+        conn.close()
+
+    def test_flusher_refuses_to_start_without_system_key(self, queue, monkeypatch):
+        """Test items stay queued instead of failing into 'dead' when no key is configured."""
+        monkeypatch.setattr(queue_module, "SYSTEM_API_KEY", "")
+        queue.start()
+        assert queue._thread is None
+
+        queue.enqueue("interview_analysis", "i1", PAYLOAD)
+        assert queue.snapshot()["pending"] == 1
@@ -7,8 +7,9 @@ export class CreateInterviewInput {
   @Field()
   applicationId: string;
 
-  @Field()
-  interviewerId: string;
+  // Defaults to the application's candidate when omitted
+  @Field({ nullable: true })
+  interviewerId?: string;
 
   @Field()
   scheduledAt: Date;
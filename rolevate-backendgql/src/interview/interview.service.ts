@@ -1,4 +1,4 @@
-import { Injectable } from '@nestjs/common';
+import { Injectable, NotFoundException } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
 import { Repository, Brackets } from 'typeorm';
 import { Interview, InterviewStatus } from './interview.entity';
@@ -30,26 +30,40 @@ export class InterviewService {
   ) {}
 
   async create(createInterviewInput: CreateInterviewInput): Promise<Interview> {
+    // Without an explicit interviewer, attribute the interview to the application's candidate,
+    // so callers can create it without fetching the application first
+    let interviewerId = createInterviewInput.interviewerId;
+    if (!interviewerId) {
+      const application = await this.applicationRepository.findOne({
+        where: { id: createInterviewInput.applicationId },
+        select: { id: true, candidateId: true },
+      });
+      if (!application) {
+        throw new NotFoundException(`Application with ID ${createInterviewInput.applicationId} not found`);
+      }
+      interviewerId = application.candidateId;
+    }
+
     // Check if interviewer exists, if not create an AI interviewer
     const existingInterviewer = await this.userRepository.findOne({
-      where: { id: createInterviewInput.interviewerId }
+      where: { id: interviewerId }
     });
 
     if (!existingInterviewer) {
-      console.log(`🤖 Creating AI interviewer with ID: ${createInterviewInput.interviewerId}`);
+      console.log(`🤖 Creating AI interviewer with ID: ${interviewerId}`);
       // Create AI interviewer user
       const aiInterviewer = this.userRepository.create({
-        id: createInterviewInput.interviewerId, // Use the provided ID
+        id: interviewerId, // Use the provided ID
         userType: UserType.SYSTEM,
         name: 'AI Interviewer',
-        email: `ai-interviewer-${createInterviewInput.interviewerId}@rolevate.ai`,
+        email: `ai-interviewer-${interviewerId}@rolevate.ai`,
         isActive: true,
       });
       await this.userRepository.save(aiInterviewer);
       console.log(`✅ AI interviewer created: ${aiInterviewer.name} (${aiInterviewer.id})`);
     }
 
-    const interview = this.interviewRepository.create(createInterviewInput);
+    const interview = this.interviewRepository.create({ ...createInterviewInput, interviewerId });
     return this.interviewRepository.save(interview);
   }
 
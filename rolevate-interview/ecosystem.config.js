@@ -23,5 +23,21 @@ module.exports = {
     merge_logs: true,
     max_restarts: 10,
     min_uptime: '10s'
+  }, {
+    name: 'rolevate-upload-worker',
+    script: 'venv/bin/python',
+    args: '-m v1.upload_worker',
+    cwd: '/Users/husain/Desktop/rolevate/rolevate-interview',
+    interpreter: 'none',
+    autorestart: true,
+    watch: false,
+    env: {
+      PYTHONUNBUFFERED: '1'
+    },
+    error_file: './logs/pm2-upload-error.log',
+    out_file: './logs/pm2-upload-out.log',
+    time: true,
+    max_restarts: 10,
+    min_uptime: '10s'
   }]
 };
@@ -4,7 +4,6 @@ Rolevate Interview Agent - Simplified
 
 import logging
 import asyncio
-import aiohttp
 from pathlib import Path
 
 from livekit.agents import AgentSession, JobContext, JobProcess, WorkerOptions, cli, tokenize
@@ -12,9 +11,13 @@ from livekit.plugins import soniox, openai, elevenlabs, silero
 
 from .core.config import settings
 from .services.api_client import RolevateAPIClient
-from .services.s3_service import upload_video_to_s3
+from .services.frame_sampler import close_frame_samplers
+from .services.http_client import close_http_session
+from .services.upload_queue import UploadQueue
+from .services.vision_service import VisionAnalyzer
 from .agents.interview_agent import InterviewAgent
 from .utils.helpers import parse_application_id
+from .utils.loop_monitor import LoopLagMonitor
 
 # Setup logging
 logging.basicConfig(
@@ -27,6 +30,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+RECORDINGS_DIR = Path("recordings")
+
+# One monitor per job process; every live session in it shares this event loop
+loop_monitor = LoopLagMonitor()
+
 
 def prewarm(proc: JobProcess) -> None:
     """Preload VAD model"""
@@ -49,46 +57,26 @@ async def fetch_context(application_id: str):
         await api_client.close()
 
 
-async def upload_and_save_video(ctx: JobContext, application_id: str):
-    """Upload video to S3 and save URL to backend"""
-    # Register disconnect handler
+async def upload_and_save_video(ctx: JobContext, application_id: str, upload_queue: UploadQueue):
+    """Queue the recording for the upload worker once the room ends"""
+    # Register disconnect handler - only enqueues, so nothing is lost if this job exits
     @ctx.room.on("disconnected")
     def on_disconnect():
-        asyncio.create_task(_process_recording(ctx, application_id))
-    
-async def _process_recording(ctx: JobContext, application_id: str):
-    """Process recording after room ends"""
-    recording_path = Path(f"recordings/{ctx.room.name}.mp4")
-    if not recording_path.exists():
-        return
-    
-    # Upload to S3
-    video_url = upload_video_to_s3(str(recording_path), application_id)
-    if not video_url:
-        return
-    
-    # Save to backend
-    if settings.backend_url:
+        recording_path = RECORDINGS_DIR / f"{ctx.room.name}.mp4"
+        if not recording_path.exists():
+            return
         try:
-            async with aiohttp.ClientSession() as session:
-                await session.post(
-                    f"{settings.backend_url}/applications/{application_id}/video",
-                    json={"videoUrl": video_url},
-                    timeout=aiohttp.ClientTimeout(total=10)
-                )
-            logger.info(f"✅ Video saved: {application_id}")
+            upload_queue.enqueue(str(recording_path), application_id)
         except Exception as e:
-            logger.error(f"Backend save failed: {e}")
-    
-    # Cleanup
-    recording_path.unlink()
-
+            logger.error(f"Failed to queue recording upload: {e}")
 
 
 async def entrypoint(ctx: JobContext) -> None:
     """Main entry point for interview session"""
     try:
         logger.info("Starting entrypoint")
+        loop_monitor.start()
+        ctx.add_shutdown_callback(close_http_session)
         application_id = parse_application_id(ctx.room.name)
         logger.info(f"Parsed application_id: {application_id}")
         
@@ -102,7 +90,8 @@ async def entrypoint(ctx: JobContext) -> None:
         interview_context = await fetch_context(application_id)
         logger.info(f"Fetched context: {interview_context}")
         if application_id and settings.aws_bucket_name:
-            asyncio.create_task(upload_and_save_video(ctx, application_id))
+            upload_queue = UploadQueue(settings.upload_queue_path)
+            asyncio.create_task(upload_and_save_video(ctx, application_id, upload_queue))
         
         # Configure session
         logger.info("Creating AgentSession")
@@ -130,6 +119,18 @@ async def entrypoint(ctx: JobContext) -> None:
         logger.info("Starting session")
         await session.start(agent=agent, room=ctx.room)
         logger.info("Session started")
+        
+        # Environment monitoring: cheap local checks every sample, vision API only on change
+        if application_id and settings.vision_monitoring:
+            vision_analyzer = VisionAnalyzer(ctx.room, application_id)
+            await vision_analyzer.start()
+            ctx.add_shutdown_callback(vision_analyzer.stop)
+        
+        async def close_samplers():
+            await close_frame_samplers(ctx.room)
+        
+        # Shutdown callbacks run in order, so samplers close after the analyzer stops using them
+        ctx.add_shutdown_callback(close_samplers)
     except Exception as e:
         logger.error(f"Entrypoint error: {e}")
         import traceback
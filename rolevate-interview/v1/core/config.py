@@ -34,6 +34,39 @@ class Settings:
     aws_region: str = "me-central-1"
     aws_bucket_name: str = ""
     backend_url: str = ""
+    s3_max_workers: int = 4
+    s3_multipart_threshold_mb: int = 16
+    s3_multipart_chunksize_mb: int = 16
+    s3_max_concurrency: int = 8
+    
+    # Shared HTTP client
+    http_timeout: float = 30.0
+    http_pool_limit: int = 100
+    http_limit_per_host: int = 10
+    http_keepalive_timeout: float = 60.0
+    http_dns_cache_ttl: int = 300
+    
+    # Vision monitoring (opt-in) - frames are sampled often but only sent to the API on change
+    vision_monitoring: bool = False
+    vision_sample_interval: float = 5.0
+    vision_max_interval: float = 120.0
+    vision_hash_threshold: int = 10
+    vision_hist_threshold: float = 0.2
+    vision_area_threshold: float = 0.04
+    vision_max_side: int = 512
+    vision_jpeg_quality: int = 85
+    vision_people_detector: bool = True
+    vision_face_model_path: str = "models/face_detection_yunet_2023mar.onnx"
+    vision_face_score_threshold: float = 0.7
+    vision_people_confirm_samples: int = 2
+    
+    # Recording upload queue
+    upload_queue_path: str = "recordings/uploads.db"
+    upload_concurrency: int = 2
+    upload_max_attempts: int = 8
+    upload_retry_base_delay: float = 5.0
+    upload_retry_max_delay: float = 600.0
+    upload_poll_interval: float = 2.0
     
     def validate(self) -> None:
         """Validate required settings"""
@@ -121,4 +154,31 @@ settings = Settings(
     aws_region=os.getenv("AWS_REGION", "me-central-1"),
     aws_bucket_name=os.getenv("AWS_BUCKET_NAME", ""),
     backend_url=os.getenv("BACKEND_URL", ""),
+    s3_max_workers=int(os.getenv("S3_MAX_WORKERS", "4")),
+    s3_multipart_threshold_mb=int(os.getenv("S3_MULTIPART_THRESHOLD_MB", "16")),
+    s3_multipart_chunksize_mb=int(os.getenv("S3_MULTIPART_CHUNKSIZE_MB", "16")),
+    s3_max_concurrency=int(os.getenv("S3_MAX_CONCURRENCY", "8")),
+    http_timeout=float(os.getenv("HTTP_TIMEOUT", "30")),
+    http_pool_limit=int(os.getenv("HTTP_POOL_LIMIT", "100")),
+    http_limit_per_host=int(os.getenv("HTTP_LIMIT_PER_HOST", "10")),
+    http_keepalive_timeout=float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "60")),
+    http_dns_cache_ttl=int(os.getenv("HTTP_DNS_CACHE_TTL", "300")),
+    vision_monitoring=os.getenv("VISION_MONITORING", "false").lower() == "true",
+    vision_sample_interval=float(os.getenv("VISION_SAMPLE_INTERVAL", "5")),
+    vision_max_interval=float(os.getenv("VISION_MAX_INTERVAL", "120")),
+    vision_hash_threshold=int(os.getenv("VISION_HASH_THRESHOLD", "10")),
+    vision_hist_threshold=float(os.getenv("VISION_HIST_THRESHOLD", "0.2")),
+    vision_area_threshold=float(os.getenv("VISION_AREA_THRESHOLD", "0.04")),
+    vision_max_side=int(os.getenv("VISION_MAX_SIDE", "512")),
+    vision_jpeg_quality=int(os.getenv("VISION_JPEG_QUALITY", "85")),
+    vision_people_detector=os.getenv("VISION_PEOPLE_DETECTOR", "true").lower() == "true",
+    vision_face_model_path=os.getenv("VISION_FACE_MODEL_PATH", "models/face_detection_yunet_2023mar.onnx"),
+    vision_face_score_threshold=float(os.getenv("VISION_FACE_SCORE_THRESHOLD", "0.7")),
+    vision_people_confirm_samples=int(os.getenv("VISION_PEOPLE_CONFIRM_SAMPLES", "2")),
+    upload_queue_path=os.getenv("UPLOAD_QUEUE_PATH", "recordings/uploads.db"),
+    upload_concurrency=int(os.getenv("UPLOAD_CONCURRENCY", "2")),
+    upload_max_attempts=int(os.getenv("UPLOAD_MAX_ATTEMPTS", "8")),
+    upload_retry_base_delay=float(os.getenv("UPLOAD_RETRY_BASE_DELAY", "5")),
+    upload_retry_max_delay=float(os.getenv("UPLOAD_RETRY_MAX_DELAY", "600")),
+    upload_poll_interval=float(os.getenv("UPLOAD_POLL_INTERVAL", "2")),
 )
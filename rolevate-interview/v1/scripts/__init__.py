@@ -0,0 +1 @@
+"""Offline evaluation and benchmark scripts"""
@@ -0,0 +1,86 @@
+"""
+Benchmark per-capture CPU time and payload size of the vision frame path
+
+Compares the old capture path (copy the full-resolution RGBA frame into
+bytes, build a PIL image, convert to RGB, JPEG encode) with the shared
+sampler path (wrap the buffer, downscale to VISION_MAX_SIDE, then encode).
+Both start from the RGBA buffer LiveKit's frame.convert() returns, so the
+YUV conversion they share is left out.
+
+Usage:
+    python -m v1.scripts.frame_capture_benchmark
+    python -m v1.scripts.frame_capture_benchmark --resolutions 1280x720 1920x1080 --runs 50
+"""
+
+import argparse
+import base64
+import io
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+from ..core.config import settings
+from ..utils.frame_encoding import downscale_rgba, encode_jpeg
+
+
+def synthetic_frame(width: int, height: int) -> np.ndarray:
+    """Webcam-like RGBA frame: smooth background, a subject and sensor noise"""
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    frame = np.empty((height, width, 4), dtype=np.uint8)
+    background = 80 + 60 * (x / width) + 30 * (y / height)
+    subject = ((x - width / 2) / (width / 5)) ** 2 + ((y - height * 0.6) / (height / 2.5)) ** 2 < 1
+    for channel, tint in enumerate((1.0, 0.9, 0.8)):
+        plane = np.where(subject, 170 * tint, background * tint) + rng.normal(0, 4, (height, width))
+        frame[..., channel] = np.clip(plane, 0, 255)
+    frame[..., 3] = 255
+    return frame
+
+
+def legacy_capture(data: memoryview, width: int, height: int, quality: int) -> str:
+    """The previous EnvironmentAnalysisTool path"""
+    img = Image.frombytes("RGBA", (width, height), bytes(data))
+    img = img.convert("RGB")
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=quality)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def sampler_capture(data: memoryview, width: int, height: int, quality: int) -> str:
+    """The shared FrameSampler path"""
+    return encode_jpeg(downscale_rgba(data, width, height, settings.vision_max_side), quality)
+
+
+def measure(fn, data, width, height, quality, runs):
+    fn(data, width, height, quality)  # warm up
+    times = []
+    for _ in range(runs):
+        started = time.process_time()
+        payload = fn(data, width, height, quality)
+        times.append((time.process_time() - started) * 1000)
+    return float(np.median(times)), len(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resolutions", nargs="+", default=["640x480", "1280x720", "1920x1080"])
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--quality", type=int, default=settings.vision_jpeg_quality)
+    args = parser.parse_args()
+
+    print(f"\n📊 Frame capture benchmark (max side {settings.vision_max_side}, quality {args.quality})\n")
+    print(f"{'resolution':<11} {'path':<8} {'cpu ms':>8} {'base64 KB':>10}")
+    for resolution in args.resolutions:
+        width, height = (int(v) for v in resolution.split("x"))
+        data = memoryview(synthetic_frame(width, height)).cast("B")
+        for name, fn in (("legacy", legacy_capture), ("sampler", sampler_capture)):
+            cpu_ms, size = measure(fn, data, width, height, args.quality, args.runs)
+            print(f"{resolution:<11} {name:<8} {cpu_ms:>8.1f} {size / 1024:>10.1f}")
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
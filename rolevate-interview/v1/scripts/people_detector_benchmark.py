@@ -0,0 +1,102 @@
+"""
+Benchmark the local people detector against recorded vision API output
+
+Runs the face detector on a fixture set of frames, the same way the vision
+service does (downscaled to VISION_MAX_SIDE), and reports frames per second
+per core plus agreement with the vision API's "other_people" answers.
+
+Labels map frame file names to the vision API analysis logged for that frame
+("Vision analysis: {...}"), or just to the other_people boolean:
+    {"frame_001.jpg": {"other_people": false, "smoking": false, ...},
+     "frame_002.jpg": true}
+
+Usage:
+    python -m v1.scripts.people_detector_benchmark fixtures/ --labels fixtures/labels.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from ..core.config import settings
+from ..utils.frame_encoding import downscale_rgba
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("frames", type=Path, help="Directory of fixture frames")
+    parser.add_argument("--labels", type=Path, required=True, help="JSON of frame name -> vision API output")
+    parser.add_argument("--model", default=settings.vision_face_model_path)
+    parser.add_argument("--score-threshold", type=float, default=settings.vision_face_score_threshold)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the fixture set")
+    args = parser.parse_args()
+
+    try:
+        import cv2
+    except ImportError:
+        print("opencv-python-headless is not installed")
+        return 1
+    if not Path(args.model).exists():
+        print(f"Face model not found: {args.model} (see services/people_detector.py)")
+        return 1
+
+    from ..services.people_detector import PeopleDetector
+
+    # One thread, so the rate is per core
+    cv2.setNumThreads(1)
+    detector = PeopleDetector(args.model, args.score_threshold)
+
+    labels = json.loads(args.labels.read_text())
+    frames = []
+    for name, label in sorted(labels.items()):
+        path = args.frames / name
+        if not path.exists():
+            print(f"Missing fixture: {path}")
+            continue
+        image = Image.open(path).convert("RGBA")
+        frame = downscale_rgba(image.tobytes(), image.width, image.height, settings.vision_max_side)
+        expected = label.get("other_people") if isinstance(label, dict) else label
+        frames.append((name, frame, bool(expected)))
+    if not frames:
+        print("No fixtures to run")
+        return 1
+
+    counts = {name: detector.count(frame) for name, frame, _ in frames}  # warm up
+
+    started = time.process_time()
+    for _ in range(args.repeat):
+        for _, frame, _ in frames:
+            detector.count(frame)
+    cpu_s = time.process_time() - started
+    fps = len(frames) * args.repeat / max(cpu_s, 1e-9)
+
+    agree = tp = fp = fn = 0
+    disagreements = []
+    for name, _, expected in frames:
+        predicted = counts[name] > 1
+        agree += predicted == expected
+        tp += predicted and expected
+        fp += predicted and not expected
+        fn += expected and not predicted
+        if predicted != expected:
+            disagreements.append(f"{name} (faces={counts[name]}, vision_api={expected})")
+
+    print(f"\n{'='*60}")
+    print(f"Fixtures:              {len(frames)}")
+    print(f"Frames/s per core:     {fps:.1f} ({1000 / fps:.1f}ms per frame)")
+    print(f"Agreement with API:    {agree}/{len(frames)} ({100 * agree / len(frames):.0f}%)")
+    print(f"Other people  TP/FP/FN: {tp}/{fp}/{fn}")
+    if disagreements:
+        print("Disagreements:")
+        for line in disagreements:
+            print(f"  • {line}")
+    print(f"{'='*60}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
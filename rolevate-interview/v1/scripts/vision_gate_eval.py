@@ -0,0 +1,97 @@
+"""
+Evaluate the vision frame-change gate on a recorded interview
+
+Replays frames sampled from a recording through FrameChangeGate and compares
+vision API calls against the old fixed 30s schedule. With a labels file it
+also checks that every change in labeled issues lands on an analyzed frame.
+
+Extract frames at the sampling interval first, e.g. every 5s:
+    ffmpeg -i interview.mp4 -vf fps=1/5 frames/%05d.jpg
+
+Labels (optional) map frame file names to the issues visible in them; frames
+not listed inherit the previous frame's issues:
+    {"00001.jpg": [], "00031.jpg": ["other_people_present"], "00040.jpg": []}
+
+Usage:
+    python -m v1.scripts.vision_gate_eval frames/ --labels labels.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+from ..core.config import settings
+from ..utils.frame_change import FrameChangeGate
+from ..utils.frame_encoding import downscale_rgba
+
+BASELINE_INTERVAL = 30.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("frames", type=Path, help="Directory of frames in time order")
+    parser.add_argument("--labels", type=Path, help="JSON of frame name -> issue list")
+    parser.add_argument("--sample-interval", type=float, default=settings.vision_sample_interval)
+    parser.add_argument("--max-interval", type=float, default=settings.vision_max_interval)
+    parser.add_argument("--hash-threshold", type=int, default=settings.vision_hash_threshold)
+    parser.add_argument("--hist-threshold", type=float, default=settings.vision_hist_threshold)
+    parser.add_argument("--area-threshold", type=float, default=settings.vision_area_threshold)
+    parser.add_argument("--tolerance", type=int, default=1, help="Frames an issue change may wait for a call")
+    args = parser.parse_args()
+
+    paths = sorted(p for p in args.frames.iterdir() if p.suffix.lower() in (".jpg", ".jpeg", ".png"))
+    if not paths:
+        print(f"No frames in {args.frames}")
+        return 1
+    labels = json.loads(args.labels.read_text()) if args.labels else {}
+
+    gate = FrameChangeGate(
+        hash_threshold=args.hash_threshold,
+        hist_threshold=args.hist_threshold,
+        area_threshold=args.area_threshold,
+        max_interval=args.max_interval
+    )
+    analyzed = []
+    for index, path in enumerate(paths):
+        # Same downscale the live sampler applies
+        image = Image.open(path).convert("RGBA")
+        frame = downscale_rgba(image.tobytes(), image.width, image.height, settings.vision_max_side)
+        now = index * args.sample_interval
+        reason = gate.check(frame, now=now)
+        if reason:
+            gate.mark_analyzed(now=now)
+            analyzed.append(index)
+            print(f"  {path.name:<16} {now:>7.0f}s  {reason}")
+
+    duration = len(paths) * args.sample_interval
+    baseline = int(duration // BASELINE_INTERVAL) + 1
+    print(f"\n{'='*60}")
+    print(f"Frames sampled:        {len(paths)} ({duration / 60:.1f} min)")
+    print(f"Baseline calls (30s):  {baseline}")
+    print(f"Gated calls:           {len(analyzed)} ({100 * (1 - len(analyzed) / baseline):.0f}% fewer)")
+
+    if labels:
+        # Indices where the labeled issue set changes
+        changes, current = [], None
+        for index, path in enumerate(paths):
+            issues = set(labels.get(path.name, current or []))
+            if current is not None and issues != current:
+                changes.append(index)
+            current = issues
+        analyzed_set = set(analyzed)
+        missed = [
+            paths[i].name for i in changes
+            if not any(i + k in analyzed_set for k in range(args.tolerance + 1))
+        ]
+        print(f"Issue changes caught:  {len(changes) - len(missed)}/{len(changes)}")
+        if missed:
+            print(f"Missed at:             {', '.join(missed)}")
+    print(f"{'='*60}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
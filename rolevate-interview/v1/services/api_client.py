@@ -12,6 +12,7 @@ import aiohttp
 from ..core.config import settings
 from ..core.models import InterviewContext, InterviewLanguage
 from ..core.exceptions import APIConnectionError, APIResponseError, APITimeoutError
+from .http_client import get_http_session, timed_request
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class RolevateAPIClient:
     Async client for Rolevate GraphQL API
     
     Implements:
-    - Connection pooling via aiohttp session
+    - Connection pooling via the shared process-wide aiohttp session
     - Proper error handling and retries
     - Request/response logging
     - Timeout management
@@ -45,13 +46,11 @@ class RolevateAPIClient:
     
     async def _ensure_session(self) -> None:
         """Ensure aiohttp session exists"""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+        self._session = await get_http_session()
     
     async def close(self) -> None:
-        """Close the aiohttp session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Release the session (the shared session itself stays open for reuse)"""
+        self._session = None
     
     async def fetch_interview_context(
         self, 
@@ -116,8 +115,10 @@ class RolevateAPIClient:
         logger.debug(f"Executing GraphQL query with variables: {variables}")
         
         try:
-            async with self._session.post(
+            async with timed_request(
+                "POST",
                 self.api_url,
+                name="graphql",
                 json=payload,
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=self.timeout)
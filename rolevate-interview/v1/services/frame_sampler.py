@@ -0,0 +1,99 @@
+"""
+Shared video frame sampler
+One long-lived VideoStream per track keeps only the latest frame, so vision
+monitoring and the vision tool never open their own streams. Frames are
+downscaled to the size the vision model uses before any copy or encode.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+from livekit import rtc
+
+from ..core.config import settings
+from ..utils.frame_encoding import downscale_rgba
+
+logger = logging.getLogger(__name__)
+
+
+def find_video_track(room: rtc.Room) -> Optional[rtc.RemoteVideoTrack]:
+    """The first remote participant's video track"""
+    for participant in room.remote_participants.values():
+        for publication in participant.track_publications.values():
+            if publication.kind == rtc.TrackKind.KIND_VIDEO and publication.track:
+                return publication.track
+        return None
+    return None
+
+
+class FrameSampler:
+    """Keeps the latest frame of one video track"""
+
+    def __init__(self, room: rtc.Room, track: rtc.RemoteVideoTrack, max_side: int):
+        self.room = room
+        self.track = track
+        self.max_side = max_side
+        self._latest: Optional[rtc.VideoFrame] = None
+        self._has_frame = asyncio.Event()
+        self._stream = rtc.VideoStream(track)
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def closed(self) -> bool:
+        return self._task.done()
+
+    async def _run(self) -> None:
+        try:
+            async for event in self._stream:
+                # Older frames are simply dropped
+                self._latest = event.frame
+                self._has_frame.set()
+        finally:
+            # A newer sampler may already have replaced this one for the track
+            if _samplers.get(self.track.sid) is self:
+                del _samplers[self.track.sid]
+            await self._stream.aclose()
+
+    async def capture(self, timeout: float = 5.0) -> Optional[np.ndarray]:
+        """Latest frame as a downscaled RGB array, converted off the event loop"""
+        try:
+            await asyncio.wait_for(self._has_frame.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Timeout waiting for video frame")
+            return None
+        return await asyncio.to_thread(self._prepare, self._latest)
+
+    def _prepare(self, frame: rtc.VideoFrame) -> np.ndarray:
+        rgba = frame.convert(rtc.VideoBufferType.RGBA)
+        return downscale_rgba(rgba.data, rgba.width, rgba.height, self.max_side)
+
+    async def aclose(self) -> None:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+_samplers: Dict[str, FrameSampler] = {}
+
+
+def get_frame_sampler(room: rtc.Room) -> Optional[FrameSampler]:
+    """Shared sampler for the candidate's video track, started on first use"""
+    track = find_video_track(room)
+    if not track:
+        return None
+    sampler = _samplers.get(track.sid)
+    if sampler is None or sampler.closed:
+        sampler = FrameSampler(room, track, settings.vision_max_side)
+        _samplers[track.sid] = sampler
+        logger.info(f"🎥 Frame sampler started for track {track.sid}")
+    return sampler
+
+
+async def close_frame_samplers(room: rtc.Room) -> None:
+    """Stop the samplers started for a room (job shutdown)"""
+    samplers = [sampler for sampler in _samplers.values() if sampler.room is room]
+    await asyncio.gather(*(sampler.aclose() for sampler in samplers))
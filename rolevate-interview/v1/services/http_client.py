@@ -0,0 +1,92 @@
+"""
+Shared HTTP client
+One pooled aiohttp session per process, so repeated calls to the same host
+(OpenAI vision, backend callbacks, GraphQL) reuse warm TLS connections
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _on_connection_create_end(session, trace_config_ctx, params) -> None:
+    if trace_config_ctx.trace_request_ctx is not None:
+        trace_config_ctx.trace_request_ctx.connection = "new connection"
+
+
+async def _on_connection_reuseconn(session, trace_config_ctx, params) -> None:
+    if trace_config_ctx.trace_request_ctx is not None:
+        trace_config_ctx.trace_request_ctx.connection = "reused connection"
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    return trace_config
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """The process-wide session, created on first use in the running loop"""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=settings.http_pool_limit,
+                limit_per_host=settings.http_limit_per_host,
+                keepalive_timeout=settings.http_keepalive_timeout,
+                ttl_dns_cache=settings.http_dns_cache_ttl
+            ),
+            timeout=aiohttp.ClientTimeout(total=settings.http_timeout),
+            trace_configs=[_trace_config()]
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared session (on job or worker shutdown)"""
+    global _session, _session_loop
+    if _session and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+@asynccontextmanager
+async def timed_request(method: str, url: str, name: str, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+    """
+    Make a request on the shared session and log how long it took
+
+    The time covers everything done with the response inside the block,
+    including reading the body.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        name: Short label for the log line, e.g. "vision_api"
+    """
+    session = await get_http_session()
+    ctx = SimpleNamespace(connection="no connection")
+    status = "error"
+    started = time.perf_counter()
+    try:
+        async with session.request(method, url, trace_request_ctx=ctx, **kwargs) as response:
+            status = response.status
+            yield response
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"⏱️ {name}: {status} in {elapsed_ms:.0f}ms ({ctx.connection})")
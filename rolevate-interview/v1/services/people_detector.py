@@ -0,0 +1,101 @@
+"""
+Local people counting
+Counts faces on sampled frames with OpenCV's YuNet detector (a ~230 KB ONNX
+model), so spotting extra people in frame does not need a vision API call.
+
+The model is not bundled; download it once:
+    curl -L -o models/face_detection_yunet_2023mar.onnx \\
+        https://github.com/opencv/opencv_zoo/raw/main/models/face_detection_yunet/face_detection_yunet_2023mar.onnx
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import cv2
+except ImportError:  # Optional dependency: the vision API check is used instead
+    cv2 = None
+
+
+class PeopleDetector:
+    """Face counter for downscaled RGB frames"""
+
+    def __init__(self, model_path: str, score_threshold: float):
+        self.model_path = model_path
+        self.score_threshold = score_threshold
+        # The detector keeps per-call state, so one caller at a time
+        self._lock = threading.Lock()
+        self._detector = cv2.FaceDetectorYN.create(model_path, "", (320, 320), score_threshold)
+        self._input_size = (320, 320)
+
+    def count(self, image: np.ndarray) -> int:
+        """Number of faces in an HxWx3 RGB frame"""
+        height, width = image.shape[:2]
+        bgr = np.ascontiguousarray(image[..., ::-1])
+        with self._lock:
+            if self._input_size != (width, height):
+                self._detector.setInputSize((width, height))
+                self._input_size = (width, height)
+            _, faces = self._detector.detect(bgr)
+        return 0 if faces is None else len(faces)
+
+
+class OtherPeopleState:
+    """
+    Debounced "other people in frame" flag from per-sample face counts
+    
+    The flag only flips after confirm_samples consecutive samples disagree
+    with it, so one missed or spurious face does not raise or clear an issue.
+    """
+
+    def __init__(self, confirm_samples: int):
+        self.confirm_samples = confirm_samples
+        self.present = False
+        self._streak = 0
+
+    def update(self, count: int) -> bool:
+        """Apply one sample's face count; returns True when the flag flipped"""
+        crowded = count > 1
+        if crowded == self.present:
+            self._streak = 0
+            return False
+        self._streak += 1
+        if self._streak < self.confirm_samples:
+            return False
+        self._streak = 0
+        self.present = crowded
+        return True
+
+
+_detector: Optional[PeopleDetector] = None
+_detector_lock = threading.Lock()
+_unavailable = False
+
+
+def get_people_detector() -> Optional[PeopleDetector]:
+    """The process-wide detector, or None when disabled or unavailable"""
+    global _detector, _unavailable
+    if not settings.vision_people_detector or _unavailable:
+        return None
+    with _detector_lock:
+        if _detector is None:
+            if cv2 is None:
+                logger.warning("opencv not installed, people check stays with the vision API")
+                _unavailable = True
+                return None
+            model_path = Path(settings.vision_face_model_path)
+            if not model_path.exists():
+                logger.warning(f"Face model not found at {model_path}, people check stays with the vision API")
+                _unavailable = True
+                return None
+            _detector = PeopleDetector(str(model_path), settings.vision_face_score_threshold)
+            logger.info(f"👥 Local people detector loaded: {model_path.name}")
+        return _detector
@@ -0,0 +1,156 @@
+"""
+Resumable multipart S3 upload
+Parts upload in parallel and every finished part is recorded in a manifest
+next to the file, so an interrupted upload resumes instead of starting over
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+MIN_PART_SIZE = 5 * MB  # S3 minimum for every part except the last
+MANIFEST_SUFFIX = ".upload.json"
+
+
+def manifest_path(file_path: Path) -> Path:
+    """Manifest location for a file: recordings/room.mp4 -> recordings/room.mp4.upload.json"""
+    return file_path.with_name(file_path.name + MANIFEST_SUFFIX)
+
+
+class ResumableUploader:
+    """Multipart uploader that persists part progress to a JSON manifest"""
+
+    def __init__(self, client, bucket: str, part_size: int, max_concurrency: int):
+        self.client = client
+        self.bucket = bucket
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.max_concurrency = max(1, max_concurrency)
+
+    def upload(self, file_path: Path, key: str) -> str:
+        """
+        Upload file_path, resuming from its manifest if one exists
+
+        Args:
+            file_path: Local file to upload
+            key: S3 key, used only when starting a new upload
+
+        Returns:
+            The S3 key the file was uploaded to
+        """
+        size = file_path.stat().st_size
+        manifest = self._load_manifest(file_path, size)
+        if manifest is None:
+            manifest = self._start(file_path, key, size)
+
+        key = manifest["key"]
+        part_size = manifest["part_size"]
+        total_parts = max(1, -(-size // part_size))
+        pending = [n for n in range(1, total_parts + 1) if str(n) not in manifest["parts"]]
+        resumed = total_parts - len(pending)
+        if resumed:
+            logger.info(f"♻️ Resuming upload {key}: {resumed}/{total_parts} parts already done")
+
+        lock = threading.Lock()
+        started = time.monotonic()
+
+        def upload_part(number: int) -> int:
+            offset = (number - 1) * part_size
+            with open(file_path, "rb") as f:
+                f.seek(offset)
+                body = f.read(part_size)
+            response = self.client.upload_part(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=manifest["upload_id"],
+                PartNumber=number,
+                Body=body
+            )
+            with lock:
+                manifest["parts"][str(number)] = response["ETag"]
+                self._save_manifest(file_path, manifest)
+            return len(body)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="s3-part") as pool:
+            uploaded = sum(pool.map(upload_part, pending))
+
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=manifest["upload_id"],
+            MultipartUpload={"Parts": [
+                {"PartNumber": int(n), "ETag": etag}
+                for n, etag in sorted(manifest["parts"].items(), key=lambda item: int(item[0]))
+            ]}
+        )
+        manifest_path(file_path).unlink(missing_ok=True)
+
+        elapsed = time.monotonic() - started
+        logger.info(
+            f"📊 Uploaded {uploaded / MB:.1f}MB of {size / MB:.1f}MB in {elapsed:.1f}s "
+            f"({uploaded / MB / max(elapsed, 1e-6):.1f}MB/s, {len(pending)} parts, "
+            f"{self.max_concurrency} parallel, {resumed} resumed)"
+        )
+        return key
+
+    def _start(self, file_path: Path, key: str, size: int) -> Dict:
+        response = self.client.create_multipart_upload(Bucket=self.bucket, Key=key)
+        manifest = {
+            "bucket": self.bucket,
+            "key": key,
+            "upload_id": response["UploadId"],
+            "size": size,
+            "part_size": self.part_size,
+            "parts": {}
+        }
+        self._save_manifest(file_path, manifest)
+        return manifest
+
+    def _load_manifest(self, file_path: Path, size: int) -> Optional[Dict]:
+        """Return a manifest that still matches the file and a live upload, else None"""
+        path = manifest_path(file_path)
+        if not path.exists():
+            return None
+        try:
+            manifest = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+            return None
+
+        if manifest.get("size") != size or manifest.get("bucket") != self.bucket:
+            logger.warning(f"Manifest {path} does not match file, starting over")
+            self._abort(manifest)
+            return None
+
+        # The upload may have been aborted or expired by a lifecycle rule
+        try:
+            self.client.list_parts(Bucket=self.bucket, Key=manifest["key"], UploadId=manifest["upload_id"])
+        except Exception as e:
+            logger.warning(f"Upload {manifest.get('upload_id')} no longer resumable, starting over: {e}")
+            return None
+        return manifest
+
+    def _abort(self, manifest: Dict) -> None:
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=manifest["bucket"],
+                Key=manifest["key"],
+                UploadId=manifest["upload_id"]
+            )
+        except Exception as e:
+            logger.warning(f"Could not abort upload {manifest.get('upload_id')}: {e}")
+
+    @staticmethod
+    def _save_manifest(file_path: Path, manifest: Dict) -> None:
+        # Write then rename so a crash never leaves a half-written manifest
+        path = manifest_path(file_path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, path)
@@ -2,17 +2,62 @@
 AWS S3 Service - Simplified
 """
 
+import asyncio
 import logging
+import threading
 import boto3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from ..core.config import settings
+from .resumable_upload import ResumableUploader
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+_client = None
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_s3_client():
+    """Return the process-wide S3 client (boto3 clients are thread-safe)"""
+    global _client
+    with _lock:
+        if _client is None:
+            _client = boto3.client(
+                's3',
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                region_name=settings.aws_region
+            )
+        return _client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.s3_max_workers,
+                thread_name_prefix="s3"
+            )
+        return _executor
+
+
+def _get_uploader() -> ResumableUploader:
+    return ResumableUploader(
+        get_s3_client(),
+        settings.aws_bucket_name,
+        part_size=settings.s3_multipart_chunksize_mb * MB,
+        max_concurrency=settings.s3_max_concurrency
+    )
+
 
 def upload_video_to_s3(file_path: str, application_id: str) -> str:
-    """Upload video to S3 and return URL"""
+    """Upload video to S3 and return URL (blocking - use upload_video_to_s3_async from async code)"""
     if not settings.aws_bucket_name:
         logger.warning("S3 not configured")
         return None
@@ -22,22 +67,19 @@ def upload_video_to_s3(file_path: str, application_id: str) -> str:
         return None
     
     try:
-        # Initialize S3 client
-        s3 = boto3.client(
-            's3',
-            aws_access_key_id=settings.aws_access_key_id,
-            aws_secret_access_key=settings.aws_secret_access_key,
-            region_name=settings.aws_region
-        )
+        s3 = get_s3_client()
         
         # Generate S3 key
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = Path(file_path).name
         s3_key = f"interviews/{application_id}/{timestamp}_{filename}"
         
-        # Upload
+        # Upload - large recordings go multipart and resume from their manifest
         logger.info(f"Uploading to S3: {s3_key}")
-        s3.upload_file(file_path, settings.aws_bucket_name, s3_key)
+        if Path(file_path).stat().st_size >= settings.s3_multipart_threshold_mb * MB:
+            s3_key = _get_uploader().upload(Path(file_path), s3_key)
+        else:
+            s3.upload_file(file_path, settings.aws_bucket_name, s3_key)
         
         # Return URL
         url = f"https://{settings.aws_bucket_name}.s3.{settings.aws_region}.amazonaws.com/{s3_key}"
@@ -48,3 +90,27 @@ def upload_video_to_s3(file_path: str, application_id: str) -> str:
         logger.error(f"❌ S3 upload failed: {e}")
         return None
 
+
+async def upload_video_to_s3_async(file_path: str, application_id: str) -> str:
+    """Upload video to S3 on the bounded S3 executor without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), upload_video_to_s3, file_path, application_id)
+
+
+def verify_upload(video_url: str, file_path: str) -> bool:
+    """Check the uploaded object exists and matches the local file size"""
+    prefix = f"https://{settings.aws_bucket_name}.s3.{settings.aws_region}.amazonaws.com/"
+    if not video_url or not video_url.startswith(prefix):
+        return False
+    try:
+        head = get_s3_client().head_object(Bucket=settings.aws_bucket_name, Key=video_url[len(prefix):])
+    except Exception as e:
+        logger.error(f"❌ S3 verify failed: {e}")
+        return False
+    return head["ContentLength"] == Path(file_path).stat().st_size
+
+
+async def verify_upload_async(video_url: str, file_path: str) -> bool:
+    """verify_upload on the bounded S3 executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), verify_upload, video_url, file_path)
@@ -0,0 +1,217 @@
+"""
+Persistent recording upload queue
+SQLite-backed so queued uploads survive job and worker restarts. Interview
+jobs only enqueue; the upload worker process drains the queue.
+
+Items are keyed on the file's path, size and mtime, so a recording written
+again under a reused room name is queued as a new upload.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Item lifecycle: pending -> uploading -> uploaded (verified in S3) -> done (backend linked)
+# Items that run out of attempts end up failed and are kept for inspection
+PENDING = "pending"
+UPLOADING = "uploading"
+UPLOADED = "uploaded"
+DONE = "done"
+FAILED = "failed"
+
+# Claimed uploaded items keep their status, so the lease keeps them from being claimed
+# again until it runs out or a retry is scheduled. Uploading items are never re-claimed
+# here (a long upload may outlive any lease); reset_in_flight returns the ones left by
+# a dead worker to pending when the worker starts
+CLAIM_LEASE_SECONDS = 300
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS recording_uploads (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_path TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    file_mtime REAL NOT NULL,
+    application_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    video_url TEXT,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (file_path, file_size, file_mtime)
+)
+"""
+
+
+def file_version(file_path: str) -> Tuple[int, float]:
+    """(size, mtime) identifying one recording written at a path"""
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime
+
+
+@dataclass
+class UploadItem:
+    """One queued recording"""
+    id: int
+    file_path: str
+    application_id: str
+    status: str
+    attempts: int
+    video_url: Optional[str]
+
+
+class UploadQueue:
+    """Recording upload queue stored in a SQLite file"""
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(SCHEMA)
+            self._migrate_legacy_table(conn)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """One transaction on a short-lived connection (job processes and the worker share the file)"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _migrate_legacy_table(conn: sqlite3.Connection) -> None:
+        """Carry over rows from the path-keyed uploads table; their file version is unknown (0, 0)"""
+        legacy = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'uploads'"
+        ).fetchone()
+        if not legacy:
+            return
+        conn.execute(
+            "INSERT OR IGNORE INTO recording_uploads "
+            "(id, file_path, file_size, file_mtime, application_id, status, attempts, next_attempt_at, "
+            "video_url, last_error, created_at, updated_at) "
+            "SELECT id, file_path, 0, 0, application_id, status, attempts, next_attempt_at, "
+            "video_url, last_error, created_at, updated_at FROM uploads"
+        )
+        conn.execute("DROP TABLE uploads")
+        logger.info("Migrated upload queue to per-file-version rows")
+
+    def enqueue(self, file_path: str, application_id: str) -> bool:
+        """Queue a recording; returns False if this version of the file is already queued"""
+        size, mtime = file_version(file_path)
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO recording_uploads "
+                "(file_path, file_size, file_mtime, application_id, status, next_attempt_at, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (str(file_path), size, mtime, application_id, PENDING, now, now, now)
+            )
+        queued = cursor.rowcount > 0
+        if queued:
+            logger.info(f"📥 Queued upload: {file_path}")
+        return queued
+
+    def claim_due(self, limit: int) -> List[UploadItem]:
+        """Claim up to limit items whose next attempt is due"""
+        if limit <= 0:
+            return []
+        now = time.time()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM recording_uploads WHERE status IN (?, ?) AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (PENDING, UPLOADED, now, limit)
+            ).fetchall()
+            # Uploaded items only need the backend callback, so they keep their status
+            conn.executemany(
+                "UPDATE recording_uploads SET status = CASE status WHEN ? THEN ? ELSE status END, "
+                "next_attempt_at = ?, updated_at = ? WHERE id = ?",
+                [(PENDING, UPLOADING, now + CLAIM_LEASE_SECONDS, now, row["id"]) for row in rows]
+            )
+        return [
+            UploadItem(
+                id=row["id"],
+                file_path=row["file_path"],
+                application_id=row["application_id"],
+                status=UPLOADING if row["status"] == PENDING else row["status"],
+                attempts=row["attempts"],
+                video_url=row["video_url"]
+            )
+            for row in rows
+        ]
+
+    def mark_uploaded(self, item_id: int, video_url: str) -> None:
+        """Record a verified upload; the backend callback is still outstanding"""
+        self._update(item_id, status=UPLOADED, video_url=video_url, attempts=0, last_error=None)
+
+    def mark_done(self, item_id: int) -> None:
+        self._update(item_id, status=DONE, last_error=None)
+
+    def mark_retry(
+        self,
+        item: UploadItem,
+        error: str,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float
+    ) -> str:
+        """Schedule the next attempt with exponential backoff, or give up; returns the new status"""
+        attempts = item.attempts + 1
+        if attempts >= max_attempts:
+            status = FAILED
+        else:
+            # A verified upload is never repeated, only its callback
+            status = UPLOADED if item.video_url else PENDING
+        delay = min(base_delay * (2 ** (attempts - 1)), max_delay)
+        self._update(
+            item.id,
+            status=status,
+            attempts=attempts,
+            last_error=error[:500],
+            next_attempt_at=time.time() + delay
+        )
+        return status
+
+    def reset_in_flight(self) -> int:
+        """Return items left in uploading by a dead worker to pending"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE recording_uploads SET status = ?, next_attempt_at = ?, updated_at = ? WHERE status = ?",
+                (PENDING, time.time(), time.time(), UPLOADING)
+            )
+        return cursor.rowcount
+
+    def is_queued(self, file_path: str) -> bool:
+        """Whether this version of the file has a row, or the path has an unfinished one"""
+        size, mtime = file_version(file_path)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM recording_uploads WHERE file_path = ? AND "
+                "((file_size = ? AND file_mtime = ?) OR status NOT IN (?, ?))",
+                (str(file_path), size, mtime, DONE, FAILED)
+            ).fetchone()
+        return row is not None
+
+    def counts(self) -> dict:
+        """Number of items per status"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM recording_uploads GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def _update(self, item_id: int, **fields) -> None:
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE recording_uploads SET {columns} WHERE id = ?", (*fields.values(), item_id))
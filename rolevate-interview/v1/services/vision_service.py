@@ -4,15 +4,18 @@ Vision Analysis Service - Monitor interview environment
 
 import logging
 import asyncio
-import base64
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pathlib import Path
 
 import aiohttp
 from livekit import rtc
 
 from ..core.config import settings
+from .frame_sampler import get_frame_sampler
+from .http_client import timed_request
+from .people_detector import OtherPeopleState, get_people_detector
+from ..utils.frame_change import FrameChangeGate
+from ..utils.frame_encoding import encode_jpeg
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,15 @@ class VisionAnalyzer:
         self.is_running = False
         self.analysis_task = None
         self.current_issues = set()
+        self.llm_issues = set()
+        self.people_detector = get_people_detector()
+        self.other_people = OtherPeopleState(settings.vision_people_confirm_samples)
+        self.gate = FrameChangeGate(
+            hash_threshold=settings.vision_hash_threshold,
+            hist_threshold=settings.vision_hist_threshold,
+            area_threshold=settings.vision_area_threshold,
+            max_interval=settings.vision_max_interval
+        )
         
     async def start(self):
         """Start continuous monitoring"""
@@ -45,95 +57,74 @@ class VisionAnalyzer:
                 await self.analysis_task
             except asyncio.CancelledError:
                 pass
-        logger.info("🎥 Vision monitoring stopped")
+        logger.info(
+            f"🎥 Vision monitoring stopped - {self.gate.sent} of {self.gate.sampled} "
+            f"sampled frames sent for analysis"
+        )
     
     async def _monitor_loop(self):
-        """Main monitoring loop - analyze every 30 seconds"""
+        """Main monitoring loop - sample frames, analyze the ones that changed"""
         await asyncio.sleep(5)  # Wait 5s for video to start
         
         while self.is_running:
             try:
                 await self._analyze_frame()
-                await asyncio.sleep(30)  # Check every 30 seconds
+                await asyncio.sleep(settings.vision_sample_interval)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Vision analysis error: {e}")
-                await asyncio.sleep(30)
+                await asyncio.sleep(settings.vision_sample_interval)
     
     async def _analyze_frame(self):
         """Capture and analyze current video frame"""
-        # Get participant's video track
-        participant = await self._get_remote_participant()
-        if not participant:
+        sampler = get_frame_sampler(self.room)
+        if not sampler:
             return
         
-        video_track = self._get_video_track(participant)
-        if not video_track:
+        # Latest frame, already downscaled to the size the vision model uses
+        frame = await sampler.capture()
+        if frame is None:
             return
         
-        # Capture frame
-        frame_data = await self._capture_frame(video_track)
-        if not frame_data:
+        # Count people locally on every sample
+        if self.people_detector:
+            count = await asyncio.to_thread(self.people_detector.count, frame)
+            await self._update_people(count)
+        
+        # Skip frames that look like the last analyzed one
+        reason = await asyncio.to_thread(self.gate.check, frame)
+        if not reason:
             return
+        logger.info(f"Analyzing frame: {reason}")
         
         # Analyze with GPT-4 Vision
+        frame_data = await asyncio.to_thread(encode_jpeg, frame, settings.vision_jpeg_quality)
         analysis = await self._analyze_with_vision(frame_data)
         if analysis:
+            self.gate.mark_analyzed()
             await self._handle_analysis_result(analysis)
     
-    async def _get_remote_participant(self) -> Optional[rtc.RemoteParticipant]:
-        """Get the interview participant"""
-        for participant in self.room.remote_participants.values():
-            return participant
-        return None
-    
-    def _get_video_track(self, participant) -> Optional[rtc.RemoteVideoTrack]:
-        """Get participant's video track"""
-        for publication in participant.track_publications.values():
-            if publication.kind == rtc.TrackKind.KIND_VIDEO and publication.track:
-                return publication.track
-        return None
-    
-    async def _capture_frame(self, video_track) -> Optional[str]:
-        """Capture frame and convert to base64"""
-        try:
-            # Get video frame
-            frame = await video_track.get_frame()
-            if not frame:
-                return None
-            
-            # Convert to JPEG and encode base64
-            # Note: You may need to use frame.to_image() depending on LiveKit version
-            # This is a simplified example - adjust based on actual LiveKit API
-            image_data = frame.data  # Get raw frame data
-            base64_image = base64.b64encode(image_data).decode('utf-8')
-            
-            return base64_image
-            
-        except Exception as e:
-            logger.error(f"Frame capture failed: {e}")
-            return None
-    
     async def _analyze_with_vision(self, frame_data: str) -> Optional[Dict[str, Any]]:
         """Analyze frame using OpenAI GPT-4 Vision"""
         try:
-            async with aiohttp.ClientSession() as session:
-                response = await session.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {settings.openai.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "gpt-4o",
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": """Analyze this interview environment image and check for:
+            async with timed_request(
+                "POST",
+                "https://api.openai.com/v1/chat/completions",
+                name="vision_api",
+                headers={
+                    "Authorization": f"Bearer {settings.openai.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "gpt-4o",
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": [
+                                {
+                                    "type": "text",
+                                    "text": """Analyze this interview environment image and check for:
 1. Is the person smoking? (yes/no)
 2. Is the person wearing professional/appropriate attire? (yes/no)
 3. Are there other people visible in the background? (yes/no)
@@ -147,20 +138,20 @@ Respond in JSON format:
     "environment_rating": number,
     "notes": "brief description"
 }"""
-                                    },
-                                    {
-                                        "type": "image_url",
-                                        "image_url": {
-                                            "url": f"data:image/jpeg;base64,{frame_data}"
-                                        }
+                                },
+                                {
+                                    "type": "image_url",
+                                    "image_url": {
+                                        "url": f"data:image/jpeg;base64,{frame_data}"
                                     }
-                                ]
-                            }
-                        ],
-                        "max_tokens": 300
-                    },
-                    timeout=aiohttp.ClientTimeout(total=10)
-                )
+                                }
+                            ]
+                        }
+                    ],
+                    "max_tokens": 300
+                },
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
                 
                 if response.status == 200:
                     result = await response.json()
@@ -192,7 +183,8 @@ Respond in JSON format:
             issues.append("inappropriate_attire")
             logger.warning("⚠️ Inappropriate attire detected")
         
-        if analysis.get("other_people"):
+        # The local detector owns the people check when it is available
+        if not self.people_detector and analysis.get("other_people"):
             issues.append("other_people_present")
             logger.warning("⚠️ Other people detected in background")
         
@@ -201,12 +193,30 @@ Respond in JSON format:
             issues.append("poor_environment")
             logger.warning(f"⚠️ Poor environment rating: {rating}/5")
         
+        self.llm_issues = set(issues)
+        await self._update_issues(analysis)
+    
+    async def _update_people(self, count: int):
+        """Apply a local face count; the state flips after consecutive agreeing samples"""
+        if not self.other_people.update(count):
+            return
+        
+        if self.other_people.present:
+            logger.warning(f"⚠️ Other people detected in background ({count} faces)")
+        await self._update_issues({"people_count": count, "source": "local_detector"})
+    
+    async def _update_issues(self, analysis: Dict[str, Any]):
+        """Merge vision API and local detector issues and report new ones"""
+        issues = set(self.llm_issues)
+        if self.other_people.present:
+            issues.add("other_people_present")
+        
         # Store new issues
-        new_issues = set(issues) - self.current_issues
+        new_issues = issues - self.current_issues
         if new_issues:
             await self._report_issues(analysis, list(new_issues))
         
-        self.current_issues = set(issues)
+        self.current_issues = issues
     
     async def _report_issues(self, analysis: Dict[str, Any], issues: list):
         """Report issues to backend"""
@@ -214,16 +224,18 @@ Respond in JSON format:
             return
         
         try:
-            async with aiohttp.ClientSession() as session:
-                await session.post(
-                    f"{settings.backend_url}/applications/{self.application_id}/environment-issues",
-                    json={
-                        "timestamp": datetime.now().isoformat(),
-                        "issues": issues,
-                        "analysis": analysis
-                    },
-                    timeout=aiohttp.ClientTimeout(total=5)
-                )
+            async with timed_request(
+                "POST",
+                f"{settings.backend_url}/applications/{self.application_id}/environment-issues",
+                name="environment_issues",
+                json={
+                    "timestamp": datetime.now().isoformat(),
+                    "issues": issues,
+                    "analysis": analysis
+                },
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                response.raise_for_status()
                 logger.info(f"📊 Issues reported: {', '.join(issues)}")
         except Exception as e:
             logger.error(f"Failed to report issues: {e}")
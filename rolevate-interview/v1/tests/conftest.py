@@ -0,0 +1,8 @@
+"""Test configuration: tests import the package as v1.*, from any working directory."""
+import sys
+from pathlib import Path
+
+# rolevate-interview/, the directory that contains the v1 package
+PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
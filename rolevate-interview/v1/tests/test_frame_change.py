@@ -0,0 +1,123 @@
+"""Tests for the frame change gate."""
+import numpy as np
+
+from v1.utils.frame_change import FrameChangeGate, FrameSignature
+
+# Thresholds no frame can reach, so each test enables only the check it covers
+NEVER_HASH = 65
+NEVER_HIST = 2.0
+NEVER_AREA = 2.0
+
+
+def scene(size=64):
+    """RGBA frame with a horizontal gradient, so the hash has structure"""
+    gradient = np.tile(np.linspace(30, 220, size, dtype=np.float32), (size, 1))
+    frame = np.empty((size, size, 4), dtype=np.uint8)
+    frame[..., :3] = gradient[..., None].astype(np.uint8)
+    frame[..., 3] = 255
+    return frame
+
+
+def with_patch(frame, fraction):
+    """Copy of frame with a black square covering about fraction of it"""
+    changed = frame.copy()
+    side = int(frame.shape[0] * fraction ** 0.5)
+    changed[:side, :side, :3] = 0
+    return changed
+
+
+def gate(hash_threshold=NEVER_HASH, hist_threshold=NEVER_HIST, area_threshold=NEVER_AREA, max_interval=1e9):
+    return FrameChangeGate(hash_threshold, hist_threshold, area_threshold, max_interval)
+
+
+class TestFrameSignature:
+    """Test suite for FrameSignature."""
+
+    def test_identical_frames_have_zero_distance(self):
+        """Test a frame compared with itself shows no change."""
+        signature = FrameSignature.from_frame(scene())
+        assert signature.distance(FrameSignature.from_frame(scene())) == (0, 0.0, 0.0)
+
+    def test_changed_area_is_the_patched_fraction(self):
+        """Test the area distance tracks how much of the frame changed."""
+        base = FrameSignature.from_frame(scene())
+        _, hist_delta, changed_area = base.distance(FrameSignature.from_frame(with_patch(scene(), 0.25)))
+        assert 0.2 <= changed_area <= 0.3
+        assert hist_delta > 0
+
+    def test_accepts_rgb_frames(self):
+        """Test frames without an alpha channel give the same signature."""
+        rgba = FrameSignature.from_frame(scene())
+        rgb = FrameSignature.from_frame(scene()[..., :3])
+        assert rgba.distance(rgb) == (0, 0.0, 0.0)
+
+
+class TestFrameChangeGate:
+    """Test suite for FrameChangeGate."""
+
+    def test_first_frame_is_always_sent(self):
+        """Test the first frame passes until one is analyzed."""
+        g = gate()
+        assert g.check(scene(), now=0) == "first_frame"
+        assert g.check(scene(), now=1) == "first_frame"
+        g.mark_analyzed(now=1)
+        assert g.check(scene(), now=2) is None
+        assert (g.sampled, g.sent) == (3, 1)
+
+    def test_unchanged_frame_is_skipped(self):
+        """Test a frame like the reference is skipped under every threshold."""
+        g = gate(hash_threshold=10, hist_threshold=0.2, area_threshold=0.04, max_interval=120)
+        g.check(scene(), now=0)
+        g.mark_analyzed(now=0)
+        assert g.check(scene(), now=60) is None
+
+    def test_area_change_is_sent(self):
+        """Test someone entering part of the frame counts as a change."""
+        g = gate(area_threshold=0.04)
+        g.check(scene(), now=0)
+        g.mark_analyzed(now=0)
+        assert g.check(with_patch(scene(), 0.01), now=1) is None
+        assert g.check(with_patch(scene(), 0.1), now=2).startswith("scene_change(area=")
+
+    def test_hash_and_histogram_changes_are_sent(self):
+        """Test a different scene trips the hash and histogram checks."""
+        flipped = scene()[:, ::-1].copy()
+        g = gate(hash_threshold=10)
+        g.check(scene(), now=0)
+        g.mark_analyzed(now=0)
+        assert g.check(flipped, now=1).startswith("scene_change(hash=")
+
+        g = gate(hist_threshold=0.2)
+        g.check(scene(), now=0)
+        g.mark_analyzed(now=0)
+        assert g.check(with_patch(scene(), 0.5), now=1).startswith("scene_change(hist=")
+
+    def test_max_interval_forces_a_frame(self):
+        """Test an unchanged frame is still sent once max_interval has passed."""
+        g = gate(max_interval=120)
+        g.check(scene(), now=0)
+        g.mark_analyzed(now=0)
+        assert g.check(scene(), now=119) is None
+        assert g.check(scene(), now=120) == "max_interval"
+
+    def test_reference_only_advances_on_mark_analyzed(self):
+        """Test a change stays pending while the vision call has not succeeded."""
+        changed = with_patch(scene(), 0.1)
+        g = gate(area_threshold=0.04)
+        g.check(scene(), now=0)
+        g.mark_analyzed(now=0)
+
+        assert g.check(changed, now=1) is not None
+        # The call failed, so the same frame is still a change
+        assert g.check(changed, now=2) is not None
+        g.mark_analyzed(now=2)
+        assert g.check(changed, now=3) is None
+        assert g.sent == 2
+
+    def test_mark_analyzed_without_candidate_is_ignored(self):
+        """Test marking twice does not count a second analysis."""
+        g = gate()
+        g.check(scene(), now=0)
+        g.mark_analyzed(now=0)
+        g.mark_analyzed(now=1)
+        assert g.sent == 1
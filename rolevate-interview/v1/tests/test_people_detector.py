@@ -0,0 +1,40 @@
+"""Tests for the debounced other-people flag."""
+from v1.services.people_detector import OtherPeopleState
+
+
+class TestOtherPeopleState:
+    """Test suite for OtherPeopleState."""
+
+    def test_flips_after_confirm_samples(self):
+        """Test N consecutive crowded samples raise the flag, and only the last one reports the flip."""
+        state = OtherPeopleState(confirm_samples=3)
+        assert [state.update(2) for _ in range(3)] == [False, False, True]
+        assert state.present is True
+
+    def test_single_misdetection_is_ignored(self):
+        """Test one spurious extra face between normal samples does not raise the flag."""
+        state = OtherPeopleState(confirm_samples=2)
+        for count in [1, 2, 1, 1, 2, 1]:
+            assert state.update(count) is False
+        assert state.present is False
+
+    def test_single_missed_face_does_not_clear(self):
+        """Test one sample without the second person does not clear a raised flag."""
+        state = OtherPeopleState(confirm_samples=2)
+        state.update(3)
+        state.update(3)
+        assert state.present is True
+
+        assert state.update(1) is False
+        assert state.update(2) is False
+        assert state.present is True
+
+        assert [state.update(0), state.update(1)] == [False, True]
+        assert state.present is False
+
+    def test_confirm_one_flips_immediately(self):
+        """Test confirm_samples=1 follows every sample."""
+        state = OtherPeopleState(confirm_samples=1)
+        assert state.update(2) is True
+        assert state.update(1) is True
+        assert state.present is False
@@ -0,0 +1,238 @@
+"""Tests for the persistent recording upload queue."""
+import os
+import sqlite3
+
+import pytest
+
+from v1.services import upload_queue as queue_module
+from v1.services.upload_queue import (
+    CLAIM_LEASE_SECONDS,
+    DONE,
+    FAILED,
+    PENDING,
+    UPLOADED,
+    UPLOADING,
+    UploadQueue,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the queue's clock so due times are exact."""
+    fake = FakeClock()
+    monkeypatch.setattr(queue_module.time, "time", fake.time)
+    return fake
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """A queue on a fresh SQLite file."""
+    return UploadQueue(str(tmp_path / "uploads.db"))
+
+
+def recording(tmp_path, name="room_app1.mp4", data=b"video", mtime=500):
+    path = tmp_path / name
+    path.write_bytes(data)
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+class TestClaimDue:
+    """Test suite for claiming due items."""
+
+    def test_claims_pending_items_once(self, queue, tmp_path, clock):
+        """Test a claimed item moves to uploading and is not handed out again."""
+        queue.enqueue(recording(tmp_path, "a_app1.mp4"), "app1")
+        queue.enqueue(recording(tmp_path, "b_app2.mp4"), "app2")
+
+        first = queue.claim_due(1)
+        assert [(item.application_id, item.status) for item in first] == [("app1", UPLOADING)]
+        assert [item.application_id for item in queue.claim_due(5)] == ["app2"]
+        assert queue.claim_due(5) == []
+        assert queue.claim_due(0) == []
+
+        clock.now += CLAIM_LEASE_SECONDS + 1
+        assert queue.claim_due(5) == []
+
+    def test_uploaded_item_is_leased(self, queue, tmp_path, clock):
+        """Test an uploaded item keeps its status and is due again only after the lease."""
+        queue.enqueue(recording(tmp_path), "app1")
+        item = queue.claim_due(1)[0]
+        queue.mark_uploaded(item.id, "https://bucket/video.mp4")
+        # Still under the lease of the claim that uploaded it
+        assert queue.claim_due(1) == []
+
+        clock.now += CLAIM_LEASE_SECONDS
+        claimed = queue.claim_due(1)
+        assert [(i.status, i.video_url) for i in claimed] == [(UPLOADED, "https://bucket/video.mp4")]
+        assert queue.claim_due(1) == []
+        clock.now += CLAIM_LEASE_SECONDS
+        assert [i.id for i in queue.claim_due(1)] == [item.id]
+
+    def test_not_due_before_next_attempt(self, queue, tmp_path, clock):
+        """Test an item scheduled for retry waits for its backoff."""
+        queue.enqueue(recording(tmp_path), "app1")
+        item = queue.claim_due(1)[0]
+        queue.mark_retry(item, "boom", max_attempts=5, base_delay=10, max_delay=100)
+
+        clock.now += 9
+        assert queue.claim_due(1) == []
+        clock.now += 1
+        assert len(queue.claim_due(1)) == 1
+
+
+class TestMarkRetry:
+    """Test suite for retry scheduling."""
+
+    def retry(self, queue, item, clock):
+        status = queue.mark_retry(item, "boom", max_attempts=4, base_delay=10, max_delay=25)
+        clock.now += 1000
+        claimed = queue.claim_due(1)
+        return status, claimed[0] if claimed else None
+
+    def test_backoff_doubles_up_to_max(self, queue, tmp_path, clock):
+        """Test delays of base * 2^(n-1), capped at max_delay."""
+        queue.enqueue(recording(tmp_path), "app1")
+        item = queue.claim_due(1)[0]
+        delays = []
+        for attempts in range(3):
+            item.attempts = attempts
+            started = clock.now
+            queue.mark_retry(item, "boom", max_attempts=10, base_delay=10, max_delay=25)
+            with sqlite3.connect(queue.db_path) as conn:
+                due = conn.execute("SELECT next_attempt_at FROM recording_uploads").fetchone()[0]
+            delays.append(due - started)
+        assert delays == [10, 20, 25]
+
+    def test_unverified_upload_is_retried_from_scratch(self, queue, tmp_path, clock):
+        """Test an item without a video URL goes back to pending."""
+        queue.enqueue(recording(tmp_path), "app1")
+        status, item = self.retry(queue, queue.claim_due(1)[0], clock)
+        assert status == PENDING
+        assert (item.status, item.attempts, item.video_url) == (UPLOADING, 1, None)
+
+    def test_verified_upload_only_retries_callback(self, queue, tmp_path, clock):
+        """Test an item with a video URL stays uploaded so the upload is not repeated."""
+        queue.enqueue(recording(tmp_path), "app1")
+        item = queue.claim_due(1)[0]
+        queue.mark_uploaded(item.id, "https://bucket/video.mp4")
+        item.video_url = "https://bucket/video.mp4"
+        item.attempts = 0
+
+        status, item = self.retry(queue, item, clock)
+        assert status == UPLOADED
+        assert (item.status, item.video_url) == (UPLOADED, "https://bucket/video.mp4")
+
+    def test_gives_up_after_max_attempts(self, queue, tmp_path, clock):
+        """Test the last allowed attempt marks the item failed."""
+        queue.enqueue(recording(tmp_path), "app1")
+        item = queue.claim_due(1)[0]
+        item.attempts = 3
+        status, claimed = self.retry(queue, item, clock)
+        assert (status, claimed) == (FAILED, None)
+        assert queue.counts() == {FAILED: 1}
+
+
+class TestResetInFlight:
+    """Test suite for recovering interrupted uploads."""
+
+    def test_uploading_items_return_to_pending(self, queue, tmp_path, clock):
+        """Test items left uploading by a dead worker can be claimed again."""
+        queue.enqueue(recording(tmp_path), "app1")
+        item = queue.claim_due(1)[0]
+
+        assert queue.reset_in_flight() == 1
+        assert queue.counts() == {PENDING: 1}
+        assert [i.id for i in queue.claim_due(1)] == [item.id]
+
+    def test_uploaded_items_are_left_alone(self, queue, tmp_path, clock):
+        """Test a verified upload is not reset to pending."""
+        queue.enqueue(recording(tmp_path), "app1")
+        item = queue.claim_due(1)[0]
+        queue.mark_uploaded(item.id, "https://bucket/video.mp4")
+
+        assert queue.reset_in_flight() == 0
+        assert queue.counts() == {UPLOADED: 1}
+
+
+class TestIsQueued:
+    """Test suite for file version matching."""
+
+    def test_same_version_is_queued_once(self, queue, tmp_path):
+        """Test enqueueing the same file version twice keeps one row, even once done."""
+        path = recording(tmp_path)
+        assert queue.enqueue(path, "app1") is True
+        assert queue.enqueue(path, "app1") is False
+        assert queue.is_queued(path)
+
+        queue.mark_done(queue.claim_due(1)[0].id)
+        assert queue.is_queued(path)
+
+    def test_rewritten_file_is_a_new_upload(self, queue, tmp_path):
+        """Test a finished row does not hide a new recording at the same path."""
+        path = recording(tmp_path)
+        queue.enqueue(path, "app1")
+        queue.mark_done(queue.claim_due(1)[0].id)
+
+        recording(tmp_path, data=b"new video", mtime=900)
+        assert not queue.is_queued(path)
+        assert queue.enqueue(path, "app1") is True
+        assert queue.counts() == {DONE: 1, PENDING: 1}
+
+    def test_unfinished_row_covers_any_version(self, queue, tmp_path):
+        """Test a file still growing is not queued again while its path is in progress."""
+        path = recording(tmp_path)
+        queue.enqueue(path, "app1")
+
+        recording(tmp_path, data=b"longer video", mtime=900)
+        assert queue.is_queued(path)
+
+
+class TestLegacyMigration:
+    """Test suite for the path-keyed table migration."""
+
+    def test_rows_are_carried_over(self, tmp_path):
+        """Test rows from the old uploads table survive with an unknown file version."""
+        db_path = tmp_path / "uploads.db"
+        path = recording(tmp_path)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE uploads (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, file_path TEXT NOT NULL UNIQUE,
+                    application_id TEXT NOT NULL, status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0, next_attempt_at REAL NOT NULL,
+                    video_url TEXT, last_error TEXT,
+                    created_at REAL NOT NULL, updated_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "INSERT INTO uploads (file_path, application_id, status, attempts, next_attempt_at, "
+                "video_url, created_at, updated_at) VALUES (?, 'app1', ?, 2, 0, 'https://bucket/v.mp4', 0, 0)",
+                (path, UPLOADED)
+            )
+        conn.close()
+
+        queue = UploadQueue(str(db_path))
+
+        with sqlite3.connect(db_path) as conn:
+            tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            version = conn.execute("SELECT file_size, file_mtime FROM recording_uploads").fetchone()
+        conn.close()
+        assert "uploads" not in tables
+        assert version == (0, 0)
+        item = queue.claim_due(1)[0]
+        assert (item.application_id, item.status, item.attempts) == ("app1", UPLOADED, 2)
+        assert queue.is_queued(path)
+
+        # Opening the queue again finds nothing left to migrate
+        assert UploadQueue(str(db_path)).counts() == {UPLOADED: 1}
@@ -2,8 +2,8 @@
 Vision Analysis Tool - LLM-accessible function for environment monitoring
 """
 
+import asyncio
 import logging
-import base64
 from typing import Optional, Dict, Any
 import json
 
@@ -12,6 +12,9 @@ from livekit import rtc
 from livekit.agents import llm
 
 from ..core.config import settings
+from ..services.frame_sampler import get_frame_sampler
+from ..services.http_client import timed_request
+from ..utils.frame_encoding import encode_jpeg
 
 logger = logging.getLogger(__name__)
 
@@ -66,75 +69,20 @@ class EnvironmentAnalysisTool(llm.ToolContext):
     async def _capture_current_frame(self) -> Optional[str]:
         """Capture current video frame from participant"""
         try:
-            # Get remote participant
-            participant = None
-            for p in self.room.remote_participants.values():
-                participant = p
-                break
-            
-            if not participant:
-                logger.warning("No remote participant found")
-                return None
-            
-            # Get video track
-            video_track = None
-            for publication in participant.track_publications.values():
-                if publication.kind == rtc.TrackKind.KIND_VIDEO and publication.track:
-                    video_track = publication.track
-                    break
-            
-            if not video_track:
+            # Shared sampler keeps the latest frame, so no stream is opened per call
+            sampler = get_frame_sampler(self.room)
+            if not sampler:
                 logger.warning("No video track found")
                 return None
             
-            # Create video stream and get frame
-            video_stream = rtc.VideoStream(video_track)
-            
-            # Get one frame with timeout
-            import asyncio
-            try:
-                frame_event = await asyncio.wait_for(video_stream.__anext__(), timeout=5.0)
-                frame = frame_event.frame
-            except asyncio.TimeoutError:
-                logger.warning("Timeout waiting for video frame")
-                await video_stream.aclose()
-                return None
-            finally:
-                await video_stream.aclose()
-            
-            if not frame:
+            frame = await sampler.capture()
+            if frame is None:
                 return None
             
-            # Convert frame to RGB format for PIL
-            from PIL import Image
-            import io
-            
-            # Convert to ARGB format which PIL can handle
-            # VideoBufferType.RGBA = 1
-            rgb_frame = frame.convert(1)  # Convert to RGBA
-            
-            # Get dimensions
-            width = rgb_frame.width
-            height = rgb_frame.height
-            
-            # Get the raw bytes
-            # The data is in RGBA format now
-            img_data = bytes(rgb_frame.data)
-            
-            # Create PIL Image from RGBA data
-            img = Image.frombytes('RGBA', (width, height), img_data)
-            
-            # Convert to RGB (remove alpha channel)
-            img = img.convert('RGB')
-            
-            # Convert to JPEG bytes
-            buffer = io.BytesIO()
-            img.save(buffer, format='JPEG', quality=85)
-            jpeg_bytes = buffer.getvalue()
-            
-            # Encode as base64
-            base64_image = base64.b64encode(jpeg_bytes).decode('utf-8')
+            # Encode to JPEG off the event loop
+            base64_image = await asyncio.to_thread(encode_jpeg, frame, settings.vision_jpeg_quality)
             
+            height, width = frame.shape[:2]
             logger.info(f"✅ Frame captured: {width}x{height}, {len(base64_image)} base64 chars")
             return base64_image
             
@@ -145,22 +93,23 @@ class EnvironmentAnalysisTool(llm.ToolContext):
     async def _analyze_with_vision(self, frame_data: str) -> Optional[Dict[str, Any]]:
         """Analyze frame using OpenAI GPT-4 Vision"""
         try:
-            async with aiohttp.ClientSession() as session:
-                response = await session.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {settings.openai.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "gpt-4o",
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": """Analyze this interview environment and provide:
+            async with timed_request(
+                "POST",
+                "https://api.openai.com/v1/chat/completions",
+                name="vision_api",
+                headers={
+                    "Authorization": f"Bearer {settings.openai.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "gpt-4o",
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": [
+                                {
+                                    "type": "text",
+                                    "text": """Analyze this interview environment and provide:
 1. smoking: Is the person smoking or are there cigarettes/vaping devices visible? (true/false)
 2. professional_attire: Is the person wearing professional interview-appropriate clothing? (true/false)
 3. other_people: Are there other people visible in frame or background? (true/false)
@@ -179,20 +128,20 @@ Respond ONLY with valid JSON in this exact format:
     "background": "good",
     "notes": "Clean professional setup with good lighting"
 }"""
-                                    },
-                                    {
-                                        "type": "image_url",
-                                        "image_url": {
-                                            "url": f"data:image/jpeg;base64,{frame_data}"
-                                        }
+                                },
+                                {
+                                    "type": "image_url",
+                                    "image_url": {
+                                        "url": f"data:image/jpeg;base64,{frame_data}"
                                     }
-                                ]
-                            }
-                        ],
-                        "max_tokens": 300
-                    },
-                    timeout=aiohttp.ClientTimeout(total=15)
-                )
+                                }
+                            ]
+                        }
+                    ],
+                    "max_tokens": 300
+                },
+                timeout=aiohttp.ClientTimeout(total=15)
+            ) as response:
                 
                 response_text = await response.text()
                 logger.info(f"Vision API response status: {response.status}")
@@ -0,0 +1,129 @@
+"""
+Recording upload worker
+Drains the persistent upload queue in its own process, so uploads are not
+tied to the lifetime of interview job processes.
+
+Run with: python -m v1.upload_worker
+"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Set
+
+import aiohttp
+
+from .core.config import settings
+from .services.http_client import close_http_session, timed_request
+from .services.s3_service import upload_video_to_s3_async, verify_upload_async
+from .services.upload_queue import FAILED, UploadItem, UploadQueue
+from .utils.helpers import parse_application_id
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(),
+        logging.FileHandler(Path(__file__).parent / "logs" / "upload_worker.log")
+    ]
+)
+logger = logging.getLogger(__name__)
+
+RECORDINGS_DIR = Path("recordings")
+RECOVERY_MIN_AGE_SECONDS = 60
+
+
+class UploadWorker:
+    """Uploads queued recordings with bounded concurrency and retry with backoff"""
+
+    def __init__(self, queue: UploadQueue):
+        self.queue = queue
+        self._tasks: Set[asyncio.Task] = set()
+
+    def recover(self) -> None:
+        """Requeue uploads interrupted by a restart and queue orphaned recordings"""
+        reset = self.queue.reset_in_flight()
+        if reset:
+            logger.info(f"♻️ Requeued {reset} interrupted uploads")
+
+        if not RECORDINGS_DIR.exists():
+            return
+        cutoff = time.time() - RECOVERY_MIN_AGE_SECONDS
+        for recording_path in sorted(RECORDINGS_DIR.glob("*.mp4")):
+            # Skip files that may still be being written
+            if recording_path.stat().st_mtime > cutoff or self.queue.is_queued(str(recording_path)):
+                continue
+            application_id = parse_application_id(recording_path.stem)
+            if not application_id:
+                logger.warning(f"Skipping recording without application id: {recording_path}")
+                continue
+            self.queue.enqueue(str(recording_path), application_id)
+
+    async def run(self) -> None:
+        """Poll the queue forever"""
+        self.recover()
+        logger.info(f"📊 Upload queue: {self.queue.counts()}")
+
+        try:
+            while True:
+                free = settings.upload_concurrency - len(self._tasks)
+                for item in self.queue.claim_due(free):
+                    task = asyncio.create_task(self._process(item))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                await asyncio.sleep(settings.upload_poll_interval)
+        finally:
+            await close_http_session()
+
+    async def _process(self, item: UploadItem) -> None:
+        recording_path = Path(item.file_path)
+        try:
+            if not item.video_url:
+                if not recording_path.exists():
+                    raise FileNotFoundError(f"Recording not found: {recording_path}")
+                video_url = await upload_video_to_s3_async(str(recording_path), item.application_id)
+                if not video_url:
+                    raise RuntimeError("S3 upload failed")
+                if not await verify_upload_async(video_url, str(recording_path)):
+                    raise RuntimeError("Uploaded object missing or size mismatch")
+                self.queue.mark_uploaded(item.id, video_url)
+                item.video_url = video_url
+                item.attempts = 0
+
+            # Link the verified video to the application
+            if settings.backend_url:
+                async with timed_request(
+                    "POST",
+                    f"{settings.backend_url}/applications/{item.application_id}/video",
+                    name="video_callback",
+                    json={"videoUrl": item.video_url},
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    response.raise_for_status()
+                logger.info(f"✅ Video saved: {item.application_id}")
+
+            self.queue.mark_done(item.id)
+            recording_path.unlink(missing_ok=True)
+        except Exception as e:
+            status = self.queue.mark_retry(
+                item,
+                str(e),
+                max_attempts=settings.upload_max_attempts,
+                base_delay=settings.upload_retry_base_delay,
+                max_delay=settings.upload_retry_max_delay
+            )
+            if status == FAILED:
+                logger.error(f"❌ Giving up on {recording_path} after {item.attempts + 1} attempts: {e}")
+            else:
+                logger.warning(f"Upload attempt {item.attempts + 1} failed for {recording_path}: {e}")
+
+
+def main():
+    """Start the upload worker"""
+    logger.info(f"🚀 Recording upload worker - concurrency {settings.upload_concurrency}")
+    asyncio.run(UploadWorker(UploadQueue(settings.upload_queue_path)).run())
+
+
+if __name__ == "__main__":
+    main()
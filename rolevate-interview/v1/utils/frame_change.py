@@ -0,0 +1,138 @@
+"""
+Frame change detection
+Cheap NumPy comparisons (perceptual hash, brightness histogram and a coarse
+thumbnail), used to skip vision API calls for frames that look the same as the
+last analyzed one
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+HASH_SIZE = 8
+HIST_BINS = 32
+THUMB_SIZE = 16
+CELL_DELTA = 0.08  # Thumbnail cell brightness change (0-1) that counts as changed
+
+
+def to_grayscale(rgba: np.ndarray) -> np.ndarray:
+    """HxWx3 or HxWx4 uint8 frame -> HxW float32 luma"""
+    rgb = rgba[..., :3].astype(np.float32)
+    return rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def downscale(gray: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Area-average a grayscale image down to height x width"""
+    h = gray.shape[0] - gray.shape[0] % height
+    w = gray.shape[1] - gray.shape[1] % width
+    blocks = gray[:h, :w].reshape(height, h // height, width, w // width)
+    return blocks.mean(axis=(1, 3))
+
+
+def dhash(gray: np.ndarray) -> np.ndarray:
+    """64-bit difference hash: is each pixel brighter than its right neighbour"""
+    small = downscale(gray, HASH_SIZE, HASH_SIZE + 1)
+    return (small[:, 1:] > small[:, :-1]).ravel()
+
+
+def histogram(gray: np.ndarray) -> np.ndarray:
+    """Normalized brightness histogram (every 4th pixel is plenty)"""
+    counts, _ = np.histogram(gray[::4, ::4], bins=HIST_BINS, range=(0, 256))
+    return counts / max(counts.sum(), 1)
+
+
+@dataclass
+class FrameSignature:
+    """What a frame is compared on"""
+    hash_bits: np.ndarray
+    hist: np.ndarray
+    thumb: np.ndarray
+
+    @classmethod
+    def from_frame(cls, rgba: np.ndarray) -> "FrameSignature":
+        gray = to_grayscale(rgba)
+        return cls(
+            hash_bits=dhash(gray),
+            hist=histogram(gray),
+            thumb=downscale(gray, THUMB_SIZE, THUMB_SIZE) / 255
+        )
+
+    def distance(self, other: "FrameSignature") -> Tuple[int, float, float]:
+        """
+        Returns:
+            (hash bits that differ, histogram total variation in [0, 1],
+            fraction of thumbnail cells that changed)
+        """
+        hamming = int(np.count_nonzero(self.hash_bits != other.hash_bits))
+        hist_delta = float(np.abs(self.hist - other.hist).sum() / 2)
+        changed_area = float(np.mean(np.abs(self.thumb - other.thumb) > CELL_DELTA))
+        return hamming, hist_delta, changed_area
+
+
+class FrameChangeGate:
+    """
+    Decides whether a sampled frame is worth sending to the vision API
+
+    Frames are compared with the last frame that was analyzed, not the last
+    one sampled, so slow drift still adds up to a change. Call mark_analyzed()
+    once the API call succeeds; a failed call leaves the change pending.
+    """
+
+    def __init__(
+        self,
+        hash_threshold: int,
+        hist_threshold: float,
+        area_threshold: float,
+        max_interval: float
+    ):
+        """
+        Args:
+            hash_threshold: dHash bits (of 64) that must differ to count as a change
+            hist_threshold: Histogram total variation that counts as a change
+            area_threshold: Fraction of the frame that must change (e.g. someone walks in)
+            max_interval: Seconds after which a frame is sent regardless
+        """
+        self.hash_threshold = hash_threshold
+        self.hist_threshold = hist_threshold
+        self.area_threshold = area_threshold
+        self.max_interval = max_interval
+        self._reference: Optional[FrameSignature] = None
+        self._last_sent_at = 0.0
+        self._candidate: Optional[FrameSignature] = None
+        self.sampled = 0
+        self.sent = 0
+
+    def check(self, rgba: np.ndarray, now: Optional[float] = None) -> Optional[str]:
+        """Return why the frame should be analyzed, or None to skip it"""
+        now = time.monotonic() if now is None else now
+        signature = FrameSignature.from_frame(rgba)
+        self.sampled += 1
+
+        if self._reference is None:
+            reason = "first_frame"
+        else:
+            hamming, hist_delta, changed_area = signature.distance(self._reference)
+            if hamming >= self.hash_threshold:
+                reason = f"scene_change(hash={hamming})"
+            elif hist_delta >= self.hist_threshold:
+                reason = f"scene_change(hist={hist_delta:.2f})"
+            elif changed_area >= self.area_threshold:
+                reason = f"scene_change(area={changed_area:.2f})"
+            elif now - self._last_sent_at >= self.max_interval:
+                reason = "max_interval"
+            else:
+                return None
+
+        self._candidate = signature
+        return reason
+
+    def mark_analyzed(self, now: Optional[float] = None) -> None:
+        """Make the last frame passed by check() the new reference"""
+        if self._candidate is None:
+            return
+        self._reference = self._candidate
+        self._candidate = None
+        self._last_sent_at = time.monotonic() if now is None else now
+        self.sent += 1
@@ -0,0 +1,51 @@
+"""
+Event loop lag monitor
+Measures how late a periodic timer fires - lag is time the loop was blocked
+and could not serve live audio
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Samples event loop scheduling lag in milliseconds"""
+    
+    def __init__(self, interval: float = 0.1, warn_threshold_ms: float = 100.0):
+        self.interval = interval
+        self.warn_threshold_ms = warn_threshold_ms
+        self.max_lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start sampling on the running loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    def reset(self) -> float:
+        """Return the max lag since the last reset and start a new window"""
+        max_lag, self.max_lag_ms = self.max_lag_ms, 0.0
+        return max_lag
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - expected) * 1000)
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            if lag_ms > self.warn_threshold_ms:
+                logger.warning(f"⚠️ Event loop blocked for {lag_ms:.0f}ms")
+    
+    async def stop(self) -> None:
+        """Stop sampling"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
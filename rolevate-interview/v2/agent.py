@@ -6,6 +6,7 @@ AI-powered interview agent using LiveKit for real-time voice interaction.
 
 import asyncio
 import logging
+import time
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -22,15 +23,18 @@ setup_logging()
 from livekit.agents import (
     Agent,
     JobContext,
+    JobExecutorType,
     JobProcess,
     RoomInputOptions,
     WorkerOptions,
     cli,
 )
 from livekit.agents.llm import function_tool
-from livekit.plugins import silero
 
 from orchestrator import InterviewOrchestrator
+from service.http_pool import http_pool
+from service.worker_load import worker_load
+from service.shared_vad import enable_forkserver_preload, get_shared_vad, is_inherited, memory_report
 from models import ApplicationData
 from exceptions import RolevateException
 
@@ -86,8 +90,16 @@ def prewarm(proc: JobProcess) -> None:
     Args:
         proc: Job process instance
     """
-    proc.userdata["vad"] = silero.VAD.load()
-    logger.info("VAD model prewarmed successfully")
+    started = time.perf_counter()
+    proc.userdata["vad"] = get_shared_vad()
+    logger.info(
+        "VAD model prewarmed successfully",
+        extra={
+            "prewarm_ms": round((time.perf_counter() - started) * 1000),
+            "vad_inherited": is_inherited(),
+            **memory_report()
+        }
+    )
 
 
 async def entrypoint(ctx: JobContext) -> None:
@@ -99,24 +111,34 @@ async def entrypoint(ctx: JobContext) -> None:
         ctx: Job context from LiveKit
     """
     orchestrator = None
+    setup_task: Optional[asyncio.Task] = None
     
     try:
-        # Connect to the room
-        await ctx.connect()
-        
+        # The room name is known at dispatch, so start fetching context
+        # before connecting instead of after
+        room_name = ctx.job.room.name
         logger.info(
             "Agent starting",
-            extra={"room_name": ctx.room.name}
+            extra={"room_name": room_name}
         )
         
         # Initialize orchestrator
         orchestrator = InterviewOrchestrator(
-            room_name=ctx.room.name,
+            room_name=room_name,
             vad_model=ctx.proc.userdata["vad"]
         )
         
-        # Setup phase: fetch data and create interview record
-        setup_success = await orchestrator.setup()
+        # Stops the recording if cleanup has not, then waits for its upload and URL attach
+        ctx.add_shutdown_callback(orchestrator.wait_for_background_tasks)
+        # Registered after it, as attaching the recording URL still posts over the pool
+        ctx.add_shutdown_callback(http_pool.close)
+        
+        # Setup phase (fetch data, create interview record) overlaps the room connect
+        setup_task = asyncio.create_task(orchestrator.setup())
+        await ctx.connect()
+        orchestrator.mark_connected()
+        
+        setup_success = await setup_task
         if not setup_success:
             logger.error("Setup phase failed, aborting interview")
             return
@@ -125,7 +147,7 @@ async def entrypoint(ctx: JobContext) -> None:
         instructions = orchestrator.build_instructions()
         session = orchestrator.create_agent_session()
         
-        # Start the agent - it will begin speaking based on instructions
+        # Start the agent, then open with the (pre-synthesized) greeting
         await session.start(
             agent=InterviewAssistant(
                 instructions=instructions,
@@ -133,6 +155,8 @@ async def entrypoint(ctx: JobContext) -> None:
             ),
             room=ctx.room,
         )
+        await orchestrator.start_conversation(session)
+        await orchestrator.start_recording()
         
         logger.info("Agent started and active")
         
@@ -147,6 +171,10 @@ async def entrypoint(ctx: JobContext) -> None:
     except Exception as e:
         logger.error(f"Unexpected error: {e}", exc_info=True)
     finally:
+        if setup_task and not setup_task.done():
+            setup_task.cancel()
+            await asyncio.gather(setup_task, return_exceptions=True)
+        
         # Cleanup resources
         if orchestrator:
             await orchestrator.cleanup()
@@ -158,13 +186,31 @@ if __name__ == "__main__":
         "Starting Rolevate Interview Agent",
         extra={
             "environment": settings.environment,
-            "log_level": settings.log_level
+            "log_level": settings.log_level,
+            "job_executor": settings.worker_job_executor,
+            "load_threshold": settings.worker_load_threshold,
+            "max_sessions": settings.worker_max_sessions
         }
     )
     
+    if settings.vad_preload and settings.worker_job_executor == "process":
+        enable_forkserver_preload()
+    
+    worker_options = {}
+    if settings.worker_num_idle_processes is not None:
+        worker_options["num_idle_processes"] = settings.worker_num_idle_processes
+    
     cli.run_app(
         WorkerOptions(
             entrypoint_fnc=entrypoint,
             prewarm_fnc=prewarm,
+            job_executor_type=(
+                JobExecutorType.THREAD
+                if settings.worker_job_executor == "thread"
+                else JobExecutorType.PROCESS
+            ),
+            load_fnc=worker_load,
+            load_threshold=settings.worker_load_threshold,
+            **worker_options
         )
     )
\ No newline at end of file
@@ -86,6 +86,132 @@ class Settings(BaseSettings):
         default=100,
         description="Maximum number of HTTP connections in pool"
     )
+    http_limit_per_host: int = Field(
+        default=30,
+        description="Maximum pooled HTTP connections per host"
+    )
+    http_dns_cache_ttl: int = Field(
+        default=300,
+        description="Seconds to cache DNS lookups for pooled HTTP connections"
+    )
+    http_keepalive_timeout: float = Field(
+        default=60.0,
+        description="Seconds an idle pooled HTTP connection is kept alive"
+    )
+    
+    # Transcript Persistence
+    transcript_batch_size: int = Field(
+        default=20,
+        description="Buffered utterances that trigger a bulk transcript flush"
+    )
+    transcript_flush_interval: float = Field(
+        default=15.0,
+        description="Seconds between periodic bulk transcript flushes"
+    )
+    write_queue_max_pending: int = Field(
+        default=50,
+        description="Maximum background write jobs waiting per interview"
+    )
+    write_drain_timeout: float = Field(
+        default=10.0,
+        description="Seconds to wait for pending writes during cleanup"
+    )
+    
+    # Application Context Cache
+    context_cache_enabled: bool = Field(
+        default=True,
+        description="Read and write the file-based warm application context cache"
+    )
+    context_cache_dir: str = Field(
+        default="/tmp/rolevate_context_cache",
+        description="Directory shared by worker processes for cached application context"
+    )
+    context_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds a webhook-warmed application context stays valid"
+    )
+    context_webhook_port: int = Field(
+        default=8089,
+        description="Port for the optional pre-interview context webhook receiver"
+    )
+    context_webhook_secret: Optional[str] = Field(
+        default=None,
+        description="Shared secret required by the context webhook (X-Webhook-Secret header)"
+    )
+    
+    # Greeting Audio
+    greeting_cache_enabled: bool = Field(
+        default=True,
+        description="Pre-synthesize the greeting while setup and room connect run"
+    )
+    greeting_cache_size: int = Field(
+        default=64,
+        description="Synthesized greetings kept in memory per worker process"
+    )
+    greeting_wait_timeout: float = Field(
+        default=1.5,
+        description="Seconds to wait for greeting audio before falling back to live TTS"
+    )
+    
+    # Latency Metrics
+    metrics_report_interval: float = Field(
+        default=60.0,
+        description="Seconds between latency percentile log records (0 disables)"
+    )
+    metrics_window_size: int = Field(
+        default=500,
+        description="Latency samples kept per stage for percentile calculation"
+    )
+    
+    # Worker Capacity
+    worker_job_executor: str = Field(
+        default="process",
+        description="Job executor: 'process' (one session per process) or 'thread' (several sessions per process sharing models)"
+    )
+    worker_num_idle_processes: Optional[int] = Field(
+        default=None,
+        description="Idle job processes/threads kept warm (LiveKit default when unset)"
+    )
+    vad_preload: bool = Field(
+        default=True,
+        description="Load the VAD once in the forkserver so job processes share it copy-on-write"
+    )
+    worker_load_threshold: float = Field(
+        default=0.75,
+        description="Reported load above which the dispatcher stops assigning jobs"
+    )
+    worker_max_sessions: int = Field(
+        default=0,
+        description="Sessions per worker counted as full load (0 = CPU/memory only); size with scripts/soak_test.py"
+    )
+    
+    # Recording
+    recording_enabled: bool = Field(
+        default=False,
+        description="Record interviews via LiveKit egress to S3"
+    )
+    recording_profile: str = Field(
+        default="audio",
+        description="Recording profile: 'audio' (mixed Opus/OGG) or 'composite' (grid video MP4)"
+    )
+    recording_poll_initial_delay: float = Field(
+        default=1.0,
+        description="First delay between egress completion checks (doubles each attempt)"
+    )
+    recording_poll_max_interval: float = Field(
+        default=15.0,
+        description="Maximum delay between egress completion checks"
+    )
+    recording_poll_deadline: float = Field(
+        default=300.0,
+        description="Seconds to wait for the recording upload before giving up"
+    )
+    
+    # S3
+    s3_max_workers: int = Field(
+        default=4,
+        description="Threads running blocking S3 calls off the event loop"
+    )
     
     # Retry Configuration
     max_retries: int = Field(
@@ -111,6 +237,26 @@ class Settings(BaseSettings):
             raise ValueError(f"log_level must be one of {valid_levels}")
         return v_upper
     
+    @field_validator('worker_job_executor')
+    @classmethod
+    def validate_worker_job_executor(cls, v: str) -> str:
+        """Ensure the job executor type is supported."""
+        valid_executors = ['process', 'thread']
+        v_lower = v.lower()
+        if v_lower not in valid_executors:
+            raise ValueError(f"worker_job_executor must be one of {valid_executors}")
+        return v_lower
+    
+    @field_validator('recording_profile')
+    @classmethod
+    def validate_recording_profile(cls, v: str) -> str:
+        """Ensure the recording profile is supported."""
+        valid_profiles = ['audio', 'composite']
+        v_lower = v.lower()
+        if v_lower not in valid_profiles:
+            raise ValueError(f"recording_profile must be one of {valid_profiles}")
+        return v_lower
+    
     @field_validator('environment')
     @classmethod
     def validate_environment(cls, v: str) -> str:
@@ -48,9 +48,9 @@ class ApplicationData(BaseModel):
         if v is None:
             return None
         if isinstance(v, dict):
-            # Convert dict to formatted string
+            # Compact JSON: this ends up in the LLM instructions
             import json
-            return json.dumps(v, indent=2)
+            return json.dumps(v, separators=(",", ":"), ensure_ascii=False)
         return str(v)
     
     class Config:
@@ -99,7 +99,7 @@ class InterviewType(str):
 class CreateInterviewInput(BaseModel):
     """Input model for creating an interview."""
     application_id: str = Field(alias="applicationId")
-    interviewer_id: str = Field(alias="interviewerId")
+    interviewer_id: Optional[str] = Field(default=None, alias="interviewerId")
     scheduled_at: datetime = Field(default_factory=datetime.utcnow, alias="scheduledAt")
     type: Literal["VIDEO", "PHONE", "IN_PERSON"] = "VIDEO"
     status: Literal["SCHEDULED", "IN_PROGRESS", "COMPLETED", "CANCELLED", "NO_SHOW"] = "SCHEDULED"
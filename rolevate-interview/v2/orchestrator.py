@@ -5,7 +5,8 @@ Separates business logic from LiveKit agent implementation.
 
 import asyncio
 import logging
-from typing import Optional, List
+import time
+from typing import Optional, Tuple
 from datetime import datetime
 
 from livekit.agents import AgentSession
@@ -13,12 +14,28 @@ from livekit.plugins import openai, elevenlabs, soniox, silero
 
 from service.application_service import ApplicationService
 from service.interview_service import InterviewService
+from service.recording_service import RecordingService
+from service.transcript_buffer import TranscriptBuffer
+from service.write_queue import WriteQueue
+from service.http_pool import http_pool
+from service.session_metrics import SessionMetricsCollector
+from service.greeting_cache import greeting_cache, replay_frames, synthesize
+from config import settings
 from models import ApplicationData
 from exceptions import RolevateException
+from utils.instructions import (
+    build_instructions as compile_instructions,
+    estimate_tokens,
+    instruction_cache_info,
+    is_arabic_language
+)
+from utils.loop_monitor import LoopLagMonitor
 from utils.room_parser import parse_application_id_from_room
 
 logger = logging.getLogger(__name__)
 
+TTS_VOICE_ID = "u0TsaWvt0v8migutHM3M"
+
 
 class InterviewOrchestrator:
     """
@@ -36,6 +53,11 @@ class InterviewOrchestrator:
         """
         self.room_name = room_name
         self.vad_model = vad_model
+        self.tts: Optional[elevenlabs.TTS] = None
+        # (name part synthesized for this session, shared part from the cache)
+        self.greeting_audio: Optional[Tuple[asyncio.Future, asyncio.Future]] = None
+        self.recording_service: Optional[RecordingService] = None
+        self.recording_task: Optional[asyncio.Task] = None
         
         # Extract application ID from room name
         self.application_id = parse_application_id_from_room(room_name)
@@ -47,7 +69,24 @@ class InterviewOrchestrator:
         # State tracking
         self.interview_id: Optional[str] = None
         self.application_data: Optional[ApplicationData] = None
-        self.transcript_tasks: List[asyncio.Task] = []
+        self.transcript_buffer: Optional[TranscriptBuffer] = None
+        self.started_at = time.perf_counter()
+        self.first_speech_logged = False
+        self.connected_at: Optional[float] = None
+        self.instruction_tokens = 0
+        # Lag here means live audio for every session on this loop stalled
+        self.loop_monitor = LoopLagMonitor(
+            on_sample=lambda lag_ms: self.session_metrics.record("event_loop_lag", lag_ms)
+        )
+        self.session_metrics = SessionMetricsCollector(
+            room_name=room_name,
+            report_interval=settings.metrics_report_interval,
+            max_samples=settings.metrics_window_size
+        )
+        self.transcript_writes = WriteQueue(
+            name="transcripts",
+            max_pending=settings.write_queue_max_pending
+        )
         
         logger.info(
             "InterviewOrchestrator initialized",
@@ -59,56 +98,124 @@ class InterviewOrchestrator:
     
     async def setup(self) -> bool:
         """
-        Setup phase: Fetch data and create interview record.
+        Setup phase: Fetch data and create interview record concurrently.
+        
+        The interview record only needs the application ID from the room name;
+        with interviewerId omitted the backend attributes it to the application's
+        candidate, so both GraphQL calls run in parallel.
         
         Returns:
             True if setup successful, False otherwise
         """
-        try:
-            # 1. Fetch application data
-            logger.info(
-                "Fetching application data",
-                extra={"application_id": self.application_id}
-            )
-            self.application_data = await self.application_service.get_application_data(
-                self.application_id
-            )
-            
-            if not self.application_data:
-                logger.error("Failed to fetch application data")
-                return False
-            
-            # 2. Create interview record
-            candidate_id = self.application_data.candidate.id
-            self.interview_id = await self.interview_service.create_interview(
+        setup_started = time.perf_counter()
+        logger.info(
+            "Fetching application data and creating interview",
+            extra={"application_id": self.application_id}
+        )
+        
+        fetch_result, create_result = await asyncio.gather(
+            self.application_service.get_application_data(self.application_id),
+            self.interview_service.create_interview(
                 application_id=self.application_id,
-                interviewer_id=candidate_id,
                 room_id=self.room_name
+            ),
+            return_exceptions=True
+        )
+        
+        setup_ms = round((time.perf_counter() - setup_started) * 1000)
+        
+        if isinstance(create_result, BaseException):
+            self._log_setup_error(create_result)
+        elif create_result:
+            self.interview_id = create_result
+            logger.info(
+                "Interview created",
+                extra={"interview_id": self.interview_id}
             )
-            
-            if self.interview_id:
-                logger.info(
-                    "Interview created",
-                    extra={"interview_id": self.interview_id}
-                )
-            
-            return True
-            
-        except RolevateException as e:
+        
+        if isinstance(fetch_result, BaseException) or not fetch_result:
+            if isinstance(fetch_result, BaseException):
+                self._log_setup_error(fetch_result)
+            else:
+                logger.error("Failed to fetch application data")
+            # The interview record was created for nothing; don't leave it scheduled
+            await self._cancel_orphaned_interview()
+            return False
+        
+        self.application_data = fetch_result
+        
+        logger.info(
+            "Setup completed",
+            extra={
+                "setup_ms": setup_ms,
+                "interview_id": self.interview_id,
+                "since_start_ms": self._elapsed_ms()
+            }
+        )
+        if isinstance(create_result, BaseException):
+            return False
+        
+        self.prepare_greeting()
+        return True
+    
+    def _log_setup_error(self, error: BaseException) -> None:
+        """Log a setup failure with the same detail as a raised exception."""
+        if isinstance(error, RolevateException):
             logger.error(
-                f"Setup failed: {e.message}",
-                extra={"details": e.details},
-                exc_info=True
+                f"Setup failed: {error.message}",
+                extra={"details": error.details},
+                exc_info=error
+            )
+        else:
+            logger.error(f"Unexpected setup error: {error}", exc_info=error)
+    
+    async def _cancel_orphaned_interview(self) -> None:
+        """Cancel an interview created while the application fetch failed."""
+        if not self.interview_id:
+            return
+        
+        try:
+            await self.interview_service.update_interview(
+                interview_id=self.interview_id,
+                status="CANCELLED"
+            )
+            logger.info(
+                "Cancelled interview after failed setup",
+                extra={"interview_id": self.interview_id}
             )
-            return False
         except Exception as e:
-            logger.error(f"Unexpected setup error: {e}", exc_info=True)
-            return False
+            logger.error(f"Error cancelling interview: {e}", exc_info=True)
+        finally:
+            self.interview_id = None
+    
+    def _elapsed_ms(self) -> int:
+        """Milliseconds since the orchestrator was created at job start."""
+        return round((time.perf_counter() - self.started_at) * 1000)
+    
+    def mark_connected(self) -> None:
+        """Record the dispatch-to-connect milestone once the room is joined."""
+        self.connected_at = time.perf_counter()
+        self.session_metrics.record_milestone("dispatch_to_connect", self._elapsed_ms())
+    
+    def _on_agent_state_changed(self, event) -> None:
+        """Record time-to-first-greeting when the agent first starts speaking."""
+        if self.first_speech_logged or getattr(event, "new_state", None) != "speaking":
+            return
+        self.first_speech_logged = True
+        self.session_metrics.record_milestone("dispatch_to_greeting", self._elapsed_ms())
+        if self.connected_at is not None:
+            self.session_metrics.record_milestone(
+                "connect_to_greeting",
+                (time.perf_counter() - self.connected_at) * 1000
+            )
     
     def build_instructions(self) -> str:
         """
         Build interview instructions for the AI agent.
         
+        Job-level sections are compiled once per (job, language) and placed
+        first so they stay a stable prefix for provider prompt caching.
+        
         Returns:
             Formatted instruction string
         """
@@ -118,83 +225,26 @@ class InterviewOrchestrator:
         job = self.application_data.job
         candidate = self.application_data.candidate
         
-        interview_prompt = job.interview_prompt or ""
-        interview_language = job.interview_language or "English"
-        candidate_name = candidate.name or "Candidate"
-        company_name = job.company.name or "the company"
-        job_title = job.title or "this position"
-        cv_analysis = self.application_data.cv_analysis_results or ""
-        
-        # Remove visual assessment instructions (audio-only interview)
-        visual_keywords = [
-            "الكاميرا", "إضاءة", "الخلفية", "المظهر", "الملابس", 
-            "camera", "lighting", "background", "appearance", "posture",
-            "eye contact", "facial expressions", "body language", 
-            "visual", "observe", "see", "watch", "look"
-        ]
-        
-        # Clean the prompt
-        prompt_lines = interview_prompt.split('\n')
-        cleaned_lines = [
-            line for line in prompt_lines
-            if not any(keyword in line.lower() for keyword in visual_keywords)
-        ]
-        interview_prompt = '\n'.join(cleaned_lines)
-        
-        # Add audio-only note
-        audio_note = (
-            "\n\nIMPORTANT: This is an AUDIO-ONLY interview. "
-            "You cannot see the candidate. Focus only on their voice responses, "
-            "tone, and content. Do not mention or ask about visual elements."
+        instructions = compile_instructions(
+            job_id=job.id,
+            company_name=job.company.name or "the company",
+            job_title=job.title or "this position",
+            interview_prompt=job.interview_prompt or "",
+            interview_language=job.interview_language or "English",
+            candidate_name=candidate.name or "Candidate",
+            cv_analysis=self.application_data.cv_analysis_results,
+            greeting=self.get_greeting()
         )
         
-        # Normalize language name for clearer instruction
-        is_arabic = any(word in interview_language.lower() for word in ["arabic", "عربي", "ar"])
-        language_display = "Arabic (العربية)" if is_arabic else "English"
-        
-        # Add explicit language instruction
-        language_instruction = (
-            f"\n\n🔴 CRITICAL LANGUAGE REQUIREMENT 🔴\n"
-            f"You MUST conduct this ENTIRE interview EXCLUSIVELY in {language_display}.\n"
-            f"- Every single response must be in {language_display}\n"
-            f"- Every question must be in {language_display}\n"
-            f"- ALL follow-ups must be in {language_display}\n"
-            f"- NEVER switch to another language\n"
-            f"- If the candidate speaks another language, politely ask them to continue in {language_display}\n"
-            f"This is a strict requirement. Do not deviate from {language_display} under any circumstances."
+        # Instructions are re-sent on every LLM turn
+        self.instruction_tokens = estimate_tokens(instructions)
+        logger.info(
+            "Instructions compiled",
+            extra={
+                "instruction_tokens": self.instruction_tokens,
+                "static_cache": instruction_cache_info()
+            }
         )
-        
-        # Get greeting for starting the interview
-        greeting = self.get_greeting()
-        
-        instructions = f"""You are Laila Al Noor, an AI interviewer for {company_name}.
-
-CANDIDATE: {candidate_name}
-POSITION: {job_title}
-COMPANY: {company_name}
-
-{interview_prompt}{audio_note}{language_instruction}
-
-CV SUMMARY:
-{cv_analysis}
-
-CRITICAL - START IMMEDIATELY:
-1. Begin with this greeting: "{greeting}"
-2. Then ask your first interview question
-3. Do NOT wait for candidate to speak first - YOU lead the conversation
-4. You can use get_application_info() tool for company/job details
-
-IMPORTANT - CONVERSATION FLOW:
-- Listen to the FULL answer/response from the candidate
-- Do NOT interrupt or jump to next question after just hearing "okay" or "تمام" (tamam)
-- Common filler words are: "okay", "ok", "sure", "yes", "yeah", "تمام", "حسناً", "تمام التمام"
-- These are just acknowledgments - wait for the actual answer/explanation
-- Only move to the next question when candidate gives a substantive answer or clearly says they're done
-- If candidate gives a short answer, ask follow-up questions to get more detail
-- Keep the conversation natural and flowing
-
-Remember: Conduct ENTIRE interview in {language_display} only."""
-        
         return instructions
     
     def create_agent_session(self) -> AgentSession:
@@ -204,8 +254,6 @@ Remember: Conduct ENTIRE interview in {language_display} only."""
         Returns:
             Configured AgentSession with performance optimizations
         """
-        from config import settings
-        
         session = AgentSession(
             stt=soniox.STT(
                 params=soniox.STTOptions(
@@ -213,41 +261,99 @@ Remember: Conduct ENTIRE interview in {language_display} only."""
                 )
             ),
             llm=openai.LLM(model="gpt-4o-mini"),
-            tts=elevenlabs.TTS(voice_id="u0TsaWvt0v8migutHM3M"),
+            tts=self._get_tts(),
             vad=self.vad_model,
         )
         
+        session.on("agent_state_changed", self._on_agent_state_changed)
+        self.session_metrics.attach(session)
+        self.loop_monitor.start()
+        
         # Setup transcript capture if interview was created
         if self.interview_id and self.application_data:
             candidate_name = self.application_data.candidate.name
             interview_language = self.application_data.job.interview_language
             
+            # Utterances are buffered and persisted via createBulkTranscripts
+            self.transcript_buffer = TranscriptBuffer(
+                interview_id=self.interview_id,
+                flush_fn=self.interview_service.add_transcripts_bulk,
+                max_batch_size=settings.transcript_batch_size,
+                flush_interval=settings.transcript_flush_interval
+            )
+            self.transcript_buffer.start()
+            
             @session.on("user_speech_committed")
             def on_user_speech(message):
                 if message.content:
-                    task = asyncio.create_task(
-                        self._save_transcript(
-                            message.content,
-                            candidate_name,
-                            interview_language
-                        )
+                    self._save_transcript(
+                        message.content,
+                        candidate_name,
+                        interview_language
                     )
-                    self.transcript_tasks.append(task)
             
             @session.on("agent_speech_committed")
             def on_agent_speech(message):
                 if message.content:
-                    task = asyncio.create_task(
-                        self._save_transcript(
-                            message.content,
-                            "Laila Al Noor",
-                            interview_language
-                        )
+                    self._save_transcript(
+                        message.content,
+                        "Laila Al Noor",
+                        interview_language
                     )
-                    self.transcript_tasks.append(task)
         
         return session
     
+    def _get_tts(self) -> elevenlabs.TTS:
+        """TTS shared by the session and greeting pre-synthesis."""
+        if self.tts is None:
+            self.tts = elevenlabs.TTS(voice_id=TTS_VOICE_ID)
+        return self.tts
+    
+    def prepare_greeting(self) -> None:
+        """
+        Start synthesizing the greeting as soon as application data is known.
+        
+        The part with the candidate's name is synthesized for this session only;
+        the rest is shared through the process-wide cache.
+        """
+        if not settings.greeting_cache_enabled or self.greeting_audio is not None:
+            return
+        try:
+            personal, shared = self.get_greeting_parts()
+            tts = self._get_tts()
+            self.greeting_audio = (
+                asyncio.ensure_future(synthesize(tts, personal)),
+                greeting_cache.prefetch(tts, TTS_VOICE_ID, shared)
+            )
+        except Exception as e:
+            logger.warning(f"Could not start greeting synthesis: {e}")
+    
+    async def start_conversation(self, session: AgentSession) -> None:
+        """
+        Speak the greeting, then let the LLM ask the first question.
+        
+        Pre-synthesized audio plays immediately while the LLM prepares the
+        first question; without it the greeting is synthesized live.
+        """
+        greeting = self.get_greeting()
+        clips = None
+        if self.greeting_audio is not None:
+            clips = await asyncio.gather(*(
+                greeting_cache.get(pending, timeout=settings.greeting_wait_timeout)
+                for pending in self.greeting_audio
+            ))
+        
+        pre_synthesized = bool(clips) and all(clips)
+        if pre_synthesized:
+            session.say(greeting, audio=replay_frames(*clips))
+        else:
+            session.say(greeting)
+        logger.info("Greeting queued", extra={"pre_synthesized": pre_synthesized})
+        
+        session.generate_reply(
+            instructions="You have already greeted the candidate. Ask your first interview question."
+        )
+    
     def get_greeting(self) -> str:
         """
         Generate the initial greeting in the appropriate language.
@@ -255,8 +361,17 @@ Remember: Conduct ENTIRE interview in {language_display} only."""
         Returns:
             Greeting message string
         """
+        return " ".join(self.get_greeting_parts())
+    
+    def get_greeting_parts(self) -> Tuple[str, str]:
+        """
+        Split the greeting into the part naming the candidate and the rest.
+        
+        Returns:
+            (personal, shared) where shared depends only on language and company
+        """
         if not self.application_data:
-            return "Hello, welcome to the interview."
+            return "Hello,", "welcome to the interview."
         
         job = self.application_data.job
         candidate = self.application_data.candidate
@@ -265,50 +380,98 @@ Remember: Conduct ENTIRE interview in {language_display} only."""
         candidate_name = candidate.name or "Candidate"
         company_name = job.company.name or "the company"
         
-        # Check if Arabic (case-insensitive, supports variations)
-        is_arabic = any(word in interview_language.lower() for word in ["arabic", "عربي", "ar"])
-        
-        if is_arabic:
+        if is_arabic_language(interview_language):
             return (
-                f"مرحباً {candidate_name}، أنا ليلى النور من {company_name}. "
-                f"كيف حالك اليوم؟"
+                f"مرحباً {candidate_name}،",
+                f"أنا ليلى النور من {company_name}. كيف حالك اليوم؟"
             )
         else:
             return (
-                f"Hello {candidate_name}, I am Laila Al Noor from {company_name}. "
-                f"How are you today?"
+                f"Hello {candidate_name},",
+                f"I am Laila Al Noor from {company_name}. How are you today?"
             )
     
-    async def _save_transcript(
+    def _save_transcript(
         self,
         content: str,
         speaker: str,
         language: str
     ) -> None:
         """
-        Save a transcript entry (internal method).
+        Buffer a transcript entry (internal method).
+        Runs inside the session event handlers, so it never awaits network I/O.
         
         Args:
             content: Transcript content
             speaker: Speaker name
             language: Language code
         """
-        if not self.interview_id:
+        if not self.interview_id or not self.transcript_buffer:
             return
         
+        lang_code = "ar" if language and language.lower() == "arabic" else "en"
+        if self.transcript_buffer.add(content, speaker, language=lang_code):
+            # A rejected submit is harmless: entries stay buffered for the next flush
+            self.transcript_writes.submit(self.transcript_buffer.flush)
+    
+    async def start_recording(self) -> None:
+        """Start room egress if recording is enabled; failures never stop the interview."""
+        if not settings.recording_enabled:
+            return
         try:
-            lang_code = "ar" if language and language.lower() == "arabic" else "en"
-            await self.interview_service.add_transcript(
-                interview_id=self.interview_id,
-                content=content,
-                speaker=speaker,
-                language=lang_code
+            self.recording_service = RecordingService()
+            await self.recording_service.start_recording(
+                room_name=self.room_name,
+                application_id=self.application_id
             )
         except Exception as e:
-            logger.error(
-                f"Failed to save transcript: {e}",
-                extra={"interview_id": self.interview_id, "speaker": speaker}
+            logger.error(f"Could not start recording: {e}", exc_info=True)
+            self.recording_service = None
+    
+    def _stop_recording(self) -> None:
+        """
+        Stop the egress and attach its URL in one background task.
+        Safe to call from both cleanup and the shutdown callback; only the first call starts it.
+        """
+        if self.recording_service and self.recording_task is None:
+            self.recording_task = asyncio.create_task(self._finish_recording())
+    
+    async def _finish_recording(self) -> None:
+        """Stop the egress and attach its URL to the interview once uploaded."""
+        try:
+            egress_id = await self.recording_service.stop_recording()
+        except Exception as e:
+            logger.error(f"Error stopping recording: {e}", exc_info=True)
+            return
+        if egress_id:
+            await self._attach_recording_url(egress_id)
+    
+    async def _attach_recording_url(self, egress_id: str) -> None:
+        """Wait for the upload to finish, then store the recording URL."""
+        url = await self.recording_service.wait_for_recording_url(egress_id)
+        if not url or not self.interview_id:
+            return
+        try:
+            await self.interview_service.update_interview(
+                interview_id=self.interview_id,
+                recording_url=url
             )
+            logger.info(
+                "Recording URL attached to interview",
+                extra={"interview_id": self.interview_id, "recording_url": url}
+            )
+        except Exception as e:
+            logger.error(f"Error attaching recording URL: {e}", exc_info=True)
+    
+    async def wait_for_background_tasks(self) -> None:
+        """
+        Shutdown callback: let the recording finish before the process exits.
+        Shutdown callbacks may run before the entrypoint's cleanup, so this
+        stops the recording itself if cleanup has not yet.
+        """
+        self._stop_recording()
+        if self.recording_task:
+            await asyncio.gather(self.recording_task, return_exceptions=True)
     
     async def cleanup(self) -> None:
         """
@@ -317,10 +480,18 @@ Remember: Conduct ENTIRE interview in {language_display} only."""
         """
         logger.info("Starting cleanup")
         
-        # Wait for pending transcript tasks
-        if self.transcript_tasks:
-            logger.info(f"Waiting for {len(self.transcript_tasks)} transcript tasks")
-            await asyncio.gather(*self.transcript_tasks, return_exceptions=True)
+        await self.loop_monitor.stop()
+        await self.session_metrics.close()
+        
+        # Wait for pending transcript flushes, then flush the remainder
+        if self.transcript_writes.pending:
+            logger.info(f"Waiting for {self.transcript_writes.pending} transcript writes")
+        await self.transcript_writes.drain(timeout=settings.write_drain_timeout)
+        if self.transcript_buffer:
+            await self.transcript_buffer.close()
+        
+        # Stop the egress; the upload is awaited in the background
+        self._stop_recording()
         
         # Complete interview record if exists
         if self.interview_id:
@@ -338,7 +509,8 @@ Remember: Conduct ENTIRE interview in {language_display} only."""
         try:
             await self.application_service.close()
             await self.interview_service.close()
-            logger.info("All services closed")
+            await http_pool.close()
+            logger.info("All services closed", extra={"http_pool": http_pool.stats.snapshot()})
         except Exception as e:
             logger.error(f"Error closing services: {e}", exc_info=True)
         
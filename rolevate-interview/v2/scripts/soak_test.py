@@ -0,0 +1,150 @@
+"""
+Soak test: how many interview sessions fit per CPU core at target latency.
+
+STT, LLM and TTS run remotely, so the per-session CPU cost on a worker is
+dominated by the local Silero VAD. This script ramps up concurrent sessions
+that stream real-time-paced synthetic audio through shared VAD instances and
+measures how far inference falls behind the audio clock.
+
+Usage:
+    python scripts/soak_test.py --max-sessions 64 --step 4 --target-ms 100
+    python scripts/soak_test.py --processes 4   # one VAD per process, like the process executor
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from typing import List
+
+import numpy as np
+import psutil
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.latency_stats import percentile  # noqa: E402
+
+SAMPLE_RATE = 16000
+FRAME_MS = 10
+SAMPLES_PER_FRAME = SAMPLE_RATE * FRAME_MS // 1000
+
+
+def synthetic_audio(seconds: float, seed: int) -> np.ndarray:
+    """Alternate 2s of speech-like noise with 1s of near-silence, as int16 PCM."""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * SAMPLE_RATE)
+    t = np.arange(total) / SAMPLE_RATE
+    voiced = (t % 3.0) < 2.0
+    tone = 0.3 * np.sin(2 * np.pi * 180 * t) * (1 + 0.5 * np.sin(2 * np.pi * 4 * t))
+    noise = rng.normal(0, 0.05, total)
+    signal = np.where(voiced, tone + noise, noise * 0.05)
+    return (np.clip(signal, -1, 1) * 32767).astype(np.int16)
+
+
+async def run_session(vad, seconds: float, seed: int, lags: List[float]) -> None:
+    """Stream one session's audio in real time and record inference lag in ms."""
+    from livekit import rtc
+    from livekit.agents.vad import VADEventType
+
+    audio = synthetic_audio(seconds, seed)
+    stream = vad.stream()
+    started = time.perf_counter()
+
+    async def consume():
+        async for event in stream:
+            if event.type == VADEventType.INFERENCE_DONE:
+                behind = (time.perf_counter() - started) - event.timestamp
+                lags.append(max(0.0, behind) * 1000)
+
+    consumer = asyncio.create_task(consume())
+    for index, offset in enumerate(range(0, len(audio), SAMPLES_PER_FRAME)):
+        chunk = audio[offset:offset + SAMPLES_PER_FRAME]
+        if len(chunk) < SAMPLES_PER_FRAME:
+            break
+        stream.push_frame(rtc.AudioFrame(
+            data=chunk.tobytes(),
+            sample_rate=SAMPLE_RATE,
+            num_channels=1,
+            samples_per_channel=SAMPLES_PER_FRAME
+        ))
+        # Pace pushes against the audio clock like a live participant
+        delay = started + (index + 1) * FRAME_MS / 1000 - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    stream.end_input()
+    await consumer
+    await stream.aclose()
+
+
+async def run_sessions(sessions: int, seconds: float) -> List[float]:
+    """Run several sessions in one process against one shared VAD model."""
+    from livekit.plugins import silero
+
+    vad = silero.VAD.load()
+    lags: List[float] = []
+    await asyncio.gather(*(run_session(vad, seconds, seed, lags) for seed in range(sessions)))
+    return lags
+
+
+def run_in_process(args) -> List[float]:
+    sessions, seconds = args
+    return asyncio.run(run_sessions(sessions, seconds))
+
+
+def run_step(sessions: int, processes: int, seconds: float) -> List[float]:
+    """Spread sessions across processes and collect every lag sample."""
+    if processes <= 1:
+        return asyncio.run(run_sessions(sessions, seconds))
+
+    split = [sessions // processes + (1 if i < sessions % processes else 0) for i in range(processes)]
+    work = [(count, seconds) for count in split if count > 0]
+    with multiprocessing.get_context("spawn").Pool(len(work)) as pool:
+        results = pool.map(run_in_process, work)
+    return [lag for lags in results for lag in lags]
+
+
+def main():
+    """Ramp sessions until the p95 lag exceeds the target."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", type=int, default=1, help="Sessions in the first step")
+    parser.add_argument("--step", type=int, default=4, help="Sessions added per step")
+    parser.add_argument("--max-sessions", type=int, default=64, help="Stop after this many sessions")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of audio per session per step")
+    parser.add_argument("--target-ms", type=float, default=100.0, help="Allowed p95 VAD lag")
+    parser.add_argument("--processes", type=int, default=1, help="Processes to spread sessions across")
+    args = parser.parse_args()
+
+    cores = psutil.cpu_count(logical=False) or psutil.cpu_count() or 1
+    print(f"\n🧪 Soak test: {cores} cores, {args.processes} process(es), target p95 {args.target_ms:.0f}ms\n")
+    print(f"{'sessions':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'cpu %':>6}  result")
+
+    best = 0
+    sessions = args.start
+    while sessions <= args.max_sessions:
+        psutil.cpu_percent(interval=None)
+        lags = run_step(sessions, args.processes, args.duration)
+        cpu = psutil.cpu_percent(interval=None)
+        p95 = percentile(lags, 95) or 0.0
+        ok = bool(lags) and p95 <= args.target_ms
+        print(
+            f"{sessions:>8} {percentile(lags, 50) or 0:>8.1f} {p95:>8.1f} "
+            f"{percentile(lags, 99) or 0:>8.1f} {cpu:>6.1f}  {'✅' if ok else '❌'}"
+        )
+        if not ok:
+            break
+        best = sessions
+        sessions += args.step
+
+    print(f"\n{'='*60}")
+    print(f"Max sessions at target: {best}")
+    print(f"Sessions per core:      {best / cores:.1f}")
+    print("Use this to size WORKER_MAX_SESSIONS and WORKER_LOAD_THRESHOLD.")
+    print(f"{'='*60}\n")
+    return 0 if best else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Benchmark the idle job-pool memory footprint with and without VAD preloading.
+
+Each run starts N forkserver job processes that prewarm the VAD the way
+agent.prewarm does, then reports per-process prewarm time and memory. PSS is
+summed for the pool total because it splits copy-on-write pages fairly.
+
+Usage:
+    python scripts/vad_pool_benchmark.py               # 10, 25 and 50 processes
+    python scripts/vad_pool_benchmark.py --sizes 10 20
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+MODES = ("per-process", "preloaded")
+
+
+def prewarm_child(results, release) -> None:
+    """Job-process stand-in: prewarm, report, then idle until released."""
+    from service.shared_vad import get_shared_vad, is_inherited, memory_report
+
+    started = time.perf_counter()
+    get_shared_vad()
+    results.put({
+        "prewarm_ms": (time.perf_counter() - started) * 1000,
+        "inherited": is_inherited(),
+        **memory_report()
+    })
+    release.wait()
+
+
+def run_pool(mode: str, size: int) -> dict:
+    """Start one idle pool and summarise it (runs in a fresh interpreter)."""
+    from service.shared_vad import enable_forkserver_preload
+
+    if mode == "preloaded":
+        enable_forkserver_preload()
+    ctx = multiprocessing.get_context("forkserver")
+    results = ctx.Queue()
+    release = ctx.Event()
+
+    started = time.perf_counter()
+    procs = [ctx.Process(target=prewarm_child, args=(results, release)) for _ in range(size)]
+    for proc in procs:
+        proc.start()
+    reports = [results.get(timeout=300) for _ in procs]
+    ready_s = time.perf_counter() - started
+
+    release.set()
+    for proc in procs:
+        proc.join()
+
+    return {
+        "mode": mode,
+        "size": size,
+        "ready_s": round(ready_s, 1),
+        "avg_prewarm_ms": round(sum(r["prewarm_ms"] for r in reports) / size, 1),
+        "avg_rss_mb": round(sum(r["rss_mb"] for r in reports) / size, 1),
+        "avg_uss_mb": round(sum(r["uss_mb"] for r in reports) / size, 1),
+        "total_pss_mb": round(sum(r.get("pss_mb", r["rss_mb"]) for r in reports), 1),
+        "inherited": sum(1 for r in reports if r["inherited"]),
+    }
+
+
+def main():
+    """Run every (mode, size) combination in its own interpreter and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 25, 50], help="Pool sizes to test")
+    parser.add_argument("--run", nargs=2, metavar=("MODE", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        # Forkserver preload is fixed once the server starts, so each pool gets a fresh interpreter
+        print(json.dumps(run_pool(args.run[0], int(args.run[1]))))
+        return 0
+
+    print(f"\n📊 Idle pool memory benchmark ({', '.join(MODES)})\n")
+    print(f"{'mode':<12} {'procs':>5} {'ready s':>8} {'prewarm ms':>11} {'rss MB':>7} {'uss MB':>7} {'pool PSS MB':>12}")
+
+    for size in args.sizes:
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--run", mode, str(size)],
+                check=True,
+                capture_output=True,
+                text=True
+            ).stdout.strip().splitlines()[-1]
+            r = json.loads(output)
+            print(
+                f"{r['mode']:<12} {r['size']:>5} {r['ready_s']:>8} {r['avg_prewarm_ms']:>11} "
+                f"{r['avg_rss_mb']:>7} {r['avg_uss_mb']:>7} {r['total_pss_mb']:>12}"
+            )
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,8 @@ from tenacity import (
 )
 
 from config import settings
+from service.http_pool import http_pool
+from utils.context_cache import ContextCache
 from exceptions import GraphQLError, ResourceNotFoundError
 from models import ApplicationData
 
@@ -25,29 +27,17 @@ class ApplicationService:
     """Service to fetch application data from GraphQL API."""
     
     def __init__(self):
-        """Initialize the service with HTTP session."""
-        self._session: Optional[aiohttp.ClientSession] = None
+        """Initialize the service; HTTP connections come from the shared pool."""
         self.graphql_endpoint = settings.graphql_endpoint
         self.api_key = settings.rolevate_api_key
+        self.context_cache: Optional[ContextCache] = (
+            ContextCache(settings.context_cache_dir, settings.context_cache_ttl)
+            if settings.context_cache_enabled else None
+        )
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session with connection pooling."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=settings.http_timeout)
-            connector = aiohttp.TCPConnector(
-                limit=settings.http_max_connections,
-                limit_per_host=30
-            )
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector,
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": self.api_key
-                }
-            )
-            logger.info("Created new HTTP session for ApplicationService")
-        return self._session
+        """Get the HTTP session shared by every service of this job."""
+        return await http_pool.get_session()
     
     @retry(
         stop=stop_after_attempt(3),
@@ -74,6 +64,10 @@ class ApplicationService:
         if not application_id or not application_id.strip():
             raise ValueError("application_id cannot be empty")
         
+        cached = self.get_cached_application_data(application_id)
+        if cached:
+            return cached
+        
         query = """
         query Application($id: ID!) {
             application(id: $id) {
@@ -147,6 +141,8 @@ class ApplicationService:
                     )
                 
                 # Validate and parse with Pydantic
+                # Not written to the context cache: only webhook-warmed entries are
+                # served from it, and the webhook drops them when the application changes
                 validated_data = ApplicationData.model_validate(application_data)
                 
                 logger.info(
@@ -177,11 +173,42 @@ class ApplicationService:
             )
             raise
     
+    def get_cached_application_data(self, application_id: str) -> Optional[ApplicationData]:
+        """
+        Read application data warmed by the context webhook without any network call.
+        
+        Args:
+            application_id: The ID of the application
+            
+        Returns:
+            ApplicationData if a valid cached entry exists, otherwise None
+        """
+        if not self.context_cache:
+            return None
+        
+        cached = self.context_cache.get(application_id)
+        if not cached:
+            return None
+        
+        try:
+            validated_data = ApplicationData.model_validate(cached)
+        except ValueError as e:
+            logger.warning(
+                f"Discarding invalid cached application data: {e}",
+                extra={"application_id": application_id}
+            )
+            self.context_cache.delete(application_id)
+            return None
+        
+        logger.info(
+            "Using cached application data",
+            extra={"application_id": application_id}
+        )
+        return validated_data
+    
     async def close(self) -> None:
-        """Close the HTTP session and cleanup resources."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            logger.info("Closed HTTP session for ApplicationService")
+        """Release service resources; the shared HTTP session is closed by the pool at job end."""
+        logger.debug("Released ApplicationService")
     
     async def __aenter__(self):
         """Context manager entry."""
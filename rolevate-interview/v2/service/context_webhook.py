@@ -0,0 +1,117 @@
+"""
+Context Webhook - Optional receiver that warms the application context cache.
+The backend posts application data when an interview is scheduled, so the
+agent can greet the candidate without a GraphQL round-trip.
+
+Run alongside the worker on the same host:
+    python -m service.context_webhook
+"""
+
+import hmac
+import logging
+
+from aiohttp import web
+from pydantic import ValidationError
+
+from config import settings
+from models import ApplicationData
+from utils.context_cache import SAFE_KEY_PATTERN, ContextCache
+from utils.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER = "X-Webhook-Secret"
+
+
+def _authorized(request: web.Request) -> bool:
+    secret = request.app["secret"]
+    provided = request.headers.get(SECRET_HEADER, "")
+    return bool(secret) and hmac.compare_digest(provided.encode(), secret.encode())
+
+
+async def put_context(request: web.Request) -> web.Response:
+    """Validate and cache application data for one application."""
+    if not _authorized(request):
+        return web.json_response({"error": "unauthorized"}, status=401)
+
+    application_id = request.match_info["application_id"]
+    if not SAFE_KEY_PATTERN.match(application_id):
+        return web.json_response({"error": "invalid application id"}, status=400)
+
+    try:
+        body = await request.json()
+    except ValueError:
+        return web.json_response({"error": "invalid JSON"}, status=400)
+
+    # Accept either the raw application object or a GraphQL-style envelope
+    application = body.get("application", body) if isinstance(body, dict) else None
+    try:
+        ApplicationData.model_validate(application)
+    except ValidationError as e:
+        return web.json_response(
+            {"error": "invalid application data", "details": e.errors()},
+            status=422
+        )
+
+    cache: ContextCache = request.app["cache"]
+    if not cache.put(application_id, application):
+        return web.json_response({"error": "failed to store context"}, status=500)
+
+    logger.info("Cached application context", extra={"application_id": application_id})
+    return web.json_response({"cached": True, "application_id": application_id})
+
+
+async def delete_context(request: web.Request) -> web.Response:
+    """Drop cached data, e.g. when the application changes or is withdrawn."""
+    if not _authorized(request):
+        return web.json_response({"error": "unauthorized"}, status=401)
+
+    application_id = request.match_info["application_id"]
+    request.app["cache"].delete(application_id)
+    return web.json_response({"deleted": True, "application_id": application_id})
+
+
+async def health(request: web.Request) -> web.Response:
+    """Liveness probe."""
+    return web.json_response({"status": "ok"})
+
+
+def create_app(cache: ContextCache, secret: str) -> web.Application:
+    """
+    Build the webhook application.
+
+    Args:
+        cache: Cache shared with the worker processes
+        secret: Value expected in the X-Webhook-Secret header
+    """
+    app = web.Application(client_max_size=1024 * 1024)
+    app["cache"] = cache
+    app["secret"] = secret
+    app.router.add_put("/context/{application_id}", put_context)
+    app.router.add_post("/context/{application_id}", put_context)
+    app.router.add_delete("/context/{application_id}", delete_context)
+    app.router.add_get("/health", health)
+    return app
+
+
+def main() -> None:
+    """Run the webhook receiver."""
+    setup_logging()
+    if not settings.context_webhook_secret:
+        raise SystemExit("CONTEXT_WEBHOOK_SECRET must be set to run the context webhook")
+
+    cache = ContextCache(settings.context_cache_dir, settings.context_cache_ttl)
+    removed = cache.purge_expired()
+    logger.info(
+        "Starting context webhook",
+        extra={"port": settings.context_webhook_port, "purged": removed}
+    )
+    web.run_app(
+        create_app(cache, settings.context_webhook_secret),
+        port=settings.context_webhook_port,
+        print=None
+    )
+
+
+if __name__ == "__main__":
+    main()
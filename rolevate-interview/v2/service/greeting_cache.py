@@ -0,0 +1,151 @@
+"""
+Greeting Cache - Pre-synthesized greeting audio per worker process.
+The greeting is synthesized as soon as application data arrives, so the
+session can play it the moment it starts instead of waiting on TTS.
+
+Only the name-independent part of the greeting is cached, as raw PCM bytes,
+so any job in the process can replay it whatever event loop it runs on.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class SynthesizedAudio:
+    """Synthesized speech as 16-bit PCM chunks, one per TTS frame."""
+    sample_rate: int
+    num_channels: int
+    chunks: Tuple[bytes, ...]
+
+
+async def synthesize(tts: Any, text: str) -> SynthesizedAudio:
+    """Run TTS for text and copy the frames out as bytes."""
+    started = time.perf_counter()
+    chunks = []
+    sample_rate, num_channels = 0, 1
+    async with tts.synthesize(text) as stream:
+        async for audio in stream:
+            frame = audio.frame
+            sample_rate, num_channels = frame.sample_rate, frame.num_channels
+            chunks.append(bytes(frame.data))
+    logger.info(
+        "Greeting synthesized",
+        extra={
+            "frames": len(chunks),
+            "synthesis_ms": round((time.perf_counter() - started) * 1000)
+        }
+    )
+    return SynthesizedAudio(sample_rate, num_channels, tuple(chunks))
+
+
+class GreetingCache:
+    """LRU cache of synthesized audio keyed by (voice, text)."""
+
+    def __init__(self, max_entries: int = 64):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Greetings kept in memory; least recently used are evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, SynthesizedAudio]" = OrderedDict()
+        # Tasks belong to one event loop, so they are only shared within it
+        self._in_flight: Dict[CacheKey, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def prefetch(self, tts: Any, voice_id: str, text: str) -> "asyncio.Future[SynthesizedAudio]":
+        """
+        Start synthesizing a greeting, or reuse one cached or in flight on this loop.
+
+        Args:
+            tts: LiveKit TTS instance used by the session
+            voice_id: Voice the TTS is configured with, part of the cache key
+            text: Name-independent greeting text
+
+        Returns:
+            Future resolving to the synthesized audio
+        """
+        loop = asyncio.get_running_loop()
+        key = (voice_id, text)
+
+        audio = self._entries.get(key)
+        if audio is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            future = loop.create_future()
+            future.set_result(audio)
+            return future
+
+        task = self._in_flight.get(key)
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.hits += 1
+            return task
+
+        self.misses += 1
+        task = loop.create_task(self._synthesize_and_store(tts, key, text))
+        self._in_flight[key] = task
+        return task
+
+    async def _synthesize_and_store(self, tts: Any, key: CacheKey, text: str) -> SynthesizedAudio:
+        try:
+            audio = await synthesize(tts, text)
+        finally:
+            if self._in_flight.get(key) is asyncio.current_task():
+                del self._in_flight[key]
+        self._entries[key] = audio
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return audio
+
+    async def get(self, pending: Awaitable[SynthesizedAudio], timeout: float) -> Optional[SynthesizedAudio]:
+        """
+        Wait briefly for prefetched audio.
+
+        Returns:
+            The audio, or None if synthesis failed or is not ready in time
+        """
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Greeting audio not ready in time", extra={"timeout": timeout})
+        except Exception as e:
+            logger.warning(f"Greeting synthesis failed: {e}")
+        return None
+
+
+def _audio_frame(chunk: bytes, sample_rate: int, num_channels: int) -> Any:
+    from livekit import rtc
+
+    return rtc.AudioFrame(
+        data=chunk,
+        sample_rate=sample_rate,
+        num_channels=num_channels,
+        samples_per_channel=len(chunk) // (2 * num_channels)
+    )
+
+
+async def replay_frames(
+    *clips: SynthesizedAudio,
+    make_frame: Callable[[bytes, int, int], Any] = _audio_frame
+) -> AsyncIterator[Any]:
+    """Yield the clips back to back as the audio frames session.say() expects."""
+    for clip in clips:
+        for chunk in clip.chunks:
+            yield make_frame(chunk, clip.sample_rate, clip.num_channels)
+
+
+greeting_cache = GreetingCache(max_entries=settings.greeting_cache_size)
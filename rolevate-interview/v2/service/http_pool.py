@@ -0,0 +1,136 @@
+"""
+HTTP Pool - Process-wide aiohttp session registry.
+One ClientSession per event loop is shared by every service of a job, so the
+context fetch, interview create, transcript batches and completion reuse the
+same TLS connections to the GraphQL host.
+
+LiveKit runs each job on its own event loop, so connections are reused
+within a job only. The job closes its session on shutdown, before its loop
+goes away.
+"""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import aiohttp
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionStats:
+    """Connection reuse counters fed by an aiohttp TraceConfig."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Build a TraceConfig that updates these counters."""
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            self.requests += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.connections_reused += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self.dns_cache_misses += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters plus the connection reuse ratio."""
+        acquired = self.connections_created + self.connections_reused
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": round(self.connections_reused / acquired, 3) if acquired else 0.0,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+        }
+
+
+class HttpSessionPool:
+    """Registry of shared ClientSessions keyed by event loop."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._sessions: Dict[int, SimpleNamespace] = {}
+        self.stats = ConnectionStats()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        timeout = aiohttp.ClientTimeout(total=settings.http_timeout)
+        connector = aiohttp.TCPConnector(
+            limit=settings.http_max_connections,
+            limit_per_host=settings.http_limit_per_host,
+            ttl_dns_cache=settings.http_dns_cache_ttl,
+            keepalive_timeout=settings.http_keepalive_timeout
+        )
+        return aiohttp.ClientSession(
+            timeout=timeout,
+            connector=connector,
+            headers={
+                "Content-Type": "application/json",
+                "x-api-key": settings.rolevate_api_key
+            },
+            trace_configs=[self.stats.trace_config()]
+        )
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session for the running event loop, creating it on first use.
+
+        Returns:
+            ClientSession owned by the pool; callers must not close it
+        """
+        loop = asyncio.get_running_loop()
+        self._discard_closed_loops()
+
+        entry = self._sessions.get(id(loop))
+        if entry is None or entry.loop is not loop or entry.session.closed:
+            entry = SimpleNamespace(loop=loop, session=self._create_session())
+            self._sessions[id(loop)] = entry
+            logger.info(
+                "Created shared HTTP session",
+                extra={"sessions": len(self._sessions)}
+            )
+        return entry.session
+
+    def _discard_closed_loops(self) -> None:
+        # A session whose loop closed before close() ran cannot be closed any more;
+        # dropping it lets its sockets be garbage collected
+        for key, entry in list(self._sessions.items()):
+            if entry.loop.is_closed():
+                del self._sessions[key]
+                if not entry.session.closed:
+                    logger.warning("Dropped HTTP session left open by a finished job")
+
+    async def close(self) -> None:
+        """Close the session bound to the running loop; called when the job shuts down."""
+        entry = self._sessions.pop(id(asyncio.get_running_loop()), None)
+        if entry and not entry.session.closed:
+            await entry.session.close()
+            logger.info("Closed shared HTTP session", extra=self.stats.snapshot())
+
+
+http_pool = HttpSessionPool()
@@ -6,7 +6,6 @@ Manages interview records and transcripts via GraphQL API.
 import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-import uuid
 import aiohttp
 from tenacity import (
     retry,
@@ -17,6 +16,7 @@ from tenacity import (
 )
 
 from config import settings
+from service.http_pool import http_pool
 from exceptions import GraphQLError, InterviewError, TranscriptError
 from models import (
     CreateInterviewInput,
@@ -32,30 +32,14 @@ class InterviewService:
     """Service to manage interview records and transcripts in GraphQL."""
     
     def __init__(self):
-        """Initialize the service with HTTP session."""
-        self._session: Optional[aiohttp.ClientSession] = None
+        """Initialize the service; HTTP connections come from the shared pool."""
         self.graphql_endpoint = settings.graphql_endpoint
         self.api_key = settings.rolevate_api_key
         self.interview_id: Optional[str] = None
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session with connection pooling."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=settings.http_timeout)
-            connector = aiohttp.TCPConnector(
-                limit=settings.http_max_connections,
-                limit_per_host=30
-            )
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector,
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": self.api_key
-                }
-            )
-            logger.info("Created new HTTP session for InterviewService")
-        return self._session
+        """Get the HTTP session shared by every service of this job."""
+        return await http_pool.get_session()
     
     @retry(
         stop=stop_after_attempt(3),
@@ -136,7 +120,7 @@ class InterviewService:
         
         Args:
             application_id: The application ID this interview is for
-            interviewer_id: ID of the interviewer (auto-generated if None)
+            interviewer_id: ID of the interviewer; omitted if None, so the backend uses the candidate
             room_id: LiveKit room ID
             interview_type: Type of interview (VIDEO, PHONE, IN_PERSON)
             
@@ -157,11 +141,6 @@ class InterviewService:
         }
         """
         
-        # Use provided interviewerId or generate UUID for AI agent
-        if not interviewer_id:
-            interviewer_id = str(uuid.uuid4())
-            logger.debug(f"Generated AI interviewer ID: {interviewer_id}")
-        
         # Create input using Pydantic model
         interview_input = CreateInterviewInput(
             applicationId=application_id,
@@ -389,7 +368,7 @@ class InterviewService:
         )
         
         variables = {
-            "input": transcript.model_dump(by_alias=True, exclude_none=True)
+            "input": transcript.model_dump(mode="json", by_alias=True, exclude_none=True)
         }
         
         try:
@@ -451,8 +430,9 @@ class InterviewService:
                 interviewId=interview_id,
                 **transcript_data
             )
+            # mode="json" serializes the timestamp for the aiohttp JSON body
             inputs.append(
-                transcript.model_dump(by_alias=True, exclude_none=True)
+                transcript.model_dump(mode="json", by_alias=True, exclude_none=True)
             )
         
         variables = {"inputs": inputs}
@@ -484,10 +464,8 @@ class InterviewService:
             return False
     
     async def close(self) -> None:
-        """Close the HTTP session and cleanup resources."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            logger.info("Closed HTTP session for InterviewService")
+        """Release service resources; the shared HTTP session is closed by the pool at job end."""
+        logger.debug("Released InterviewService")
     
     async def __aenter__(self):
         """Context manager entry."""
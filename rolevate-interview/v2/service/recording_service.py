@@ -6,8 +6,7 @@ Handles LiveKit recording and AWS S3 upload with proper cleanup.
 import logging
 import asyncio
 from datetime import datetime
-from typing import Optional
-import boto3
+from typing import Optional, Tuple
 from botocore.exceptions import ClientError, BotoCoreError
 from livekit import api
 from tenacity import (
@@ -21,6 +20,7 @@ from tenacity import (
 from config import settings
 from exceptions import LiveKitError, AWSError, RecordingError
 from models import RecordingInfo
+from service.s3_client import run_s3
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +29,7 @@ class RecordingService:
     """Service to handle LiveKit recording and AWS S3 upload."""
     
     def __init__(self):
-        """Initialize LiveKit and S3 clients."""
+        """Initialize the LiveKit client; S3 calls use the shared client in service.s3_client."""
         self.livekit_url = settings.livekit_url
         self.livekit_api_key = settings.livekit_api_key
         self.livekit_api_secret = settings.livekit_api_secret
@@ -39,22 +39,7 @@ class RecordingService:
         
         self.recording_id: Optional[str] = None
         self.room_name: Optional[str] = None
-        
-        # Initialize S3 client
-        try:
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=settings.aws_access_key_id,
-                aws_secret_access_key=settings.aws_secret_access_key,
-                region_name=self.aws_region
-            )
-            logger.info("Initialized S3 client", extra={"region": self.aws_region})
-        except Exception as e:
-            logger.error(f"Failed to initialize S3 client: {e}")
-            raise AWSError(
-                f"Failed to initialize S3 client: {str(e)}",
-                details={"region": self.aws_region}
-            ) from e
+        self.profile = settings.recording_profile
         
         # Initialize LiveKit API client
         try:
@@ -70,6 +55,48 @@ class RecordingService:
                 f"Failed to initialize LiveKit API: {str(e)}"
             ) from e
     
+    def _build_egress_request(
+        self,
+        room_name: str,
+        s3_output_path: str
+    ) -> Tuple[api.RoomCompositeEgressRequest, str]:
+        """
+        Build the egress request for the configured recording profile.
+        
+        "audio" mixes every participant into one Opus/OGG file, which is all an
+        audio-only interview needs; "composite" records the grid video as MP4.
+        
+        Returns:
+            Tuple of (egress request, output file name)
+        """
+        audio_only = self.profile == "audio"
+        if audio_only:
+            filename = "recording.ogg"
+            file_type = api.EncodedFileType.OGG
+        else:
+            filename = "recording.mp4"
+            file_type = api.EncodedFileType.MP4
+        
+        request = api.RoomCompositeEgressRequest(
+            room_name=room_name,
+            audio_only=audio_only,
+            file_outputs=[
+                api.EncodedFileOutput(
+                    file_type=file_type,
+                    filepath=f"{s3_output_path}/{filename}",
+                    s3=api.S3Upload(
+                        access_key=settings.aws_access_key_id,
+                        secret=settings.aws_secret_access_key,
+                        region=self.aws_region,
+                        bucket=self.aws_bucket
+                    )
+                )
+            ]
+        )
+        if not audio_only:
+            request.layout = "grid"
+        return request, filename
+    
     @retry(
         stop=stop_after_attempt(2),
         wait=wait_exponential(multiplier=1, min=2, max=5),
@@ -117,25 +144,7 @@ class RecordingService:
                 }
             )
             
-            # Configure egress to record composite (combined audio + video)
-            egress_request = api.RoomCompositeEgressRequest(
-                room_name=room_name,
-                layout="grid",
-                audio_only=False,
-                video_only=False,
-                file_outputs=[
-                    api.EncodedFileOutput(
-                        file_type=api.EncodedFileType.MP4,
-                        filepath=f"{s3_output_path}/recording.mp4",
-                        s3=api.S3Upload(
-                            access_key=settings.aws_access_key_id,
-                            secret=settings.aws_secret_access_key,
-                            region=self.aws_region,
-                            bucket=self.aws_bucket
-                        )
-                    )
-                ]
-            )
+            egress_request, filename = self._build_egress_request(room_name, s3_output_path)
             
             # Start the egress (recording)
             egress = await self.livekit_api.egress.start_room_composite_egress(
@@ -148,7 +157,8 @@ class RecordingService:
                 extra={
                     "recording_id": self.recording_id,
                     "room_name": room_name,
-                    "s3_url": f"s3://{self.aws_bucket}/{s3_output_path}/recording.mp4"
+                    "profile": self.profile,
+                    "s3_url": f"s3://{self.aws_bucket}/{s3_output_path}/{filename}"
                 }
             )
             
@@ -179,10 +189,10 @@ class RecordingService:
     
     async def stop_recording(self) -> Optional[str]:
         """
-        Stop the current recording and retrieve S3 path.
+        Stop the current recording without waiting for the upload.
         
         Returns:
-            S3 URL of the recorded video if successful, None otherwise
+            Egress ID to pass to wait_for_recording_url(), or None if nothing was recording
             
         Raises:
             RecordingError: If recording fails to stop
@@ -197,52 +207,14 @@ class RecordingService:
                 extra={"recording_id": self.recording_id}
             )
             
-            # Stop the egress
             stop_request = api.StopEgressRequest(egress_id=self.recording_id)
             await self.livekit_api.egress.stop_egress(stop_request)
             
             logger.info(
-                "Recording stopped, waiting for upload",
-                extra={"recording_id": self.recording_id}
-            )
-            
-            # Wait for file to be uploaded to S3
-            await asyncio.sleep(5)
-            
-            # Get the egress info to retrieve file location
-            egress_list_response = await self.livekit_api.egress.list_egress(
-                api.ListEgressRequest(room_name=self.room_name)
-            )
-            
-            # Find our recording in the list
-            if hasattr(egress_list_response, 'items'):
-                for egress in egress_list_response.items:
-                    if egress.egress_id == self.recording_id:
-                        if hasattr(egress, 'file') and egress.file:
-                            if hasattr(egress.file, 'location'):
-                                s3_path = egress.file.location
-                                
-                                # Check if it's already a full URL
-                                if s3_path.startswith('http'):
-                                    logger.info(
-                                        "Recording uploaded successfully",
-                                        extra={"recording_url": s3_path}
-                                    )
-                                    return s3_path
-                                else:
-                                    # Construct full S3 path
-                                    full_path = f"s3://{self.aws_bucket}/{s3_path}"
-                                    logger.info(
-                                        "Recording uploaded successfully",
-                                        extra={"recording_url": full_path}
-                                    )
-                                    return full_path
-            
-            logger.warning(
-                "Could not retrieve S3 path from egress response",
+                "Recording stopped, upload continues in the background",
                 extra={"recording_id": self.recording_id}
             )
-            return None
+            return self.recording_id
             
         except Exception as e:
             logger.error(
@@ -255,6 +227,115 @@ class RecordingService:
                 details={"recording_id": self.recording_id}
             ) from e
     
+    async def _get_egress(self, egress_id: str):
+        """Fetch a single egress by ID instead of scanning the room's list."""
+        response = await self.livekit_api.egress.list_egress(
+            api.ListEgressRequest(egress_id=egress_id)
+        )
+        for egress in getattr(response, 'items', []):
+            if egress.egress_id == egress_id:
+                return egress
+        return None
+    
+    def _recording_location(self, egress) -> Optional[str]:
+        """Extract the uploaded file location as an http(s) or s3:// URL."""
+        location = None
+        file_results = getattr(egress, 'file_results', None)
+        if file_results:
+            location = file_results[0].location
+        elif getattr(egress, 'file', None) and getattr(egress.file, 'location', None):
+            location = egress.file.location
+        
+        if not location:
+            return None
+        if location.startswith('http') or location.startswith('s3://'):
+            return location
+        return f"s3://{self.aws_bucket}/{location}"
+    
+    def _recording_size(self, egress) -> dict:
+        """Stored bytes and bytes per minute, for comparing recording profiles."""
+        file_results = getattr(egress, 'file_results', None)
+        if not file_results:
+            return {"profile": self.profile}
+        
+        size_bytes = file_results[0].size
+        minutes = file_results[0].duration / 60e9  # duration is in nanoseconds
+        return {
+            "profile": self.profile,
+            "size_bytes": size_bytes,
+            "duration_minutes": round(minutes, 2),
+            "bytes_per_minute": round(size_bytes / minutes) if minutes > 0 else None
+        }
+    
+    async def wait_for_recording_url(
+        self,
+        egress_id: str,
+        deadline: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Poll the egress with exponential backoff until its upload completes.
+        
+        Args:
+            egress_id: Egress returned by stop_recording()
+            deadline: Maximum seconds to wait (defaults to settings.recording_poll_deadline)
+            
+        Returns:
+            Recording URL, or None if the egress failed or the deadline passed
+        """
+        loop = asyncio.get_running_loop()
+        give_up_at = loop.time() + (deadline or settings.recording_poll_deadline)
+        delay = settings.recording_poll_initial_delay
+        attempts = 0
+        
+        while True:
+            attempts += 1
+            try:
+                egress = await self._get_egress(egress_id)
+            except Exception as e:
+                logger.warning(
+                    f"Egress status check failed: {e}",
+                    extra={"recording_id": egress_id, "attempt": attempts}
+                )
+                egress = None
+            
+            if egress is not None:
+                if egress.status == api.EgressStatus.EGRESS_COMPLETE:
+                    url = self._recording_location(egress)
+                    logger.info(
+                        "Recording uploaded successfully",
+                        extra={
+                            "recording_url": url,
+                            "attempts": attempts,
+                            **self._recording_size(egress)
+                        }
+                    )
+                    return url
+                if egress.status in (
+                    api.EgressStatus.EGRESS_FAILED,
+                    api.EgressStatus.EGRESS_ABORTED,
+                    api.EgressStatus.EGRESS_LIMIT_REACHED
+                ):
+                    logger.error(
+                        "Recording egress did not complete",
+                        extra={
+                            "recording_id": egress_id,
+                            "status": api.EgressStatus.Name(egress.status),
+                            "error": getattr(egress, 'error', '')
+                        }
+                    )
+                    return None
+            
+            remaining = give_up_at - loop.time()
+            if remaining <= 0:
+                logger.warning(
+                    "Timed out waiting for recording upload",
+                    extra={"recording_id": egress_id, "attempts": attempts}
+                )
+                return None
+            
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, settings.recording_poll_max_interval)
+    
     async def get_recording_status(self) -> Optional[RecordingInfo]:
         """
         Get the status of the current recording.
@@ -269,22 +350,17 @@ class RecordingService:
             return None
         
         try:
-            egress_list_response = await self.livekit_api.egress.list_egress(
-                api.ListEgressRequest(room_name=self.room_name)
-            )
-            
-            if hasattr(egress_list_response, 'items'):
-                for egress in egress_list_response.items:
-                    if egress.egress_id == self.recording_id:
-                        recording_info = RecordingInfo(
-                            egress_id=egress.egress_id,
-                            status=str(egress.status),
-                            started_at=egress.started_at if hasattr(egress, 'started_at') else None,
-                            ended_at=egress.ended_at if hasattr(egress, 'ended_at') else None
-                        )
-                        return recording_info
+            egress = await self._get_egress(self.recording_id)
+            if egress is None:
+                return None
             
-            return None
+            return RecordingInfo(
+                egress_id=egress.egress_id,
+                status=str(egress.status),
+                started_at=egress.started_at if hasattr(egress, 'started_at') else None,
+                ended_at=egress.ended_at if hasattr(egress, 'ended_at') else None,
+                s3_path=self._recording_location(egress)
+            )
             
         except Exception as e:
             logger.error(
@@ -296,16 +372,17 @@ class RecordingService:
                 details={"recording_id": self.recording_id}
             ) from e
     
-    def generate_presigned_url(
+    async def generate_presigned_url(
         self,
         s3_path: str,
         expiration: int = 3600
     ) -> Optional[str]:
         """
-        Generate a presigned URL for the recorded video.
+        Generate a presigned URL for the recorded file.
+        Runs on the shared S3 executor so the event loop is never blocked.
         
         Args:
-            s3_path: S3 path to the video file
+            s3_path: S3 path to the recorded file
             expiration: URL expiration time in seconds (default 1 hour)
             
         Returns:
@@ -328,13 +405,15 @@ class RecordingService:
                 logger.error("S3 key is empty, cannot generate presigned URL")
                 return None
             
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': self.aws_bucket,
-                    'Key': s3_path
-                },
-                ExpiresIn=expiration
+            url = await run_s3(
+                lambda client: client.generate_presigned_url(
+                    'get_object',
+                    Params={
+                        'Bucket': self.aws_bucket,
+                        'Key': s3_path
+                    },
+                    ExpiresIn=expiration
+                )
             )
             
             logger.info(
@@ -357,7 +436,7 @@ class RecordingService:
     async def close(self) -> None:
         """Close and cleanup resources."""
         # LiveKit API client doesn't need explicit cleanup
-        # S3 client is managed by boto3
+        # The S3 client is shared per process and outlives this service
         logger.info("RecordingService cleanup completed")
     
     async def __aenter__(self):
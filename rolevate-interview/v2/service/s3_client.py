@@ -0,0 +1,64 @@
+"""
+S3 Client - Process-wide boto3 client and bounded executor.
+boto3 is synchronous, so every S3 call runs on a small dedicated thread pool
+instead of blocking the event loop that serves live audio.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+import boto3
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_client: Optional[Any] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_s3_client():
+    """Return the shared S3 client; boto3 clients are thread-safe."""
+    global _client
+    with _lock:
+        if _client is None:
+            _client = boto3.client(
+                's3',
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                region_name=settings.aws_region
+            )
+            logger.info("Initialized S3 client", extra={"region": settings.aws_region})
+        return _client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.s3_max_workers,
+                thread_name_prefix="s3"
+            )
+        return _executor
+
+
+async def run_s3(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking S3 call on the bounded executor.
+
+    Args:
+        func: Callable taking the shared client as its first argument
+    """
+    def call() -> T:
+        # Client creation also blocks, so it happens on the executor too
+        return func(get_s3_client(), *args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), call)
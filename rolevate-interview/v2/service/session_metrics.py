@@ -0,0 +1,120 @@
+"""
+Session Metrics - Latency collector for interview voice sessions.
+Listens to AgentSession "metrics_collected" events and records per-turn stage
+latencies plus job milestones, emitting percentile summaries as structured logs.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from utils.latency_stats import LatencyWindow
+
+logger = logging.getLogger(__name__)
+
+# Stages combined into the end-of-speech to first-audio latency of a turn
+TURN_STAGES = ("eou_delay", "llm_ttft", "tts_ttfb")
+MAX_OPEN_TURNS = 50
+
+# Shared by every session in this worker process
+worker_latency = LatencyWindow()
+
+
+class SessionMetricsCollector:
+    """Collects stage latencies for one interview session."""
+
+    def __init__(self, room_name: str, report_interval: float = 60.0, max_samples: int = 500):
+        """
+        Initialize the collector.
+
+        Args:
+            room_name: Room the session belongs to, included in every record
+            report_interval: Seconds between periodic summary records (0 disables)
+            max_samples: Samples kept per stage for this session
+        """
+        self.room_name = room_name
+        self.report_interval = report_interval
+        self.session_latency = LatencyWindow(max_samples)
+        self._open_turns: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._report_task: Optional[asyncio.Task] = None
+
+    def attach(self, session: Any) -> None:
+        """Subscribe to the session's metrics events and start periodic reporting."""
+        session.on("metrics_collected", self._on_metrics_collected)
+        if self._report_task is None and self.report_interval > 0:
+            self._report_task = asyncio.create_task(self._report_loop())
+
+    def record(self, stage: str, value_ms: float) -> None:
+        """Record a sample for this session and the worker-wide window."""
+        self.session_latency.record(stage, value_ms)
+        worker_latency.record(stage, value_ms)
+
+    def record_milestone(self, name: str, value_ms: float) -> None:
+        """Record a one-off job milestone such as dispatch_to_connect."""
+        self.record(name, value_ms)
+        logger.info(
+            "Session milestone",
+            extra={"room_name": self.room_name, "milestone": name, "ms": round(value_ms)}
+        )
+
+    def _on_metrics_collected(self, event: Any) -> None:
+        metrics = getattr(event, "metrics", event)
+        kind = getattr(metrics, "type", None)
+        speech_id = getattr(metrics, "speech_id", None)
+
+        if kind == "eou_metrics":
+            # Both delays are measured from the moment VAD detected end of speech
+            self._record_turn_stage(speech_id, "eou_delay", metrics.end_of_utterance_delay)
+            self.record("stt_final", metrics.transcription_delay * 1000)
+        elif kind == "llm_metrics":
+            self._record_turn_stage(speech_id, "llm_ttft", metrics.ttft)
+        elif kind == "tts_metrics":
+            self._record_turn_stage(speech_id, "tts_ttfb", metrics.ttfb)
+
+    def _record_turn_stage(self, speech_id: Optional[str], stage: str, seconds: float) -> None:
+        if seconds is None or seconds < 0:
+            return
+        value_ms = seconds * 1000
+        self.record(stage, value_ms)
+        if not speech_id:
+            return
+
+        turn = self._open_turns.setdefault(speech_id, {})
+        # LLM and TTS can report several times per turn; the first one is what the user waits on
+        turn.setdefault(stage, value_ms)
+        if all(s in turn for s in TURN_STAGES):
+            self.record("turn_latency", sum(turn[s] for s in TURN_STAGES))
+            del self._open_turns[speech_id]
+        while len(self._open_turns) > MAX_OPEN_TURNS:
+            self._open_turns.popitem(last=False)
+
+    def report(self) -> None:
+        """Emit one structured record with session and worker percentiles."""
+        summary = self.session_latency.summary()
+        if not summary:
+            return
+        logger.info(
+            "Latency summary",
+            extra={
+                "room_name": self.room_name,
+                "session": summary,
+                "worker": worker_latency.summary()
+            }
+        )
+
+    async def _report_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)
+            self.report()
+
+    async def close(self) -> None:
+        """Stop periodic reporting and emit a final summary."""
+        if self._report_task:
+            self._report_task.cancel()
+            try:
+                await self._report_task
+            except asyncio.CancelledError:
+                pass
+            self._report_task = None
+        self.report()
@@ -0,0 +1,88 @@
+"""
+Shared VAD - One read-only Silero VAD model per worker.
+With preloading enabled the forkserver imports this module and loads the model
+before any job process is forked, so every job process inherits it
+copy-on-write instead of loading its own copy.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_ENV = "ROLEVATE_VAD_PRELOAD"
+
+_vad: Optional[Any] = None
+_vad_lock = threading.Lock()
+_loaded_in_pid: Optional[int] = None
+
+
+def _load() -> Any:
+    from livekit.plugins import silero
+
+    return silero.VAD.load()
+
+
+def get_shared_vad() -> Any:
+    """
+    Return the process-wide VAD, loading it on first use.
+
+    Job processes forked from a preloaded forkserver get the inherited model
+    immediately; thread-executor sessions in one process share a single load.
+    """
+    global _vad, _loaded_in_pid
+    with _vad_lock:
+        if _vad is None:
+            _vad = _load()
+            _loaded_in_pid = os.getpid()
+        return _vad
+
+
+def is_inherited() -> bool:
+    """Whether this process uses a model loaded by its parent."""
+    return _vad is not None and _loaded_in_pid != os.getpid()
+
+
+def enable_forkserver_preload() -> None:
+    """
+    Make the forkserver load the VAD before it forks job processes.
+
+    Must run in the main worker process before the job pool starts. Has no
+    effect on platforms where LiveKit spawns job processes instead.
+    """
+    os.environ[PRELOAD_ENV] = "1"
+    multiprocessing.set_forkserver_preload([__name__])
+
+
+def memory_report() -> Dict[str, float]:
+    """Resident, unique and proportional memory of this process, in MB."""
+    info = psutil.Process().memory_full_info()
+    report = {
+        "rss_mb": round(info.rss / 1e6, 1),
+        "uss_mb": round(info.uss / 1e6, 1),
+    }
+    # PSS splits shared pages between processes; Linux only
+    if hasattr(info, "pss"):
+        report["pss_mb"] = round(info.pss / 1e6, 1)
+    return report
+
+
+# Runs when the forkserver imports this module as a preload. The main worker
+# imports it before enable_forkserver_preload() sets the flag, so it never loads.
+if os.environ.get(PRELOAD_ENV) == "1":
+    started = time.perf_counter()
+    try:
+        get_shared_vad()
+        logger.info(
+            "VAD preloaded for job processes",
+            extra={"load_ms": round((time.perf_counter() - started) * 1000)}
+        )
+    except Exception as e:
+        # Job processes fall back to loading their own copy
+        logger.warning(f"VAD preload failed: {e}")
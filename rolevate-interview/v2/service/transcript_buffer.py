@@ -0,0 +1,163 @@
+"""
+Transcript Buffer - Batches utterances per interview for bulk persistence.
+Replaces one createTranscript mutation per utterance with a handful of
+createBulkTranscripts calls flushed on size, on a timer, and on cleanup.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+FlushFn = Callable[[str, List[Dict[str, Any]]], Awaitable[bool]]
+
+
+class TranscriptBuffer:
+    """In-memory, order-preserving transcript buffer for a single interview."""
+
+    def __init__(
+        self,
+        interview_id: str,
+        flush_fn: FlushFn,
+        max_batch_size: int = 20,
+        flush_interval: float = 15.0,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            interview_id: Interview the transcripts belong to
+            flush_fn: Coroutine persisting a batch, e.g. InterviewService.add_transcripts_bulk
+            max_batch_size: Pending entries that trigger a flush
+            flush_interval: Seconds between periodic flushes
+        """
+        self.interview_id = interview_id
+        self._flush_fn = flush_fn
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.flush_count = 0
+        self.flushed_entries = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of entries waiting to be flushed."""
+        return len(self._pending)
+
+    def add(
+        self,
+        content: str,
+        speaker: str,
+        language: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Buffer an utterance without touching the network.
+
+        Returns:
+            True when the batch size threshold is reached and a flush should be scheduled
+        """
+        if self._closed:
+            logger.warning(
+                "Transcript added after buffer closed",
+                extra={"interview_id": self.interview_id, "speaker": speaker}
+            )
+            return False
+
+        entry: Dict[str, Any] = {
+            "content": content,
+            "speaker": speaker,
+            "timestamp": timestamp or datetime.utcnow(),
+        }
+        if language:
+            entry["language"] = language
+        self._pending.append(entry)
+        return len(self._pending) >= self.max_batch_size
+
+    def start(self) -> None:
+        """Start the periodic flush timer."""
+        if self._timer_task is None and self.flush_interval > 0:
+            self._timer_task = asyncio.create_task(self._timer_loop())
+
+    async def _timer_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> bool:
+        """
+        Persist all pending entries in one bulk call.
+
+        Flushes are serialized so entries reach the backend in order. On failure
+        the batch is put back in front of anything buffered meanwhile.
+
+        Returns:
+            True if nothing was pending or the batch was stored
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return True
+
+            batch, self._pending = self._pending, []
+            try:
+                stored = await self._flush_fn(self.interview_id, batch)
+            except Exception as e:
+                logger.error(
+                    f"Transcript flush raised: {e}",
+                    extra={"interview_id": self.interview_id, "count": len(batch)}
+                )
+                stored = False
+            except BaseException:
+                # Cancelled mid-flush (e.g. a write queue drain timed out): keep the batch
+                self._pending = batch + self._pending
+                raise
+
+            if not stored:
+                self._pending = batch + self._pending
+                logger.warning(
+                    "Transcript flush failed, keeping batch for retry",
+                    extra={"interview_id": self.interview_id, "count": len(batch)}
+                )
+                return False
+
+            self.flush_count += 1
+            self.flushed_entries += len(batch)
+            logger.debug(
+                "Flushed transcripts",
+                extra={"interview_id": self.interview_id, "count": len(batch)}
+            )
+            return True
+
+    async def close(self) -> bool:
+        """Stop the timer and flush whatever is left."""
+        self._closed = True
+        if self._timer_task:
+            self._timer_task.cancel()
+            try:
+                await self._timer_task
+            except asyncio.CancelledError:
+                pass
+            self._timer_task = None
+
+        stored = await self.flush()
+        if not stored:
+            logger.error(
+                "Dropping unsaved transcripts on close",
+                extra={"interview_id": self.interview_id, "count": len(self._pending)}
+            )
+        logger.info(
+            "Transcript buffer closed",
+            extra={
+                "interview_id": self.interview_id,
+                "flushes": self.flush_count,
+                "entries": self.flushed_entries
+            }
+        )
+        return stored
@@ -0,0 +1,84 @@
+"""
+Worker Load - Measured capacity reporting for the LiveKit dispatcher.
+The worker reports the highest of CPU, memory and session-slot utilisation,
+so jobs stop being assigned once any of them reaches the load threshold.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import psutil
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+LOG_INTERVAL_SECONDS = 30.0
+
+
+def compute_load(
+    cpu_fraction: float,
+    memory_fraction: float,
+    active_sessions: int,
+    max_sessions: int
+) -> float:
+    """
+    Combine resource readings into one 0-1 load value.
+
+    Args:
+        cpu_fraction: Smoothed host CPU utilisation (0-1)
+        memory_fraction: Host memory utilisation (0-1)
+        active_sessions: Interviews currently running on this worker
+        max_sessions: Session cap for the worker (0 disables the session term)
+
+    Returns:
+        The most constrained resource, clamped to [0, 1]
+    """
+    session_fraction = active_sessions / max_sessions if max_sessions > 0 else 0.0
+    return max(0.0, min(1.0, max(cpu_fraction, memory_fraction, session_fraction)))
+
+
+class WorkerLoadMonitor:
+    """Samples host resources each time the dispatcher asks for load."""
+
+    def __init__(self, max_sessions: int, window: int = 5):
+        """
+        Initialize the monitor.
+
+        Args:
+            max_sessions: Session cap for the worker (0 disables the session term)
+            window: CPU samples averaged to smooth out short spikes
+        """
+        self.max_sessions = max_sessions
+        self._cpu_samples: Deque[float] = deque(maxlen=window)
+        self._last_logged = 0.0
+        self.last_reading: Dict[str, Any] = {}
+        # Prime psutil so the first non-blocking reading is meaningful
+        psutil.cpu_percent(interval=None)
+
+    def __call__(self, worker: Optional[Any] = None) -> float:
+        """LiveKit load_fnc: called periodically by the worker with itself."""
+        self._cpu_samples.append(psutil.cpu_percent(interval=None) / 100)
+        cpu_fraction = sum(self._cpu_samples) / len(self._cpu_samples)
+        memory_fraction = psutil.virtual_memory().percent / 100
+        active_sessions = len(getattr(worker, "active_jobs", None) or [])
+
+        load = compute_load(cpu_fraction, memory_fraction, active_sessions, self.max_sessions)
+        self.last_reading = {
+            "load": round(load, 3),
+            "cpu": round(cpu_fraction, 3),
+            "memory": round(memory_fraction, 3),
+            "active_sessions": active_sessions,
+            "max_sessions": self.max_sessions
+        }
+
+        now = time.monotonic()
+        if now - self._last_logged >= LOG_INTERVAL_SECONDS:
+            self._last_logged = now
+            logger.info("Worker load", extra=self.last_reading)
+        return load
+
+
+worker_load = WorkerLoadMonitor(max_sessions=settings.worker_max_sessions)
@@ -0,0 +1,127 @@
+"""
+Write Queue - Bounded in-flight manager for background writes.
+A single consumer coroutine runs submitted jobs in order, so finished work
+is released immediately instead of accumulating task references.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+WriteJob = Callable[[], Awaitable[object]]
+
+
+class WriteQueue:
+    """Bounded queue of write jobs drained by one consumer coroutine."""
+
+    def __init__(self, name: str, max_pending: int = 50):
+        """
+        Initialize the queue.
+
+        Args:
+            name: Queue name used in logs
+            max_pending: Maximum jobs waiting; further submissions are rejected
+        """
+        self.name = name
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._running_job = False
+
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        """Jobs queued or currently running."""
+        queued = self._queue.qsize() if self._queue else 0
+        return queued + (1 if self._running_job else 0)
+
+    def _ensure_consumer(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.create_task(self._consume())
+        return self._queue
+
+    def submit(self, job: WriteJob) -> bool:
+        """
+        Enqueue a write job without blocking the caller.
+
+        Returns:
+            False if the queue is full and the job was rejected
+        """
+        queue = self._ensure_consumer()
+        try:
+            queue.put_nowait(job)
+            return True
+        except asyncio.QueueFull:
+            self.rejected += 1
+            logger.warning(
+                "Write queue full, rejecting job",
+                extra={"queue": self.name, "pending": self.pending}
+            )
+            return False
+
+    async def _consume(self) -> None:
+        assert self._queue is not None
+        while True:
+            job = await self._queue.get()
+            self._running_job = True
+            try:
+                await job()
+                self.completed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(
+                    f"Write job failed: {e}",
+                    extra={"queue": self.name}
+                )
+            finally:
+                self._running_job = False
+                self._queue.task_done()
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        Wait for queued jobs to finish, then stop the consumer.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if everything finished before the timeout
+        """
+        drained = True
+        if self._queue is not None and self._consumer is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                drained = False
+                logger.warning(
+                    "Write queue drain timed out",
+                    extra={"queue": self.name, "pending": self.pending, "timeout": timeout}
+                )
+
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+        logger.info(
+            "Write queue drained",
+            extra={
+                "queue": self.name,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected
+            }
+        )
+        return drained
@@ -1,8 +1,22 @@
 """Test configuration and fixtures."""
+import os
 import pytest
 import asyncio
 from typing import Generator
 
+# Required settings so modules importing config can be tested without a .env file
+for _name, _value in {
+    "GRAPHQL_ENDPOINT": "http://localhost:4000/graphql",
+    "ROLEVATE_API_KEY": "test-api-key",
+    "LIVEKIT_URL": "ws://localhost:7880",
+    "LIVEKIT_API_KEY": "test-livekit-key",
+    "LIVEKIT_API_SECRET": "test-livekit-secret",
+    "AWS_ACCESS_KEY_ID": "test-access-key",
+    "AWS_SECRET_ACCESS_KEY": "test-secret-key",
+    "AWS_BUCKET_NAME": "test-bucket",
+}.items():
+    os.environ.setdefault(_name, _value)
+
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
@@ -0,0 +1,52 @@
+"""Tests for the warm application context cache."""
+import json
+import os
+from utils.context_cache import ContextCache
+
+
+class TestContextCache:
+    """Test suite for ContextCache."""
+
+    def test_put_then_get_roundtrip(self, tmp_path, mock_application_data):
+        """Test stored payloads are returned unchanged."""
+        cache = ContextCache(str(tmp_path), ttl_seconds=60)
+        assert cache.put("app-1", mock_application_data) is True
+        assert cache.get("app-1") == mock_application_data
+
+    def test_missing_entry_returns_none(self, tmp_path):
+        """Test a cache miss returns None, including a missing directory."""
+        cache = ContextCache(str(tmp_path / "absent"), ttl_seconds=60)
+        assert cache.get("app-1") is None
+        assert cache.purge_expired() == 0
+
+    def test_expired_entry_is_removed(self, tmp_path, mock_application_data):
+        """Test entries older than the TTL are treated as missing and deleted."""
+        cache = ContextCache(str(tmp_path), ttl_seconds=60)
+        path = tmp_path / "app-1.json"
+        path.write_text(json.dumps({"stored_at": 0, "data": mock_application_data}))
+
+        assert cache.get("app-1") is None
+        assert not path.exists()
+
+    def test_unsafe_ids_are_rejected(self, tmp_path, mock_application_data):
+        """Test ids that could escape the cache directory are never used as paths."""
+        cache = ContextCache(str(tmp_path), ttl_seconds=60)
+        assert cache.put("../escape", mock_application_data) is False
+        assert cache.get("../escape") is None
+        assert os.listdir(tmp_path) == []
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test unreadable files do not raise."""
+        cache = ContextCache(str(tmp_path), ttl_seconds=60)
+        (tmp_path / "app-1.json").write_text("{not json")
+        assert cache.get("app-1") is None
+
+    def test_purge_expired(self, tmp_path, mock_application_data):
+        """Test purge removes only stale entries."""
+        cache = ContextCache(str(tmp_path), ttl_seconds=60)
+        cache.put("fresh", mock_application_data)
+        cache.put("stale", mock_application_data)
+        os.utime(tmp_path / "stale.json", (0, 0))
+
+        assert cache.purge_expired() == 1
+        assert cache.get("fresh") == mock_application_data
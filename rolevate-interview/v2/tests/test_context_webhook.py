@@ -0,0 +1,52 @@
+"""Tests for the context webhook receiver."""
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from service.context_webhook import SECRET_HEADER, create_app
+from utils.context_cache import ContextCache
+
+SECRET = "test-secret"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache in a fresh directory."""
+    return ContextCache(str(tmp_path), ttl_seconds=60)
+
+
+async def put(cache, application_id, body, secret=SECRET):
+    async with TestClient(TestServer(create_app(cache, SECRET))) as client:
+        response = await client.put(
+            f"/context/{application_id}",
+            json=body,
+            headers={SECRET_HEADER: secret}
+        )
+        return response.status
+
+
+class TestContextWebhook:
+    """Test suite for the context webhook."""
+
+    @pytest.mark.asyncio
+    async def test_put_warms_cache(self, cache, mock_application_data):
+        """Test valid application data is stored."""
+        assert await put(cache, "app-1", {"application": mock_application_data}) == 200
+        assert cache.get("app-1") == mock_application_data
+
+    @pytest.mark.asyncio
+    async def test_wrong_secret_is_rejected(self, cache, mock_application_data):
+        """Test requests without the shared secret are refused."""
+        assert await put(cache, "app-1", mock_application_data, secret="nope") == 401
+        assert cache.get("app-1") is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_payloads_are_client_errors(self, cache, mock_application_data):
+        """Test bad ids and bad data are 4xx."""
+        assert await put(cache, "bad.id", mock_application_data) == 400
+        assert await put(cache, "app-1", {"candidate": {}}) == 422
+
+    @pytest.mark.asyncio
+    async def test_storage_failure_is_server_error(self, cache, mock_application_data, monkeypatch):
+        """Test a failed write is reported as 500 so the backend retries."""
+        monkeypatch.setattr(cache, "put", lambda application_id, data: False)
+        assert await put(cache, "app-1", mock_application_data) == 500
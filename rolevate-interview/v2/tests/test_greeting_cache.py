@@ -0,0 +1,136 @@
+"""Tests for the pre-synthesized greeting cache."""
+import asyncio
+from types import SimpleNamespace
+import pytest
+from service.greeting_cache import GreetingCache, SynthesizedAudio, replay_frames
+
+
+class FakeStream:
+    """Async context manager yielding synthesized audio events."""
+
+    def __init__(self, chunks, delay=0.0):
+        self.chunks = chunks
+        self.delay = delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self._events()
+
+    async def _events(self):
+        for chunk in self.chunks:
+            await asyncio.sleep(self.delay)
+            frame = SimpleNamespace(data=memoryview(chunk), sample_rate=24000, num_channels=1)
+            yield SimpleNamespace(frame=frame)
+
+
+class FakeTTS:
+    """TTS double counting synthesize() calls."""
+
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def synthesize(self, text):
+        self.calls += 1
+        return FakeStream([f"{text}-1".encode(), f"{text}-2".encode()], self.delay)
+
+
+def audio(text):
+    return SynthesizedAudio(24000, 1, (f"{text}-1".encode(), f"{text}-2".encode()))
+
+
+class TestGreetingCache:
+    """Test suite for GreetingCache."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_reuses_synthesis(self):
+        """Test the same greeting and voice is synthesized once."""
+        cache = GreetingCache()
+        tts = FakeTTS()
+        first = cache.prefetch(tts, "voice", "Hello")
+        second = cache.prefetch(tts, "voice", "Hello")
+
+        assert await cache.get(first, timeout=1) == audio("Hello")
+        assert first is second
+        assert await cache.get(cache.prefetch(tts, "voice", "Hello"), timeout=1) == audio("Hello")
+        assert tts.calls == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_cached_audio_is_shared_across_event_loops(self):
+        """Test a later job on another loop replays stored bytes instead of a foreign task."""
+        cache = GreetingCache()
+        tts = FakeTTS()
+
+        async def job():
+            return await cache.get(cache.prefetch(tts, "voice", "Hello"), timeout=1)
+
+        assert asyncio.run(job()) == audio("Hello")
+        assert asyncio.run(job()) == audio("Hello")
+        assert tts.calls == 1
+        assert cache._in_flight == {}
+
+    def test_in_flight_task_is_not_joined_from_another_loop(self):
+        """Test a synthesis still running on one loop is not awaited from another."""
+        cache = GreetingCache()
+        other_loop = asyncio.new_event_loop()
+        try:
+            foreign = other_loop.create_task(asyncio.sleep(10))
+            cache._in_flight[("voice", "Hello")] = foreign
+
+            async def job():
+                return await cache.get(cache.prefetch(FakeTTS(), "voice", "Hello"), timeout=1)
+
+            assert asyncio.run(job()) == audio("Hello")
+            assert cache.misses == 1
+            foreign.cancel()
+            other_loop.run_until_complete(asyncio.gather(foreign, return_exceptions=True))
+        finally:
+            other_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_synthesis_is_retried(self):
+        """Test a failed synthesis is not cached."""
+        cache = GreetingCache()
+
+        class FailingTTS:
+            def synthesize(self, text):
+                raise RuntimeError("tts down")
+
+        assert await cache.get(cache.prefetch(FailingTTS(), "voice", "Hi"), timeout=1) is None
+        tts = FakeTTS()
+        assert await cache.get(cache.prefetch(tts, "voice", "Hi"), timeout=1) == audio("Hi")
+        assert tts.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_get_times_out_without_cancelling(self):
+        """Test a slow synthesis returns None but keeps running for later use."""
+        cache = GreetingCache()
+        task = cache.prefetch(FakeTTS(delay=0.05), "voice", "Hi")
+
+        assert await cache.get(task, timeout=0.01) is None
+        assert await cache.get(task, timeout=1) == audio("Hi")
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test the least recently used greeting is evicted first."""
+        cache = GreetingCache(max_entries=1)
+        tts = FakeTTS()
+        await cache.prefetch(tts, "voice", "A")
+        await cache.prefetch(tts, "voice", "B")
+        await cache.prefetch(tts, "voice", "A")
+        assert tts.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_replay_frames(self):
+        """Test clips are replayed back to back in order."""
+        frames = [
+            frame async for frame in replay_frames(
+                audio("name"), audio("rest"), make_frame=lambda chunk, rate, channels: chunk
+            )
+        ]
+        assert frames == [b"name-1", b"name-2", b"rest-1", b"rest-2"]
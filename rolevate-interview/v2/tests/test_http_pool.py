@@ -0,0 +1,104 @@
+"""Tests for the shared HTTP session pool."""
+import asyncio
+import pytest
+from service.http_pool import ConnectionStats, HttpSessionPool
+
+
+class TestHttpSessionPool:
+    """Test suite for HttpSessionPool."""
+
+    @pytest.mark.asyncio
+    async def test_session_shared_within_loop(self):
+        """Test repeated lookups on one loop return the same session."""
+        pool = HttpSessionPool()
+        first = await pool.get_session()
+        second = await pool.get_session()
+        assert first is second
+        await pool.close()
+        assert first.closed
+
+    @pytest.mark.asyncio
+    async def test_closed_session_is_replaced(self):
+        """Test a session closed elsewhere is recreated on next use."""
+        pool = HttpSessionPool()
+        first = await pool.get_session()
+        await first.close()
+        second = await pool.get_session()
+        assert second is not first
+        assert not second.closed
+        await pool.close()
+
+    def test_sessions_are_per_loop(self):
+        """Test each event loop gets its own session."""
+        pool = HttpSessionPool()
+
+        async def use_pool():
+            session = await pool.get_session()
+            await pool.close()
+            return session
+
+        loop_a = asyncio.new_event_loop()
+        loop_b = asyncio.new_event_loop()
+        try:
+            session_a = loop_a.run_until_complete(use_pool())
+            session_b = loop_b.run_until_complete(use_pool())
+        finally:
+            loop_a.close()
+            loop_b.close()
+        assert session_a is not session_b
+
+    def test_jobs_close_their_own_sessions(self):
+        """Test two jobs on separate loops each close the session they used."""
+        pool = HttpSessionPool()
+
+        async def job():
+            session = await pool.get_session()
+            assert await pool.get_session() is session
+            await pool.close()
+            return session
+
+        sessions = []
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                sessions.append(loop.run_until_complete(job()))
+            finally:
+                loop.close()
+        assert sessions[0] is not sessions[1]
+        assert all(session.closed for session in sessions)
+        assert pool._sessions == {}
+
+    def test_session_left_open_by_finished_loop_is_dropped(self, caplog):
+        """Test a session whose loop closed without close() is dropped on the next lookup."""
+        pool = HttpSessionPool()
+        loop = asyncio.new_event_loop()
+        try:
+            leaked = loop.run_until_complete(pool.get_session())
+        finally:
+            loop.close()
+
+        async def next_job():
+            session = await pool.get_session()
+            await pool.close()
+            return session
+
+        loop = asyncio.new_event_loop()
+        try:
+            session = loop.run_until_complete(next_job())
+        finally:
+            loop.close()
+        assert session is not leaked
+        assert pool._sessions == {}
+        assert "left open by a finished job" in caplog.text
+
+
+class TestConnectionStats:
+    """Test suite for ConnectionStats."""
+
+    def test_reuse_ratio(self):
+        """Test the reuse ratio counts reused over all acquired connections."""
+        stats = ConnectionStats()
+        assert stats.snapshot()["reuse_ratio"] == 0.0
+        stats.connections_created = 1
+        stats.connections_reused = 3
+        assert stats.snapshot()["reuse_ratio"] == 0.75
@@ -0,0 +1,98 @@
+"""Tests for the interview instruction compiler."""
+import json
+from utils.instructions import (
+    build_instructions,
+    clean_interview_prompt,
+    compile_static_instructions,
+    condense_cv_analysis,
+    estimate_tokens,
+    is_arabic_language
+)
+
+
+CV_ANALYSIS = json.dumps({
+    "match_score": 82,
+    "skills_matched": ["Python", "AWS", "Docker"],
+    "skills_missing": [],
+    "experience_summary": "Five years of backend work",
+    "strengths": ["Ownership"],
+    "concerns": ["Short tenure"],
+    "recommendation": "consider",
+    "detailed_feedback": "A long paragraph the interviewer does not need",
+    "linkedin": "https://linkedin.com/in/example"
+})
+
+
+def build(**overrides):
+    """Build instructions with test defaults."""
+    params = dict(
+        job_id="job-1",
+        company_name="Test Company",
+        job_title="Software Engineer",
+        interview_prompt="Ask about APIs",
+        interview_language="English",
+        candidate_name="Test Candidate",
+        cv_analysis=CV_ANALYSIS,
+        greeting="Hello Test Candidate"
+    )
+    params.update(overrides)
+    return build_instructions(**params)
+
+
+class TestInstructions:
+    """Test suite for instruction compilation."""
+
+    def test_visual_lines_removed(self):
+        """Test visual-assessment lines are dropped and blank runs collapsed."""
+        prompt = "Ask about APIs\nCheck the camera angle\n\n\n\nAsk about testing"
+        assert clean_interview_prompt(prompt) == "Ask about APIs\n\nAsk about testing"
+
+    def test_cv_summary_keeps_interviewer_fields(self):
+        """Test only the needed CV fields survive, in a compact form."""
+        summary = condense_cv_analysis(CV_ANALYSIS)
+        assert "Match score: 82" in summary
+        assert "Skills matched: Python, AWS, Docker" in summary
+        assert "Skills missing" not in summary
+        assert "detailed" not in summary.lower()
+        assert "linkedin" not in summary
+
+    def test_cv_summary_plain_text_truncated(self):
+        """Test non-JSON analysis is whitespace-normalized and truncated."""
+        summary = condense_cv_analysis("Strong   technical\nbackground " + "x" * 5000)
+        assert summary.startswith("Strong technical background")
+        assert len(summary) == 1500
+        assert condense_cv_analysis(None) == ""
+
+    def test_static_sections_come_first(self):
+        """Test two candidates for the same job share the static prefix."""
+        first = build()
+        second = build(candidate_name="Other", greeting="Hello Other", cv_analysis=None)
+        static = compile_static_instructions(
+            "job-1", "Test Company", "Software Engineer", "Ask about APIs", False
+        )
+        assert first.startswith(static)
+        assert second.startswith(static)
+        assert first.index("CANDIDATE: Test Candidate") > len(static)
+
+    def test_static_sections_memoized_per_job_and_language(self):
+        """Test the static block is reused and keyed by language."""
+        compile_static_instructions.cache_clear()
+        build()
+        build(candidate_name="Other")
+        assert compile_static_instructions.cache_info().hits == 1
+
+        arabic = build(interview_language="Arabic")
+        assert "Arabic (العربية) only" in arabic
+        assert compile_static_instructions.cache_info().misses == 2
+
+    def test_arabic_detection(self):
+        """Test language names are matched case-insensitively."""
+        assert is_arabic_language("ARABIC")
+        assert is_arabic_language("عربي")
+        assert not is_arabic_language("English")
+        assert not is_arabic_language(None)
+
+    def test_estimate_tokens(self):
+        """Test the estimate weighs non-ASCII text more heavily."""
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("مرحبا") > estimate_tokens("hello")
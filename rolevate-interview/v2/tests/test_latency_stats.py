@@ -0,0 +1,53 @@
+"""Tests for latency statistics utilities."""
+from utils.latency_stats import LatencyWindow, percentile
+
+
+class TestPercentile:
+    """Test suite for percentile()."""
+
+    def test_empty_returns_none(self):
+        """Test no samples yields None."""
+        assert percentile([], 50) is None
+
+    def test_nearest_rank(self):
+        """Test nearest-rank selection on unsorted input."""
+        values = [5, 1, 4, 2, 3, 10, 9, 8, 7, 6]
+        assert percentile(values, 50) == 5
+        assert percentile(values, 90) == 9
+        assert percentile(values, 99) == 10
+        assert percentile(values, 0) == 1
+
+
+class TestLatencyWindow:
+    """Test suite for LatencyWindow."""
+
+    def test_summary_per_stage(self):
+        """Test summary reports count, percentiles and max per stage."""
+        window = LatencyWindow()
+        for value in range(1, 101):
+            window.record("llm_ttft", float(value))
+        window.record("tts_ttfb", 250.0)
+
+        summary = window.summary()
+        assert summary["llm_ttft"]["count"] == 100
+        assert summary["llm_ttft"]["p50"] == 50.0
+        assert summary["llm_ttft"]["p95"] == 95.0
+        assert summary["llm_ttft"]["max"] == 100.0
+        assert summary["tts_ttfb"]["p99"] == 250.0
+
+    def test_window_keeps_recent_samples(self):
+        """Test old samples fall out while the total count keeps growing."""
+        window = LatencyWindow(max_samples=3)
+        for value in (1000.0, 1.0, 2.0, 3.0):
+            window.record("eou_delay", value)
+
+        stats = window.summary()["eou_delay"]
+        assert stats["count"] == 4
+        assert stats["max"] == 3.0
+
+    def test_invalid_samples_ignored(self):
+        """Test negative and NaN values are not recorded."""
+        window = LatencyWindow()
+        window.record("stt_final", -1.0)
+        window.record("stt_final", float("nan"))
+        assert window.stages() == []
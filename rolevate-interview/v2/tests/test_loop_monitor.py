@@ -0,0 +1,36 @@
+"""Tests for the event loop lag monitor."""
+import asyncio
+import time
+import pytest
+from utils.loop_monitor import LoopLagMonitor
+
+
+class TestLoopLagMonitor:
+    """Test suite for LoopLagMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_detects_blocking_call(self):
+        """Test a blocking call on the loop shows up as lag."""
+        samples = []
+        monitor = LoopLagMonitor(on_sample=samples.append, interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.03)
+
+        time.sleep(0.1)  # block the loop
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+        assert samples
+        assert monitor.max_lag_ms >= 50
+
+    @pytest.mark.asyncio
+    async def test_idle_loop_has_low_lag(self):
+        """Test an idle loop reports little lag."""
+        samples = []
+        monitor = LoopLagMonitor(on_sample=samples.append, interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        assert samples
+        assert min(samples) < 50
@@ -106,3 +106,8 @@ class TestModels:
         assert input_data.type == "VIDEO"
         assert input_data.status == "SCHEDULED"
         assert isinstance(input_data.scheduled_at, datetime)
+    
+    def test_create_interview_input_omits_missing_interviewer(self):
+        """Test interviewerId is left out so the backend falls back to the candidate."""
+        input_data = CreateInterviewInput(applicationId="app-123")
+        assert "interviewerId" not in input_data.model_dump(by_alias=True, exclude_none=True)
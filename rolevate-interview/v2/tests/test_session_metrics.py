@@ -0,0 +1,41 @@
+"""Tests for the session latency collector."""
+from types import SimpleNamespace
+from service.session_metrics import SessionMetricsCollector
+
+
+def metrics_event(**fields):
+    """Build an object shaped like a LiveKit MetricsCollectedEvent."""
+    return SimpleNamespace(metrics=SimpleNamespace(**fields))
+
+
+class TestSessionMetricsCollector:
+    """Test suite for SessionMetricsCollector."""
+
+    def test_turn_latency_combines_stages(self):
+        """Test EOU, LLM TTFT and TTS TTFB of one speech id add up to a turn."""
+        collector = SessionMetricsCollector("room-1", report_interval=0)
+        collector._on_metrics_collected(metrics_event(
+            type="eou_metrics", speech_id="s1",
+            end_of_utterance_delay=0.5, transcription_delay=0.2
+        ))
+        collector._on_metrics_collected(metrics_event(type="llm_metrics", speech_id="s1", ttft=0.3))
+        assert "turn_latency" not in collector.session_latency.stages()
+
+        collector._on_metrics_collected(metrics_event(type="tts_metrics", speech_id="s1", ttfb=0.2))
+
+        summary = collector.session_latency.summary()
+        assert summary["stt_final"]["p50"] == 200.0
+        assert summary["turn_latency"]["p50"] == 1000.0
+        assert collector._open_turns == {}
+
+    def test_unknown_metrics_ignored(self):
+        """Test metric types without latency stages are skipped."""
+        collector = SessionMetricsCollector("room-1", report_interval=0)
+        collector._on_metrics_collected(metrics_event(type="vad_metrics", speech_id=None))
+        assert collector.session_latency.summary() == {}
+
+    def test_milestones_recorded(self):
+        """Test job milestones land in the session window."""
+        collector = SessionMetricsCollector("room-1", report_interval=0)
+        collector.record_milestone("dispatch_to_connect", 420.0)
+        assert collector.session_latency.summary()["dispatch_to_connect"]["max"] == 420.0
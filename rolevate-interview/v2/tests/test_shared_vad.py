@@ -0,0 +1,29 @@
+"""Tests for the shared VAD loader."""
+import service.shared_vad as shared_vad
+
+
+class TestSharedVad:
+    """Test suite for get_shared_vad()."""
+
+    def test_loaded_once_per_process(self, monkeypatch):
+        """Test repeated calls reuse one model and it is not marked inherited."""
+        loads = []
+        monkeypatch.setattr(shared_vad, "_vad", None)
+        monkeypatch.setattr(shared_vad, "_load", lambda: loads.append(1) or object())
+
+        first = shared_vad.get_shared_vad()
+        assert shared_vad.get_shared_vad() is first
+        assert len(loads) == 1
+        assert shared_vad.is_inherited() is False
+
+    def test_inherited_when_loaded_by_parent(self, monkeypatch):
+        """Test a model loaded under another pid counts as inherited."""
+        monkeypatch.setattr(shared_vad, "_vad", object())
+        monkeypatch.setattr(shared_vad, "_loaded_in_pid", -1)
+        assert shared_vad.is_inherited() is True
+
+    def test_memory_report(self):
+        """Test memory figures are reported in MB."""
+        report = shared_vad.memory_report()
+        assert report["rss_mb"] > 0
+        assert "uss_mb" in report
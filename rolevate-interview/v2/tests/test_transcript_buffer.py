@@ -0,0 +1,93 @@
+"""Tests for the transcript buffer."""
+import asyncio
+import pytest
+from service.transcript_buffer import TranscriptBuffer
+from service.write_queue import WriteQueue
+
+
+class RecordingFlush:
+    """Fake bulk mutation recording every batch it receives."""
+
+    def __init__(self, fail_times: int = 0):
+        self.batches = []
+        self.fail_times = fail_times
+
+    async def __call__(self, interview_id, transcripts):
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            return False
+        self.batches.append((interview_id, list(transcripts)))
+        return True
+
+
+class TestTranscriptBuffer:
+    """Test suite for TranscriptBuffer."""
+
+    def test_add_signals_when_batch_full(self):
+        """Test add() returns True once the batch size is reached."""
+        buffer = TranscriptBuffer("int-1", RecordingFlush(), max_batch_size=2)
+        assert buffer.add("Hello", "Agent", language="en") is False
+        assert buffer.add("Hi", "Candidate", language="en") is True
+        assert buffer.pending_count == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_single_bulk_batch(self):
+        """Test flush persists all pending entries in one call, in order."""
+        flush = RecordingFlush()
+        buffer = TranscriptBuffer("int-1", flush, max_batch_size=10)
+        for i in range(3):
+            buffer.add(f"line {i}", "Agent", language="en")
+
+        assert await buffer.flush() is True
+        assert len(flush.batches) == 1
+        interview_id, batch = flush.batches[0]
+        assert interview_id == "int-1"
+        assert [e["content"] for e in batch] == ["line 0", "line 1", "line 2"]
+        assert batch[0]["language"] == "en"
+        assert buffer.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_entries_in_order(self):
+        """Test a failed flush re-queues the batch ahead of newer entries."""
+        flush = RecordingFlush(fail_times=1)
+        buffer = TranscriptBuffer("int-1", flush)
+        buffer.add("first", "Agent")
+
+        assert await buffer.flush() is False
+        buffer.add("second", "Candidate")
+        assert await buffer.flush() is True
+        assert [e["content"] for e in flush.batches[0][1]] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_remaining_and_rejects_new(self):
+        """Test close() flushes leftovers and ignores later additions."""
+        flush = RecordingFlush()
+        buffer = TranscriptBuffer("int-1", flush, flush_interval=60)
+        buffer.start()
+        buffer.add("bye", "Agent")
+
+        assert await buffer.close() is True
+        assert flush.batches[0][1][0]["content"] == "bye"
+        assert buffer.add("late", "Agent") is False
+        assert buffer.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_keeps_batch(self):
+        """Test a flush cancelled mid-call puts its batch back ahead of newer entries."""
+        started = asyncio.Event()
+
+        async def hanging_flush(interview_id, transcripts):
+            started.set()
+            await asyncio.Event().wait()
+
+        buffer = TranscriptBuffer("int-1", hanging_flush, max_batch_size=10)
+        buffer.add("first", "Agent")
+        buffer.add("second", "Candidate")
+
+        queue = WriteQueue("test")
+        queue.submit(buffer.flush)
+        await started.wait()
+        buffer.add("third", "Agent")
+
+        assert await queue.drain(timeout=0.05) is False
+        assert [e["content"] for e in buffer._pending] == ["first", "second", "third"]
@@ -0,0 +1,37 @@
+"""Tests for worker load reporting."""
+from types import SimpleNamespace
+from service.worker_load import WorkerLoadMonitor, compute_load
+
+
+class TestComputeLoad:
+    """Test suite for compute_load()."""
+
+    def test_most_constrained_resource_wins(self):
+        """Test the highest utilisation is reported."""
+        assert compute_load(0.2, 0.5, 1, 10) == 0.5
+        assert compute_load(0.9, 0.5, 1, 10) == 0.9
+        assert compute_load(0.2, 0.3, 8, 10) == 0.8
+
+    def test_session_term_disabled_without_cap(self):
+        """Test max_sessions=0 ignores the session count."""
+        assert compute_load(0.1, 0.2, 50, 0) == 0.2
+
+    def test_clamped(self):
+        """Test load never exceeds 1."""
+        assert compute_load(0.1, 0.2, 30, 10) == 1.0
+
+
+class TestWorkerLoadMonitor:
+    """Test suite for WorkerLoadMonitor."""
+
+    def test_counts_active_jobs(self):
+        """Test the worker's active jobs feed the session term."""
+        monitor = WorkerLoadMonitor(max_sessions=2)
+        load = monitor(SimpleNamespace(active_jobs=["job-1", "job-2"]))
+        assert load == 1.0
+        assert monitor.last_reading["active_sessions"] == 2
+
+    def test_works_without_worker(self):
+        """Test the monitor can be called with no worker argument."""
+        monitor = WorkerLoadMonitor(max_sessions=0)
+        assert 0.0 <= monitor() <= 1.0
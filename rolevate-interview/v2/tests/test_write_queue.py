@@ -0,0 +1,80 @@
+"""Tests for the bounded write queue."""
+import asyncio
+import pytest
+from service.write_queue import WriteQueue
+
+
+class TestWriteQueue:
+    """Test suite for WriteQueue."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_in_submission_order(self):
+        """Test jobs are executed sequentially in the order submitted."""
+        queue = WriteQueue("test")
+        seen = []
+
+        def make_job(i):
+            async def job():
+                await asyncio.sleep(0)
+                seen.append(i)
+            return job
+
+        for i in range(5):
+            assert queue.submit(make_job(i)) is True
+
+        assert await queue.drain(timeout=1) is True
+        assert seen == [0, 1, 2, 3, 4]
+        assert queue.completed == 5
+        assert queue.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_submit_rejects_when_full(self):
+        """Test submissions beyond max_pending are rejected, not accumulated."""
+        queue = WriteQueue("test", max_pending=2)
+        release = asyncio.Event()
+
+        async def blocked():
+            await release.wait()
+
+        assert queue.submit(blocked) is True
+        await asyncio.sleep(0)  # consumer picks up the first job
+        assert queue.submit(blocked) is True
+        assert queue.submit(blocked) is True
+        assert queue.submit(blocked) is False
+        assert queue.rejected == 1
+        assert queue.pending == 3
+
+        release.set()
+        assert await queue.drain(timeout=1) is True
+        assert queue.completed == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_job_does_not_stop_consumer(self):
+        """Test an exception in one job is counted and later jobs still run."""
+        queue = WriteQueue("test")
+        seen = []
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        async def ok():
+            seen.append("ok")
+
+        queue.submit(failing)
+        queue.submit(ok)
+
+        assert await queue.drain(timeout=1) is True
+        assert queue.failed == 1
+        assert seen == ["ok"]
+
+    @pytest.mark.asyncio
+    async def test_drain_times_out_on_stuck_job(self):
+        """Test drain gives up after the timeout and stops the consumer."""
+        queue = WriteQueue("test")
+
+        async def stuck():
+            await asyncio.sleep(60)
+
+        queue.submit(stuck)
+        assert await queue.drain(timeout=0.05) is False
+        assert queue.pending == 0
@@ -0,0 +1,138 @@
+"""
+Context cache utility for warm application data.
+Stores application payloads as JSON files so every worker process on the host
+can read context written ahead of time (e.g. by the pre-interview webhook).
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Application IDs become file names, so anything outside this set is rejected
+SAFE_KEY_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,128}$')
+
+
+class ContextCache:
+    """File-backed cache of application payloads with a TTL."""
+
+    def __init__(self, directory: str, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding one JSON file per application
+            ttl_seconds: Age after which an entry is treated as missing
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, application_id: str) -> Optional[str]:
+        if not SAFE_KEY_PATTERN.match(application_id or ""):
+            return None
+        return os.path.join(self.directory, f"{application_id}.json")
+
+    def get(self, application_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached payload.
+
+        Returns:
+            The stored payload, or None if missing, expired or unreadable
+        """
+        path = self._path(application_id)
+        if path is None:
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Unreadable context cache entry: {e}",
+                extra={"application_id": application_id}
+            )
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.ttl_seconds:
+            self.delete(application_id)
+            return None
+        return entry.get("data")
+
+    def put(self, application_id: str, data: Dict[str, Any]) -> bool:
+        """
+        Store a payload atomically so readers never see a partial file.
+
+        Returns:
+            True if the entry was written
+        """
+        path = self._path(application_id)
+        if path is None:
+            logger.warning(
+                "Refusing to cache context for unsafe application id",
+                extra={"application_id": application_id}
+            )
+            return False
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"stored_at": time.time(), "data": data}, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(
+                f"Failed to write context cache entry: {e}",
+                extra={"application_id": application_id}
+            )
+            return False
+        return True
+
+    def delete(self, application_id: str) -> None:
+        """Remove a cached payload if present."""
+        path = self._path(application_id)
+        if path is None:
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(
+                f"Failed to delete context cache entry: {e}",
+                extra={"application_id": application_id}
+            )
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        if not os.path.isdir(self.directory):
+            return 0
+
+        removed = 0
+        cutoff = time.time() - self.ttl_seconds
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
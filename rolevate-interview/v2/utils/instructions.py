@@ -0,0 +1,172 @@
+"""
+Interview instruction compiler.
+Builds compact system instructions with the job-level (static) sections first,
+so they form a stable prefix for provider prompt caching and can be memoized
+per (job, language) across concurrent interviews.
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+# Lines mentioning these are dropped from the job prompt (audio-only interview)
+VISUAL_KEYWORDS = (
+    "الكاميرا", "إضاءة", "الخلفية", "المظهر", "الملابس",
+    "camera", "lighting", "background", "appearance", "posture",
+    "eye contact", "facial expressions", "body language",
+    "visual", "observe", "see", "watch", "look"
+)
+_VISUAL_PATTERN = re.compile("|".join(re.escape(k) for k in VISUAL_KEYWORDS))
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+# CV analysis fields the interviewer actually uses, in display order
+CV_SUMMARY_FIELDS = (
+    ("match_score", "Match score"),
+    ("recommendation", "Recommendation"),
+    ("experience_summary", "Experience"),
+    ("skills_matched", "Skills matched"),
+    ("skills_missing", "Skills missing"),
+    ("strengths", "Strengths"),
+    ("concerns", "Concerns"),
+)
+CV_LIST_LIMIT = 8
+CV_TEXT_LIMIT = 1500
+
+
+def is_arabic_language(language: Optional[str]) -> bool:
+    """Whether the job's interview language is Arabic."""
+    return any(word in (language or "").lower() for word in ["arabic", "عربي", "ar"])
+
+
+def clean_interview_prompt(prompt: Optional[str]) -> str:
+    """Drop visual-assessment lines and collapse runs of blank lines."""
+    lines = [
+        line.rstrip() for line in (prompt or "").split("\n")
+        if not _VISUAL_PATTERN.search(line.lower())
+    ]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, list):
+        items = [str(v) for v in value[:CV_LIST_LIMIT] if v not in (None, "")]
+        return ", ".join(items)
+    return str(value).strip()
+
+
+def condense_cv_analysis(cv_analysis: Optional[str]) -> str:
+    """
+    Reduce CV analysis results to the fields the interviewer needs.
+
+    Args:
+        cv_analysis: JSON string produced by the CV analysis pipeline, or free text
+
+    Returns:
+        One "Label: value" line per populated field, or the truncated text
+    """
+    if not cv_analysis:
+        return ""
+
+    try:
+        parsed = json.loads(cv_analysis)
+    except ValueError:
+        parsed = None
+
+    if not isinstance(parsed, dict):
+        text = " ".join(cv_analysis.split())
+        return text[:CV_TEXT_LIMIT]
+
+    lines: List[str] = []
+    for key, label in CV_SUMMARY_FIELDS:
+        value = parsed.get(key)
+        if value in (None, "", []):
+            continue
+        formatted = _format_value(value)
+        if formatted:
+            lines.append(f"{label}: {formatted}")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def compile_static_instructions(
+    job_id: str,
+    company_name: str,
+    job_title: str,
+    interview_prompt: str,
+    arabic: bool
+) -> str:
+    """
+    Job-level instructions shared by every candidate for the same job and language.
+
+    The job id is part of the memoization key so edits to one job never leak into another.
+    """
+    language_display = "Arabic (العربية)" if arabic else "English"
+    prompt = clean_interview_prompt(interview_prompt)
+
+    return f"""You are Laila Al Noor, an AI interviewer for {company_name}.
+POSITION: {job_title}
+COMPANY: {company_name}
+
+{prompt}
+
+AUDIO-ONLY interview: you cannot see the candidate. Judge only voice, tone and content; never mention or ask about visual elements.
+
+LANGUAGE: Conduct the ENTIRE interview in {language_display} only - every question, follow-up and reply. If the candidate uses another language, politely ask them to continue in {language_display}.
+
+CONVERSATION FLOW:
+- Lead the conversation; do not wait for the candidate to speak first
+- Let the candidate finish; fillers like "okay", "sure", "yes", "تمام", "حسناً" are acknowledgments, not answers
+- Move on only after a substantive answer or when they say they are done; ask follow-ups on short answers
+- Use get_application_info() for company/job details"""
+
+
+def build_instructions(
+    job_id: str,
+    company_name: str,
+    job_title: str,
+    interview_prompt: str,
+    interview_language: str,
+    candidate_name: str,
+    cv_analysis: Optional[str],
+    greeting: str
+) -> str:
+    """
+    Assemble full instructions: memoized static prefix, then per-candidate context.
+
+    Returns:
+        Instruction string for the agent
+    """
+    arabic = is_arabic_language(interview_language)
+    static = compile_static_instructions(
+        job_id, company_name, job_title, interview_prompt or "", arabic
+    )
+    cv_summary = condense_cv_analysis(cv_analysis) or "Not available"
+    language_display = "Arabic (العربية)" if arabic else "English"
+
+    return f"""{static}
+
+CANDIDATE: {candidate_name}
+CV SUMMARY:
+{cv_summary}
+
+START: You open with "{greeting}", then ask your first interview question.
+Remember: {language_display} only."""
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate token count without a tokenizer dependency.
+
+    Latin text averages about 4 characters per token; Arabic and other
+    non-ASCII scripts tokenize far more densely, so they count double.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    return round(ascii_chars / 4 + other_chars / 2)
+
+
+def instruction_cache_info() -> Dict[str, int]:
+    """Hit/miss counters for the static instruction memo."""
+    info = compile_static_instructions.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
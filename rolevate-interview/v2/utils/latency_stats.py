@@ -0,0 +1,74 @@
+"""
+Latency statistics utilities.
+Bounded per-stage sample windows with percentile summaries, kept free of
+LiveKit imports so they can be used and tested anywhere.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values: Iterable[float], pct: float) -> Optional[float]:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Samples in any order
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or None if there are no samples
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LatencyWindow:
+    """Most recent latency samples per stage, in milliseconds."""
+
+    def __init__(self, max_samples: int = 500):
+        """
+        Initialize the window.
+
+        Args:
+            max_samples: Samples kept per stage; older samples are dropped
+        """
+        self.max_samples = max_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def record(self, stage: str, value_ms: float) -> None:
+        """Record one sample; negative or NaN values are ignored."""
+        if value_ms is None or math.isnan(value_ms) or value_ms < 0:
+            return
+        if stage not in self._samples:
+            self._samples[stage] = deque(maxlen=self.max_samples)
+            self._counts[stage] = 0
+        self._samples[stage].append(value_ms)
+        self._counts[stage] += 1
+
+    def stages(self) -> List[str]:
+        """Stages with at least one sample."""
+        return list(self._samples)
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES) -> Dict[str, Dict[str, float]]:
+        """
+        Percentiles per stage over the current window.
+
+        Returns:
+            {stage: {"count": total samples, "p50": ..., "max": ...}}
+        """
+        result: Dict[str, Dict[str, float]] = {}
+        for stage, samples in self._samples.items():
+            stats: Dict[str, float] = {"count": self._counts[stage]}
+            for pct in percentiles:
+                stats[f"p{pct}"] = round(percentile(samples, pct), 1)
+            stats["max"] = round(max(samples), 1)
+            result[stage] = stats
+        return result
@@ -0,0 +1,61 @@
+"""
+Event loop lag monitor.
+Measures how late a periodic timer fires; any lag is time the loop was blocked
+and could not serve real-time audio for the sessions sharing it.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Periodic timer reporting scheduling lag in milliseconds."""
+
+    def __init__(
+        self,
+        on_sample: Callable[[float], None],
+        interval: float = 0.1,
+        warn_threshold_ms: float = 100.0
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            on_sample: Called with each lag sample in milliseconds
+            interval: Seconds between timer ticks
+            warn_threshold_ms: Lag above which a warning is logged
+        """
+        self.on_sample = on_sample
+        self.interval = interval
+        self.warn_threshold_ms = warn_threshold_ms
+        self.max_lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - expected) * 1000)
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            self.on_sample(lag_ms)
+            if lag_ms > self.warn_threshold_ms:
+                logger.warning("Event loop blocked", extra={"lag_ms": round(lag_ms)})
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -1,155 +1,84 @@
+"""
+Side-by-side STT comparison server.
+
+The page streams 16 kHz PCM16 chunks to /ws/{provider}; each socket feeds a
+provider's streaming API through a queue and sends back transcript events as
+{"transcript", "is_final", "latency_ms"}, where latency_ms is the time since
+the most recent audio chunk arrived.
+
+    uvicorn app:app --port 8001
+"""
+
+import asyncio
+
+from dotenv import load_dotenv
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import FileResponse
-import os
-from google.cloud import speech
-from openai import OpenAI
-from dotenv import load_dotenv
-import asyncio
-import wave
-import tempfile
+
+from stt_providers import PROVIDERS, get_provider
 
 load_dotenv()
 
 app = FastAPI()
 
+# The page still calls the OpenAI column "whisper"
+ALIASES = {"whisper": "openai"}
+
+
 @app.get("/")
 async def get_index():
     return FileResponse("index.html")
 
-@app.websocket("/ws/google")
-async def websocket_google(websocket: WebSocket):
-    """Google Speech-to-Text streaming recognition"""
+
+@app.websocket("/ws/{provider}")
+async def websocket_stt(websocket: WebSocket, provider: str, language: str = "ar"):
+    """Stream microphone audio through one provider"""
+    name = ALIASES.get(provider, provider)
     await websocket.accept()
-    
-    try:
-        client = speech.SpeechClient()
-        
-        streaming_config = speech.StreamingRecognitionConfig(
-            config=speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                sample_rate_hertz=16000,
-                language_code="ar-SA",
-            ),
-            interim_results=True,
-        )
-        
-        def request_generator():
-            """Generator that yields audio requests from buffer"""
-            while True:
-                try:
-                    # This needs to be synchronous for Google's API
-                    # We'll use a different approach
-                    yield None
-                except:
-                    break
-        
-        # Use a simpler batch approach
-        audio_buffer = bytearray()
-        batch_size = 16000 * 2 * 2  # 2 seconds of audio
-        
-        while True:
-            try:
-                chunk = await asyncio.wait_for(websocket.receive_bytes(), timeout=0.5)
-                audio_buffer.extend(chunk)
-                
-                # Process when we have enough audio
-                if len(audio_buffer) >= batch_size:
-                    try:
-                        # Create a single request with the audio
-                        audio_content = bytes(audio_buffer[:batch_size])
-                        
-                        # Use the non-streaming API for simplicity and reliability
-                        audio = speech.RecognitionAudio(content=audio_content)
-                        config = speech.RecognitionConfig(
-                            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                            sample_rate_hertz=16000,
-                            language_code="ar-SA",
-                        )
-                        
-                        response = client.recognize(config=config, audio=audio)
-                        
-                        for result in response.results:
-                            if result.alternatives:
-                                await websocket.send_json({
-                                    "transcript": result.alternatives[0].transcript,
-                                    "is_final": True
-                                })
-                        
-                        # Keep remaining buffer
-                        audio_buffer = audio_buffer[batch_size:]
-                        
-                    except Exception as e:
-                        print(f"Google transcription error: {e}")
-                        await websocket.send_json({"error": str(e)})
-                        
-            except asyncio.TimeoutError:
-                continue
-            except WebSocketDisconnect:
-                break
-        
-    except Exception as e:
-        await websocket.send_json({"error": f"خطأ في Google: {str(e)}"})
-    finally:
+    if name not in PROVIDERS:
+        await websocket.send_json({"error": f"Unknown provider: {provider}"})
+        await websocket.close()
+        return
+
+    queue: asyncio.Queue = asyncio.Queue()
+    last_chunk_at = asyncio.get_running_loop().time()
+
+    async def receive_audio():
+        nonlocal last_chunk_at
         try:
-            await websocket.close()
-        except:
+            while True:
+                chunk = await websocket.receive_bytes()
+                last_chunk_at = asyncio.get_running_loop().time()
+                queue.put_nowait(chunk)
+        except WebSocketDisconnect:
             pass
+        finally:
+            queue.put_nowait(None)
 
-@app.websocket("/ws/whisper")
-async def websocket_whisper(websocket: WebSocket):
-    """OpenAI Whisper streaming recognition"""
-    await websocket.accept()
-    
+    async def audio_chunks():
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+
+    receiver = asyncio.create_task(receive_audio())
     try:
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        audio_buffer = bytearray()
-        chunk_size = 16000 * 2 * 5  # 5 seconds
-        
-        while True:
-            try:
-                chunk = await asyncio.wait_for(websocket.receive_bytes(), timeout=0.5)
-                audio_buffer.extend(chunk)
-                
-                if len(audio_buffer) >= chunk_size:
-                    try:
-                        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                            temp_path = temp_file.name
-                            
-                            with wave.open(temp_path, 'wb') as wav_file:
-                                wav_file.setnchannels(1)
-                                wav_file.setsampwidth(2)
-                                wav_file.setframerate(16000)
-                                wav_file.writeframes(bytes(audio_buffer[:chunk_size]))
-                        
-                        with open(temp_path, 'rb') as audio_file:
-                            transcript = client.audio.transcriptions.create(
-                                file=audio_file,
-                                model="whisper-1",
-                                language="ar"
-                            )
-                        
-                        if transcript.text.strip():
-                            await websocket.send_json({
-                                "transcript": transcript.text,
-                                "is_final": False
-                            })
-                        
-                        os.unlink(temp_path)
-                        audio_buffer = audio_buffer[chunk_size:]
-                        
-                    except Exception as e:
-                        print(f"Whisper error: {e}")
-                        audio_buffer = bytearray()
-                        
-            except asyncio.TimeoutError:
-                continue
-            except WebSocketDisconnect:
-                break
-                
+        async for event in get_provider(name).stream(audio_chunks(), language):
+            latency_ms = (asyncio.get_running_loop().time() - last_chunk_at) * 1000
+            await websocket.send_json({
+                "transcript": event.text,
+                "is_final": event.is_final,
+                "latency_ms": round(latency_ms),
+            })
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
-        await websocket.send_json({"error": f"خطأ في Whisper: {str(e)}"})
+        print(f"{name} transcription error: {e}")
+        try:
+            await websocket.send_json({"error": f"خطأ في {provider}: {e}"})
+        except Exception:
+            pass
     finally:
+        receiver.cancel()
         try:
             await websocket.close()
-        except:
+        except Exception:
             pass
@@ -0,0 +1,204 @@
+"""
+Streaming STT benchmark.
+
+Streams each corpus utterance from memory through every selected provider at
+real-time pace (or faster with --pace) and reports, per provider and language:
+time to first partial, final latency after the audio ends, real-time factor
+and word error rate.
+
+The corpus is fixtures/manifest.json: 16 kHz mono 16-bit WAVs next to it,
+with their reference transcripts. ar_greeting.wav and en_greeting.wav are
+synthesized with espeak-ng, so every provider has one Arabic and one English
+clip to run on; robotic TTS is easier than a candidate on a laptop mic, so
+add real recordings under the other manifest names for representative WER.
+Utterances without a WAV are only run on the mock provider, using silence of
+a plausible length, so
+
+    python stt_benchmark.py
+
+works offline. With credentials and recordings:
+
+    python stt_benchmark.py --providers google openai mock --pace 1
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, List, Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+from stt_metrics import edit_distance, normalize, percentile
+from stt_providers import BYTES_PER_SECOND, SAMPLE_RATE, get_provider, resample, PROVIDERS
+
+load_dotenv()
+
+CHUNK_MS = 100
+SECONDS_PER_WORD = 0.45  # synthetic audio length for the mock
+
+
+@dataclass
+class Utterance:
+    id: str
+    language: str
+    text: str
+    audio: bytes
+    synthetic: bool
+
+    @property
+    def duration(self) -> float:
+        return len(self.audio) / BYTES_PER_SECOND
+
+
+@dataclass
+class Result:
+    provider: str
+    utterance: Utterance
+    transcript: str = ""
+    first_partial_ms: Optional[float] = None
+    final_latency_ms: Optional[float] = None
+    rtf: Optional[float] = None
+    errors: int = 0
+    ref_words: int = 0
+    error: Optional[str] = None
+    events: List[str] = field(default_factory=list)
+
+
+def load_wav(path: Path) -> bytes:
+    """Read a WAV into 16 kHz mono PCM16 bytes."""
+    with wave.open(str(path), "rb") as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path.name}: expected 16-bit PCM")
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+        if wav.getnchannels() > 1:
+            samples = samples.reshape(-1, wav.getnchannels()).mean(axis=1).astype(np.int16)
+        return resample(samples.tobytes(), wav.getframerate(), SAMPLE_RATE)
+
+
+def load_corpus(manifest: Path) -> List[Utterance]:
+    utterances = []
+    for entry in json.loads(manifest.read_text(encoding="utf-8")):
+        path = manifest.parent / entry["audio"]
+        if path.exists():
+            audio, synthetic = load_wav(path), False
+        else:
+            seconds = len(entry["text"].split()) * SECONDS_PER_WORD
+            audio, synthetic = bytes(int(seconds * SAMPLE_RATE) * 2), True
+        utterances.append(Utterance(entry["id"], entry["language"], entry["text"], audio, synthetic))
+    return utterances
+
+
+async def paced_chunks(audio: bytes, pace: float, marks: dict) -> AsyncIterator[bytes]:
+    """Yield CHUNK_MS chunks on the audio clock; pace 0 sends as fast as possible."""
+    size = BYTES_PER_SECOND * CHUNK_MS // 1000
+    started = time.perf_counter()
+    marks["start"] = started
+    for index, offset in enumerate(range(0, len(audio), size)):
+        if pace:
+            delay = started + index * CHUNK_MS / 1000 / pace - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        yield audio[offset:offset + size]
+    marks["end"] = time.perf_counter()
+
+
+async def run_utterance(provider_name: str, utterance: Utterance, pace: float, timeout: float) -> Result:
+    provider = get_provider(provider_name)
+    result = Result(provider_name, utterance)
+    marks = {}
+    finals = []
+    last_final_at = None
+
+    async def consume():
+        nonlocal last_final_at
+        stream = provider.stream(paced_chunks(utterance.audio, pace, marks), utterance.language, utterance.text)
+        async for event in stream:
+            if not event.is_final and result.first_partial_ms is None:
+                result.first_partial_ms = (event.at - marks["start"]) * 1000
+            if event.is_final and event.text.strip():
+                finals.append(event.text.strip())
+                last_final_at = event.at
+
+    try:
+        await asyncio.wait_for(consume(), timeout=timeout)
+    except asyncio.TimeoutError:
+        result.error = f"timed out after {timeout:.0f}s"
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+    result.transcript = " ".join(finals)
+    reference = normalize(utterance.text)
+    result.ref_words = len(reference)
+    result.errors = edit_distance(reference, normalize(result.transcript))
+    if last_final_at is not None and "end" in marks:
+        result.final_latency_ms = max(0.0, last_final_at - marks["end"]) * 1000
+        result.rtf = (last_final_at - marks["start"]) / utterance.duration
+    return result
+
+
+def fmt(value: Optional[float], spec: str = ".0f") -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def report(results: List[Result]) -> None:
+    print(f"\n{'provider':<8} {'lang':<4} {'n':>3} {'1st partial p50':>16} {'final p50':>10} "
+          f"{'final p95':>10} {'RTF':>6} {'WER':>6}")
+    groups = {}
+    for r in results:
+        groups.setdefault((r.provider, r.utterance.language), []).append(r)
+    for (provider, language), group in sorted(groups.items()):
+        ok = [r for r in group if r.error is None]
+        partials = [r.first_partial_ms for r in ok if r.first_partial_ms is not None]
+        finals = [r.final_latency_ms for r in ok if r.final_latency_ms is not None]
+        rtfs = [r.rtf for r in ok if r.rtf is not None]
+        ref_words = sum(r.ref_words for r in ok)
+        wer = sum(r.errors for r in ok) / ref_words if ref_words else None
+        print(
+            f"{provider:<8} {language:<4} {len(ok):>3} {fmt(percentile(partials, 50)):>13} ms "
+            f"{fmt(percentile(finals, 50)):>7} ms {fmt(percentile(finals, 95)):>7} ms "
+            f"{fmt(sum(rtfs) / len(rtfs) if rtfs else None, '.2f'):>6} {fmt(wer, '.1%'):>6}"
+        )
+    failures = [r for r in results if r.error]
+    if failures:
+        print("\nFailures:")
+        for r in failures:
+            print(f"  • {r.provider}/{r.utterance.id}: {r.error}")
+
+
+async def main_async(args) -> int:
+    corpus = load_corpus(args.manifest)
+    results = []
+    for provider in args.providers:
+        runnable = [u for u in corpus if provider == "mock" or not u.synthetic]
+        if not runnable:
+            print(f"Skipping {provider}: no recorded audio in {args.manifest.parent}")
+            continue
+        print(f"🎙️  {provider}: {len(runnable)} utterances")
+        for utterance in runnable:
+            result = await run_utterance(provider, utterance, args.pace, args.timeout)
+            results.append(result)
+            if args.verbose:
+                print(f"   {utterance.id}: {result.transcript or result.error}")
+    report(results)
+    return 0 if results and not any(r.error for r in results) else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--providers", nargs="+", default=["mock"], choices=sorted(PROVIDERS))
+    parser.add_argument("--manifest", type=Path, default=Path(__file__).parent / "fixtures" / "manifest.json")
+    parser.add_argument("--pace", type=float, default=1.0, help="1 = real time, 0 = as fast as possible")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-utterance timeout in seconds")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print each transcript")
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
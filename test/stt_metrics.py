@@ -0,0 +1,42 @@
+"""
+Transcript scoring and latency summaries for the STT benchmark.
+"""
+
+import re
+import unicodedata
+from typing import List, Optional, Sequence
+
+ARABIC_DIACRITICS = re.compile(r"[ً-ٰٟـ]")  # harakat, dagger alef, tatweel
+ARABIC_LETTER_FORMS = str.maketrans({"أ": "ا", "إ": "ا", "آ": "ا", "ى": "ي", "ة": "ه", "ؤ": "و", "ئ": "ي"})
+PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize(text: str) -> List[str]:
+    """Lowercase, strip punctuation and Arabic diacritics, unify letter variants."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = ARABIC_DIACRITICS.sub("", text).translate(ARABIC_LETTER_FORMS)
+    return PUNCTUATION.sub(" ", text).split()
+
+
+def edit_distance(reference: Sequence[str], hypothesis: Sequence[str]) -> int:
+    """Word-level Levenshtein distance."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current.append(min(
+                previous[j] + 1,  # deletion
+                current[j - 1] + 1,  # insertion
+                previous[j - 1] + (ref_word != hyp_word),  # substitution
+            ))
+        previous = current
+    return previous[-1]
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile, None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
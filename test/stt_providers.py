@@ -0,0 +1,216 @@
+"""
+Streaming STT providers.
+
+Each provider takes an async iterator of 16 kHz mono PCM16 chunks and yields
+transcript events as they arrive, using the provider's streaming API so the
+event loop is never blocked and no audio touches the disk.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+import aiohttp
+import numpy as np
+
+SAMPLE_RATE = 16000
+BYTES_PER_SECOND = SAMPLE_RATE * 2
+
+
+@dataclass
+class TranscriptEvent:
+    text: str
+    is_final: bool
+    at: float  # time.perf_counter() when the event arrived
+
+
+class STTProvider(ABC):
+    name = "base"
+
+    @abstractmethod
+    async def stream(
+        self,
+        audio: AsyncIterator[bytes],
+        language: str,
+        reference: Optional[str] = None,
+    ) -> AsyncIterator[TranscriptEvent]:
+        """
+        Transcribe streamed audio.
+
+        language is "ar" or "en". reference is the expected transcript; only the
+        mock provider uses it.
+        """
+        raise NotImplementedError
+        yield
+
+
+class GoogleProvider(STTProvider):
+    """Google Speech-to-Text bidirectional streaming (async gRPC client)."""
+
+    name = "google"
+    LANGUAGE_CODES = {"ar": "ar-SA", "en": "en-US"}
+
+    async def stream(self, audio, language, reference=None):
+        from google.cloud import speech
+
+        client = speech.SpeechAsyncClient()
+        config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=SAMPLE_RATE,
+                language_code=self.LANGUAGE_CODES.get(language, language),
+            ),
+            interim_results=True,
+        )
+
+        async def requests():
+            yield speech.StreamingRecognizeRequest(streaming_config=config)
+            async for chunk in audio:
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+        responses = await client.streaming_recognize(requests=requests())
+        async for response in responses:
+            for result in response.results:
+                if result.alternatives:
+                    yield TranscriptEvent(
+                        result.alternatives[0].transcript, result.is_final, time.perf_counter()
+                    )
+
+
+def resample(chunk: bytes, from_rate: int, to_rate: int) -> bytes:
+    """Linear-interpolation resample of a PCM16 chunk."""
+    samples = np.frombuffer(chunk, dtype=np.int16)
+    if from_rate == to_rate or not len(samples):
+        return chunk
+    count = int(round(len(samples) * to_rate / from_rate))
+    positions = np.linspace(0, len(samples) - 1, count)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.int16).tobytes()
+
+
+class OpenAIRealtimeProvider(STTProvider):
+    """
+    OpenAI realtime transcription over a websocket.
+
+    Audio is appended as it arrives and the server VAD commits utterances;
+    transcription deltas are partials and each completed item is a final.
+    """
+
+    name = "openai"
+    URL = "wss://api.openai.com/v1/realtime?intent=transcription"
+    INPUT_RATE = 24000  # pcm16 input must be 24 kHz
+
+    def __init__(self, model: str = "gpt-4o-transcribe"):
+        self.model = model
+
+    async def stream(self, audio, language, reference=None):
+        headers = {
+            "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
+            "OpenAI-Beta": "realtime=v1",
+        }
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(self.URL, headers=headers) as ws:
+                await ws.send_json({
+                    "type": "transcription_session.update",
+                    "session": {
+                        "input_audio_format": "pcm16",
+                        "input_audio_transcription": {"model": self.model, "language": language},
+                        "turn_detection": {"type": "server_vad", "silence_duration_ms": 500},
+                    },
+                })
+
+                async def send_audio():
+                    async for chunk in audio:
+                        await ws.send_json({
+                            "type": "input_audio_buffer.append",
+                            "audio": base64.b64encode(resample(chunk, SAMPLE_RATE, self.INPUT_RATE)).decode(),
+                        })
+                    # Flush whatever the VAD has not committed yet
+                    await ws.send_json({"type": "input_audio_buffer.commit"})
+
+                sender = asyncio.create_task(send_audio())
+                partials = {}
+                committed = completed = 0
+                flushed = False  # the closing commit was acknowledged
+                try:
+                    async for message in ws:
+                        if message.type != aiohttp.WSMsgType.TEXT:
+                            break
+                        event = json.loads(message.data)
+                        kind = event["type"]
+                        if kind == "input_audio_buffer.committed":
+                            committed += 1
+                            flushed = sender.done()
+                        elif kind == "conversation.item.input_audio_transcription.delta":
+                            text = partials.get(event["item_id"], "") + event["delta"]
+                            partials[event["item_id"]] = text
+                            yield TranscriptEvent(text, False, time.perf_counter())
+                        elif kind == "conversation.item.input_audio_transcription.completed":
+                            partials.pop(event["item_id"], None)
+                            completed += 1
+                            yield TranscriptEvent(event["transcript"], True, time.perf_counter())
+                        elif kind == "error":
+                            # The final commit fails harmlessly if the VAD already took everything
+                            if event["error"].get("code") != "input_audio_buffer_commit_empty":
+                                raise RuntimeError(event["error"].get("message"))
+                            flushed = True
+                        if flushed and completed >= committed and not partials:
+                            sender.result()
+                            break
+                finally:
+                    sender.cancel()
+
+
+class MockProvider(STTProvider):
+    """
+    Offline provider for running the harness without credentials.
+
+    Emits a growing partial every half second of audio and the reference
+    transcript as the final once the audio ends, after a fixed latency.
+    error_rate drops that fraction of words, so the WER column is exercised
+    rather than always reading 0%.
+    """
+
+    name = "mock"
+    WORDS_PER_SECOND = 2.5
+
+    def __init__(self, latency: float = 0.15, error_rate: float = 0.1):
+        self.latency = latency
+        self.error_rate = error_rate
+
+    async def stream(self, audio, language, reference=None):
+        words = (reference or "").split()
+        if self.error_rate and words:
+            step = max(2, round(1 / self.error_rate))
+            words = [w for i, w in enumerate(words, 1) if i % step]
+
+        received = 0
+        next_partial = BYTES_PER_SECOND // 2
+        async for chunk in audio:
+            received += len(chunk)
+            if received >= next_partial:
+                next_partial += BYTES_PER_SECOND // 2
+                await asyncio.sleep(self.latency)
+                seconds = received / BYTES_PER_SECOND
+                # Roughly conversational pace
+                text = " ".join(words[: max(1, int(seconds * self.WORDS_PER_SECOND))]) if words else f"{seconds:.1f}s"
+                yield TranscriptEvent(text, False, time.perf_counter())
+
+        await asyncio.sleep(self.latency)
+        final = " ".join(words) if reference is not None else f"{received / BYTES_PER_SECOND:.1f}s"
+        yield TranscriptEvent(final, True, time.perf_counter())
+
+
+PROVIDERS = {
+    "google": GoogleProvider,
+    "openai": OpenAIRealtimeProvider,
+    "mock": MockProvider,
+}
+
+
+def get_provider(name: str) -> STTProvider:
+    return PROVIDERS[name]()